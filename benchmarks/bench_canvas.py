@@ -0,0 +1,96 @@
+"""
+# Canvas Benchmarks
+
+`benchmarks/bench_canvas.py`
+
+Measures the latency of building and serializing a typical Canvas Kit response,
+and of parsing a typical Canvas Kit request.
+
+Usage:
+    python -m benchmarks.bench_canvas [--number N]
+"""
+# Built-ins
+import argparse
+import json
+import timeit
+
+# Intercom Python SDK
+from intercom_python_sdk.canvas import (
+    CanvasBuilder,
+    CanvasResponseParser,
+    DropdownParameters,
+    InputParameters,
+    OptionParameters,
+    Placeholder,
+    SpacerParameters,
+    TextParameters
+)
+
+
+def make_builder(title="Report an issue", conversation_id="123456789") -> CanvasBuilder:
+    """ A canvas of a typical size: a form with a dozen components and some stored data. """
+    builder = CanvasBuilder()
+    builder.add_header(title)
+    builder.add_text(TextParameters(text="Tell us what went wrong and we'll get back to you."))
+    builder.add_space(SpacerParameters())
+    for index in range(4):
+        builder.add_text_input(InputParameters(id=f"field_{index}", label=f"Field {index}", placeholder="..."))
+    builder.add_dropdown(DropdownParameters(
+        id="severity",
+        options=[OptionParameters(id=level, text=level.title()) for level in ("low", "medium", "high")]
+    ))
+    builder.add_space(SpacerParameters())
+    builder.add_submit_button()
+    builder.set_stored_data("conversation_id", conversation_id)
+    builder.set_stored_data("step", 2)
+    return builder
+
+
+def make_request_body() -> bytes:
+    """ A Canvas Kit submit request, whose current canvas is the typical canvas above. """
+    return json.dumps({
+        "workspace_id": "abc123",
+        "component_id": "submit",
+        "input_values": {f"field_{index}": "some value" for index in range(4)},
+        "current_canvas": make_builder().build()["canvas"],
+        "context": {"conversation_id": 123456789, "location": "conversation", "locale": "en"},
+        "conversation": {"id": "123456789", "source": {"body": "<p>Hello</p>" * 50}},
+        "contact": {"id": "abc", "custom_attributes": {f"attribute_{index}": index for index in range(50)}},
+    }).encode()
+
+
+BENCHMARKS = {
+    "add components + build + json.dumps": lambda: json.dumps(make_builder().build()),
+    "build + json.dumps (reused builder)": lambda builder=make_builder(): json.dumps(builder.build()),
+    "build_json (reused builder)": lambda builder=make_builder(): builder.build_json(),
+    "template render_bytes (2 placeholders)": lambda template=make_builder(
+        Placeholder("title"), Placeholder("conversation_id")
+    ).freeze(): template.render_bytes(title="Report an issue", conversation_id="123456789"),
+    "CanvasResponseParser.parse_bytes": lambda body=make_request_body(): CanvasResponseParser.parse_bytes(body),
+}
+
+
+def run(number: int = 10000) -> dict:
+    """
+    Run each benchmark `number` times.
+
+    :param number: The number of iterations per benchmark.
+    :return: The mean latency of each benchmark, in microseconds.
+    """
+    return {
+        name: min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+        for name, func in BENCHMARKS.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=10000, help="Iterations per benchmark.")
+    args = parser.parse_args()
+
+    for name, micros in run(args.number).items():
+        print(f"{name:<40} {micros:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+# SDK Benchmarks
+
+`benchmarks/bench_sdk.py`
+
+Measures the hot paths of the SDK: importing the package, constructing the client, dispatching
+calls through the API proxies, loading lists of models with their schemas, injecting the API client
+into loaded models, building canvases, paginating over HTTP and downloading data exports.
+
+HTTP benchmarks are run against the local Intercom stand-in (`tests/stand_in.py`), served over
+localhost, so the figures include the `requests` stack but no network. The stand-in is imported from
+the test package of the source tree, which is not installed with the SDK: run the benchmarks from the
+root of the repository, as below, so that both `benchmarks` and `tests` are importable.
+
+Fixtures, such as the stand-ins of 10k objects and the localhost server, are only built for the
+benchmarks selected with `--filter`.
+
+Results can be saved as a JSON baseline, and later runs compared against it; the comparison exits
+with status 1 if any benchmark got slower by more than the tolerance, so it can gate CI.
+
+Usage (from the root of the repository):
+    python -m benchmarks.bench_sdk [--quick] [--filter SUBSTRING] [--save baseline.json]
+    python -m benchmarks.bench_sdk --compare baseline.json [--tolerance 0.25]
+"""
+# Built-ins
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import timeit
+from contextlib import ExitStack
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# External
+from uplink.auth import BearerToken
+
+# Intercom Python SDK
+from intercom_python_sdk import Intercom
+from intercom_python_sdk.apis.articles.schemas import ArticleListSchema
+from intercom_python_sdk.apis.conversation.schemas import ConversationListSchema
+from intercom_python_sdk.apis.data_events.schemas import DataEventListSchema
+from intercom_python_sdk.core.configuration import Configuration
+from intercom_python_sdk.core.model_base import ModelBase
+
+from tests.stand_in import StandIn, StandInAdapter, StandInServer
+
+from .bench_canvas import make_builder
+
+BASELINE_VERSION = 1
+
+# name -> (func, number of calls per timing, repeats, bytes processed per call or None)
+Benchmark = Tuple[Callable[[], object], int, int, Optional[int]]
+
+
+def import_time() -> float:
+    """ The time taken to import the package, in a fresh interpreter. """
+    code = 'import time; s = time.perf_counter(); import intercom_python_sdk; print(time.perf_counter() - s)'
+    return float(subprocess.check_output([sys.executable, '-c', code]))
+
+
+def list_payload(stand_in: StandIn, kind: str, key: str, size: int) -> dict:
+    """ A decoded list response of `size` objects of a kind, as the schemas receive it. """
+    return {'type': 'list', key: [stand_in.get(kind, id) for id in stand_in.ids(kind)[:size]]}
+
+
+def make_benchmarks(stack: ExitStack, sizes: Tuple[int, ...] = (1000, 10000)
+                    ) -> Iterator[Tuple[str, Callable[[], Benchmark]]]:
+    """
+    The benchmarks, by name, each with a function building it and its fixtures.
+
+    Fixtures are only built for the benchmarks that are run, and shared between them. Servers are
+    stopped when `stack` is closed.
+    """
+    largest = max(sizes)
+
+    @lru_cache(maxsize=None)
+    def stand_in() -> StandIn:
+        return StandIn(totals={'article': largest, 'conversation': largest, 'event': largest},
+                       export_size=8 * 1024 * 1024)
+
+    @lru_cache(maxsize=None)
+    def intercom() -> Intercom:
+        config = Configuration(auth=BearerToken('TEST'))
+        config.session.mount('https://', StandInAdapter(stand_in()))
+        return Intercom(config=config)
+
+    @lru_cache(maxsize=None)
+    def http() -> Intercom:
+        server = stack.enter_context(StandInServer(StandIn(totals={'article': 1000}, export_size=8 * 1024 * 1024)))
+        return Intercom(config=Configuration(auth=BearerToken('TEST'), base_url=server.base_url))
+
+    yield 'import intercom_python_sdk', lambda: (None, 1, 5, None)
+    yield 'Intercom() construction', lambda: (lambda: Intercom('TEST'), 20, 5, None)
+
+    yield 'teams.get_team_by_id (proxy, in-process HTTP)', lambda: (
+        lambda client=intercom(): client.teams.get_team_by_id(1), 500, 5, None)
+    yield 'teams.get_team_by_id (api_object, in-process HTTP)', lambda: (
+        lambda api=intercom().teams.api_object: api.get_team_by_id(1), 500, 5, None)
+    yield 'proxy attribute lookup', lambda: (lambda client=intercom(): client.teams.get_team_by_id, 20000, 5, None)
+
+    schemas = (
+        ('articles', 'article', 'data', ArticleListSchema),
+        ('conversations', 'conversation', 'conversations', ConversationListSchema),
+        ('events', 'event', 'events', DataEventListSchema),
+    )
+    for name, kind, key, schema_class in schemas:
+        for size in sizes:
+            def schema_load(schema_class=schema_class, kind=kind, key=key, size=size) -> Benchmark:
+                schema, payload = schema_class(), list_payload(stand_in(), kind, key, size)
+                repeat = 3 if size * (20 if kind == 'conversation' else 1) >= 10000 else 5
+                return lambda: schema.load(payload), 1, repeat, None
+            yield f'schema load {size} {name}', schema_load
+
+    for size in sizes:
+        def inject_into_instances(size=size) -> Benchmark:
+            articles = intercom().articles
+            inject = object.__getattribute__(articles, '_inject_into_instances')
+            models = ArticleListSchema().load(list_payload(stand_in(), 'article', 'data', size))
+            return lambda: inject(models, ModelBase, 'api_client', articles.api_object), 1, 5, None
+        yield f'_inject_into_instances {size} articles', inject_into_instances
+
+    yield 'CanvasBuilder.build', lambda: (lambda builder=make_builder(): builder.build(), 10000, 5, None)
+
+    yield 'articles.list_all 1000 (localhost, 50 per page)', lambda: (
+        lambda client=http(): client.articles.list_all(per_page=50), 1, 5, None)
+    yield 'articles.iter_all 1000 (localhost, 50 per page, 4 workers)', lambda: (
+        lambda client=http(): sum(1 for _ in client.articles.iter_all(per_page=50, max_workers=4)), 1, 5, None)
+
+    def download() -> Benchmark:
+        client = http()
+        export_bytes = len(client.data_export.download('job-1').content)
+        return lambda: client.data_export.download('job-1').content, 1, 5, export_bytes
+    yield 'data_export.download (8 MiB CSV, gzipped)', download
+
+
+def run(sizes: Tuple[int, ...] = (1000, 10000), name_filter: str = '') -> Dict[str, dict]:
+    """
+    Run the benchmarks whose name contains `name_filter`.
+
+    :param sizes: The list sizes of the schema load and injection benchmarks.
+    :param name_filter: Only run the benchmarks whose name contains this.
+    :return: For each benchmark, the best time per call in seconds, and the throughput in MB/s where relevant.
+    """
+    results = {}
+    with ExitStack() as stack:
+        for name, setup in make_benchmarks(stack, sizes):
+            if name_filter not in name:
+                continue
+            func, number, repeat, size = setup()
+            if func is None:
+                seconds = min(import_time() for _ in range(repeat))
+            else:
+                seconds = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+            results[name] = {'seconds': seconds}
+            if size:
+                results[name]['mb_per_second'] = size / seconds / 1e6
+            print(f'{name:<62} {format_seconds(seconds)}', file=sys.stderr)
+    return results
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (('s', 1), ('ms', 1e3), ('us', 1e6)):
+        if seconds * scale >= 1:
+            return f'{seconds * scale:9.2f} {unit}'
+    return f'{seconds * 1e9:9.2f} ns'
+
+
+def make_baseline(results: Dict[str, dict]) -> dict:
+    return {
+        'version': BASELINE_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def compare(baseline: dict, results: Dict[str, dict], tolerance: float = 0.25) -> Tuple[List[str], List[str]]:
+    """
+    Compare results to a baseline.
+
+    :param baseline: A baseline, as saved with `--save`.
+    :param results: The results of `run`.
+    :param tolerance: The allowed slowdown, as a fraction of the baseline time.
+    :return: The lines of the comparison table, and the names of the benchmarks that regressed.
+    """
+    lines, regressions = [], []
+    for name, result in results.items():
+        before = baseline['results'].get(name)
+        if before is None:
+            lines.append(f'{name:<62} {format_seconds(result["seconds"])}       (new)')
+            continue
+        ratio = result['seconds'] / before['seconds']
+        flag = ''
+        if ratio > 1 + tolerance:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        lines.append(f'{name:<62} {format_seconds(result["seconds"])}  x{ratio:5.2f}{flag}')
+    return lines, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--quick', action='store_true', help='Use lists of 100 and 1000 items instead of 1k and 10k.')
+    parser.add_argument('--filter', default='', help='Only run the benchmarks whose name contains this.')
+    parser.add_argument('--save', metavar='PATH', help='Save the results as a JSON baseline.')
+    parser.add_argument('--compare', metavar='PATH', help='Compare the results to a JSON baseline.')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed slowdown against the baseline, as a fraction. Defaults to 0.25.')
+    args = parser.parse_args()
+
+    results = run((100, 1000) if args.quick else (1000, 10000), args.filter)
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(make_baseline(results), file, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        lines, regressions = compare(baseline, results, args.tolerance)
+        print('\n'.join(lines))
+        if regressions:
+            print(f'\n{len(regressions)} benchmark(s) regressed by more than {args.tolerance:.0%}.')
+            sys.exit(1)
+    elif not args.save:
+        print(json.dumps(make_baseline(results), indent=2, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""
+# Canvas ASGI Load Test
+
+`benchmarks/load_canvas_asgi.py`
+
+A local load-test harness for `CanvasApp`. Requests are driven straight through the ASGI
+interface, in process, so that the figures only include the handling of the requests
+(parsing, dispatch, the handlers themselves, validation and serialization) and not a server.
+
+Reports the throughput, and the p50/p99 latency of each handler.
+
+Usage:
+    python -m benchmarks.load_canvas_asgi [--requests N] [--concurrency C]
+    python -m benchmarks.load_canvas_asgi --app my_module:app --body initialize=init.json --body submit=submit.json
+"""
+# Built-ins
+import argparse
+import asyncio
+import importlib
+import json
+import statistics
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+# Intercom Python SDK
+from intercom_python_sdk.canvas import CanvasApp, CanvasBuilder, Placeholder, TextParameters
+
+from .bench_canvas import make_builder, make_request_body
+
+
+def make_app() -> CanvasApp:
+    """ A sample app with a sync, an async and a templated handler. """
+    app = CanvasApp(sync_in_thread=False)
+    template = make_builder(Placeholder("title"), Placeholder("conversation_id")).freeze()
+
+    @app.handler()
+    def initialize(request):
+        return make_builder()
+
+    @app.handler("submit")
+    async def submit(request):
+        await asyncio.sleep(0)  # Stands in for a non-blocking lookup
+        return CanvasBuilder().add_text(TextParameters(text=f"Thanks, {request.input_values['field_0']}!"))
+
+    @app.handler("refresh")
+    def refresh(request):
+        return template.render_bytes(title="Report an issue", conversation_id=request.stored_data["conversation_id"])
+
+    return app
+
+
+def make_bodies() -> Dict[str, bytes]:
+    submit = json.loads(make_request_body())
+    return {
+        "initialize": json.dumps({"context": submit["context"], "contact": submit["contact"]}).encode(),
+        "submit": json.dumps(submit).encode(),
+        "refresh": json.dumps({**submit, "component_id": "refresh"}).encode(),
+    }
+
+
+async def request(app: Callable, body: bytes) -> int:
+    """ Send a single request through the ASGI interface, returning its status. """
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": [(b"content-type", b"application/json")]}
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    status = 0
+
+    async def receive():
+        return messages.pop()
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def run(app: Callable, bodies: Dict[str, bytes], requests: int, concurrency: int) -> Dict[str, List[float]]:
+    """
+    Send `requests` requests per body, with up to `concurrency` requests in flight at once.
+
+    :return: The latency of each request, in seconds, by body name.
+    """
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed(name: str, body: bytes):
+        async with semaphore:
+            start = time.perf_counter()
+            status = await request(app, body)
+            latencies[name].append(time.perf_counter() - start)
+            if status != 200:
+                raise RuntimeError(f"{name}: unexpected status {status}")
+
+    await asyncio.gather(*(
+        timed(name, body) for _ in range(requests) for name, body in bodies.items()
+    ))
+    return latencies
+
+
+def percentile(values: List[float], pct: float) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1] if len(values) > 1 else values[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per handler.")
+    parser.add_argument("--concurrency", type=int, default=32, help="Requests in flight at once.")
+    parser.add_argument("--app", help="The app to test, as 'module:attribute'. Defaults to a sample app.")
+    parser.add_argument("--body", action="append", default=[], metavar="NAME=FILE",
+                        help="A request body to send, repeatable. Defaults to sample bodies.")
+    args = parser.parse_args()
+
+    if args.app:
+        module, attribute = args.app.split(":")
+        app = getattr(importlib.import_module(module), attribute)
+    else:
+        app = make_app()
+
+    if args.body:
+        bodies = {}
+        for spec in args.body:
+            name, path = spec.split("=", 1)
+            with open(path, "rb") as f:
+                bodies[name] = f.read()
+    else:
+        bodies = make_bodies()
+
+    start = time.perf_counter()
+    latencies = asyncio.run(run(app, bodies, args.requests, args.concurrency))
+    elapsed = time.perf_counter() - start
+
+    total = sum(len(values) for values in latencies.values())
+    print(f"{total} requests in {elapsed:.2f}s ({total / elapsed:.0f} req/s, concurrency {args.concurrency})")
+    for name, values in latencies.items():
+        p50, p99 = percentile(values, 50) * 1e6, percentile(values, 99) * 1e6
+        print(f"{name:<20} p50 {p50:8.1f} us    p99 {p99:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
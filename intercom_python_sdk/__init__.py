@@ -55,6 +55,8 @@ These objects contain all the properties defined for their model in the Intercom
 """
 
 from .intercom import Intercom
+from .pool import IntercomPool
+from .snapshot import Snapshot
 from .core.configuration import Configuration
 from .core.api_base import create_api_client
 from .apis.tags_to_api import tags_to_api_dict as API_TAGS
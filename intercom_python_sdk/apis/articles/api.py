@@ -12,7 +12,7 @@ It is used to interact with the Intercom Articles API [1] as defined in the Inte
 """
 
 # Built-ins
-from typing import Union
+from typing import Iterable, Iterator, Optional, Tuple, Union
 
 # External
 from uplink import (
@@ -27,11 +27,13 @@ from .schemas import (
     ArticleSchema,
     ArticleListSchema
 )
-from .models import ArticleList
+from .models import Article, ArticleList
 
 # From Current Package
 from ...core.api_base import APIBase
+from ...core.bulk import BulkCheckpoint, BulkResult, run_bulk
 from ...core.errors import catch_api_error
+from ...core.pagination import iter_numbered_pages
 
 
 @response_handler(catch_api_error)
@@ -101,6 +103,40 @@ class ArticlesAPI(APIBase):  # type: ignore
 
         return article_list
 
+    def iter_pages(self, page: int = 1, per_page: int = 50, max_workers: int = 2) -> Iterator[ArticleList]:
+        """ Iterate over the pages of Articles, without holding them all in memory.
+
+        The API returns Articles in descending order of `updated_at`. Pages are fetched concurrently,
+        up to `max_workers` pages ahead of the iteration; stop iterating to stop fetching.
+
+        Args:
+            page (int): The page number to start at.
+            per_page (int): The number of Articles to return per page.
+            max_workers (int): The number of pages fetched concurrently. Defaults to 2.
+
+        Yields:
+            ArticleList: Each page of Articles, in order.
+        """
+        return iter_numbered_pages(
+            lambda number: self.__list_all(page=number, per_page=per_page),
+            lambda article_list: (article_list.pages or {}).get('total_pages', 1),
+            start=page,
+            max_workers=max_workers
+        )
+
+    def iter_all(self, per_page: int = 50, max_workers: int = 2) -> Iterator[Article]:
+        """ Iterate over all Articles, without holding them all in memory. See `iter_pages`.
+
+        Args:
+            per_page (int): The number of Articles to fetch per request.
+            max_workers (int): The number of pages fetched concurrently. Defaults to 2.
+
+        Yields:
+            Article: Each Article, most recently updated first.
+        """
+        for article_list in self.iter_pages(per_page=per_page, max_workers=max_workers):
+            yield from article_list
+
     @returns(ArticleSchema)  # type: ignore
     @json  # type: ignore
     @put("{article_id}")
@@ -111,3 +147,64 @@ class ArticlesAPI(APIBase):  # type: ignore
             article_id (Union[str, int]): The ID of the Article.
             data (ArticleSchema): An article schema object to update via.
         """
+
+    def bulk_update(self, updates: Iterable[Tuple[Union[str, int], dict]], max_workers: int = 8,
+                    max_retries: int = 5, checkpoint: Optional[str] = None) -> Iterator[BulkResult]:
+        """ Update many Articles concurrently, streaming the result of each.
+
+        Updates are sent through a bounded pool of worker threads. When the rate limit is hit, all workers
+        pause until it resets and the rejected updates are retried. A failed update does not abort the batch;
+        its error is reported on its result instead.
+
+        With a `checkpoint` file, each successful update is recorded as its result is yielded, and updates
+        recorded by a previous run are skipped, so that an interrupted batch can be resumed by running it again.
+
+        Args:
+            updates (Iterable[Tuple[Union[str, int], dict]]): Pairs of `(article_id, changes)`, consumed lazily.
+                Only the fields in `changes` are sent, e.g. `{'title': 'New title'}`.
+            max_workers (int): The number of updates sent concurrently. Defaults to 8.
+            max_retries (int): The maximum number of retries of a rate limited update. Defaults to 5.
+            checkpoint (str): The path of a checkpoint file to resume from and record to. Defaults to None.
+
+        Yields:
+            BulkResult: The result of each update, in completion order. `BulkResult.key` is the Article ID,
+                and `BulkResult.result` the updated Article if `BulkResult.ok`.
+        """
+        done = BulkCheckpoint(checkpoint) if checkpoint else None
+        try:
+            results = run_bulk(
+                self.update_by_id,
+                ((article_id, (article_id, changes)) for article_id, changes in updates
+                 if done is None or article_id not in done),
+                max_workers=max_workers,
+                max_retries=max_retries
+            )
+            for result in results:
+                if done is not None and result.ok:
+                    done.record(result.key)
+                yield result
+        finally:
+            if done is not None:
+                done.close()
+
+    def bulk_translate(self, translations: Iterable[Tuple[Union[str, int], str, dict]], max_workers: int = 8,
+                       max_retries: int = 5, checkpoint: Optional[str] = None) -> Iterator[BulkResult]:
+        """ Update the translated content of many Articles concurrently. See `bulk_update`.
+
+        Args:
+            translations (Iterable[Tuple[Union[str, int], str, dict]]): Triples of `(article_id, locale, content)`,
+                where `content` is the translated Article for the locale, e.g. `{'title': ..., 'body': ...}`.
+                An Article must appear at most once; send several locales at once with `bulk_update`.
+            max_workers (int): The number of updates sent concurrently. Defaults to 8.
+            max_retries (int): The maximum number of retries of a rate limited update. Defaults to 5.
+            checkpoint (str): The path of a checkpoint file to resume from and record to. Defaults to None.
+
+        Yields:
+            BulkResult: The result of each update, in completion order.
+        """
+        return self.bulk_update(
+            ((article_id, {'translated_content': {locale: content}}) for article_id, locale, content in translations),
+            max_workers=max_workers,
+            max_retries=max_retries,
+            checkpoint=checkpoint
+        )
@@ -24,7 +24,7 @@ from typing import (
 from . import schemas as a_schemas
 
 # From Current Package
-from ...core.model_base import ModelBase
+from ...core.model_base import IdIndex, ModelBase
 
 # Type Check Imports - TYPE_CHECKING is assumed True by type-checkers but is False at runtime.
 # See: https://docs.python.org/3/library/typing.html#typing.TYPE_CHECKING
@@ -430,11 +430,13 @@ class Article(ModelBase):
 
     def update(self) -> 'Article':
         """
-        Update the Article.
+        Update the Article, sending only the fields changed since it was loaded.
+        No request is sent if no field was changed.
         """
-        data = a_schemas.ArticleSchema().dump(self)
-        schema = a_schemas.ArticleSchema().load(data)
-        self.api_client.update_by_id(self.id, schema)  # type: ignore
+        changes = self.dump_changes(a_schemas.ArticleSchema)
+        if changes:
+            self.api_client.update_by_id(self.id, changes)  # type: ignore
+        self.clear_changes()
 
         return self
 
@@ -451,6 +453,7 @@ class ArticleList(ModelBase):
         self.__pages = kwargs.get('pages', {})
         self.__total_count = kwargs.get('total_count', 0)
         self.__data = kwargs.get('data', [])
+        self.__index = IdIndex()
 
     # Properties
     @property
@@ -553,6 +556,7 @@ class ArticleList(ModelBase):
             data (List[Article]): The data of the Article.
         """
         self.__data = data
+        self.__index.invalidate()
 
     def get_by_id(self, article_id: Union[str, int]) -> Optional[Article]:
         """
@@ -564,9 +568,7 @@ class ArticleList(ModelBase):
         Returns:
             Optional[Article]: The Article with the given ID.
         """
-        return next(
-            (article for article in self.data if article.id == article_id), None
-        )
+        return self.__index.get(self.data, article_id)
 
     def extend(self, articles: 'ArticleList'):
         """
@@ -575,10 +577,7 @@ class ArticleList(ModelBase):
         Args:
             ArticleList (ArticleList): The ArticleList to extend.
         """
-        article_ids = [a.id for a in self]
-        for article in articles:
-            if article.id not in article_ids:
-                self.data.append(article)
+        self.__index.extend(self.data, articles)
 
     def __len__(self):
         """ The length of the ArticleList"""
@@ -601,3 +600,13 @@ class ArticleList(ModelBase):
             >>> article_list[0]
         """
         return self.data[index]
+
+    def __setitem__(self, index, value: Article):
+        """ Sets the article at a given index of ArticleList.data.
+
+        Example:
+            >>> article_list = intercom.articles.list_all()
+            >>> article_list[0] = article
+        """
+        self.data[index] = value
+        self.__index.invalidate()
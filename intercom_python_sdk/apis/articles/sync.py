@@ -0,0 +1,194 @@
+"""
+# Article Sync
+
+`apis/articles/sync.py`
+
+This module contains the ArticleSync class, which incrementally syncs the Articles of a workspace,
+e.g. to keep a search index up to date without re-downloading every Article on each run.
+
+## Example Usage
+
+```python
+from intercom_python_sdk import Intercom
+from intercom_python_sdk.apis.articles.sync import ArticleSync
+
+intercom = Intercom('my_api_key')
+sync = ArticleSync(intercom.articles, 'articles-sync.json')
+
+changes = sync.run()  # The first run reports every Article as created
+for article in changes.created + changes.updated:
+    index(article)
+for article_id in changes.deleted:
+    unindex(article_id)
+```
+"""
+# Built-ins
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from typing import (
+    Dict,
+    List,
+    Optional,
+    TYPE_CHECKING
+)
+
+# From Current API
+from .models import Article
+
+if TYPE_CHECKING:
+    from .api import ArticlesAPI
+
+STATE_VERSION = 1
+
+
+@dataclass
+class SyncChanges:
+    """
+    The changes found by `ArticleSync.run`.
+
+    Attributes:
+        created (List[Article]): Articles not seen in the previous runs.
+        updated (List[Article]): Articles whose `updated_at` changed since the previous run.
+        deleted (List[str]): The IDs of the Articles which no longer exist.
+        watermark (int): The highest `updated_at` seen so far.
+        full_scan (bool): Whether every Article was listed, or the listing stopped early.
+    """
+    created: List[Article] = field(default_factory=list)
+    updated: List[Article] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    watermark: Optional[int] = None
+    full_scan: bool = True
+
+    def __bool__(self):
+        return bool(self.created or self.updated or self.deleted)
+
+
+class ArticleSync:
+    """
+    Incrementally syncs Articles, keeping its state in a JSON file between runs.
+
+    The state is a watermark (the highest `updated_at` seen) and a snapshot of the `updated_at`
+    of each Article by ID. Each run lists the Articles, most recently updated first, and compares
+    them against the snapshot.
+
+    Once the listing reaches Articles older than the watermark, the rest of them are unchanged.
+    If the total count then shows that no Article was deleted, the listing stops there. Otherwise
+    it carries on to the end, as finding which Articles were deleted takes a full listing.
+
+    Args:
+        articles (ArticlesAPI): The Articles API client, e.g. `intercom.articles`.
+        path (str): The path of the state file. It is created on the first run.
+        per_page (int): The number of Articles to fetch per request. Defaults to 50.
+        stop_early (bool): Whether to stop listing once the watermark is reached. Defaults to True.
+    """
+
+    def __init__(self, articles: 'ArticlesAPI', path: str, per_page: int = 50, stop_early: bool = True):
+        self.articles = articles
+        self.path = path
+        self.per_page = per_page
+        self.stop_early = stop_early
+        self._watermark: Optional[int] = None
+        self._snapshot: Dict[str, int] = {}
+        self.load()
+
+    @property
+    def watermark(self) -> Optional[int]:
+        """ The highest `updated_at` seen so far, or None before the first run. """
+        return self._watermark
+
+    @property
+    def snapshot(self) -> Dict[str, int]:
+        """ The `updated_at` of each known Article, by ID. """
+        return dict(self._snapshot)
+
+    def load(self):
+        """ Load the state from the state file, if it exists. """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return
+
+        if state.get('version') != STATE_VERSION:
+            raise ValueError(f"Unsupported article sync state version: {state.get('version')!r}")
+        self._watermark = state.get('watermark')
+        self._snapshot = state.get('snapshot', {})
+
+    def save(self):
+        """ Write the state to the state file, atomically. """
+        state = {'version': STATE_VERSION, 'watermark': self._watermark, 'snapshot': self._snapshot}
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.article-sync-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(state, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def reset(self):
+        """ Forget the state, so that the next run reports every Article as created. """
+        self._watermark = None
+        self._snapshot = {}
+
+    def run(self, commit: bool = True) -> SyncChanges:
+        """ List the Articles and find the changes since the previous run.
+
+        Args:
+            commit (bool): Whether to update and save the state. If False, the same changes are
+                reported again by the next run. Defaults to True.
+
+        Returns:
+            SyncChanges: The created, updated and deleted Articles.
+        """
+        changes = SyncChanges(watermark=self._watermark)
+        seen: Dict[str, int] = {}
+        total_count = None
+        # Only stop early if there is something to compare against.
+        stop_early = self.stop_early and self._watermark is not None
+
+        pages = self.articles.iter_pages(per_page=self.per_page)
+        try:
+            for article_list in pages:
+                if total_count is None:
+                    total_count = article_list.total_count
+                for article in article_list:
+                    updated_at = article.updated_at or 0
+                    if stop_early and updated_at < self._watermark:
+                        # The remaining Articles are all in the snapshot, so nothing was deleted
+                        # if the snapshot accounts for every Article not created since.
+                        if len(self._snapshot) == total_count - len(changes.created):
+                            changes.full_scan = False
+                            break
+                        stop_early = False
+
+                    key = str(article.id)
+                    seen[key] = updated_at
+                    if key not in self._snapshot:
+                        changes.created.append(article)
+                    elif self._snapshot[key] != updated_at:
+                        changes.updated.append(article)
+                else:
+                    continue
+                break
+        finally:
+            pages.close()
+
+        if changes.full_scan:
+            changes.deleted = [key for key in self._snapshot if key not in seen]
+            snapshot = seen
+        else:
+            snapshot = {**self._snapshot, **seen}
+
+        if seen:
+            changes.watermark = max(max(seen.values()), self._watermark or 0)
+
+        if commit:
+            self._watermark = changes.watermark
+            self._snapshot = snapshot
+            self.save()
+
+        return changes
@@ -1,7 +1,34 @@
 """
+# Intercom Conversation API
 
+Implements the Intercom Conversation API [1].
+
+---
+- [1] https://developers.intercom.com/docs/references/rest-api/api.intercom.io/Conversations/conversation/
+
+## Example Usage
+
+```python
+from intercom_python_sdk import Intercom
+
+intercom = Intercom('my_api_key')
+
+conversation = intercom.conversation.get_by_id(1234567890) # Returns a Conversation object
+
+# Stream through all Conversations. Pages are prefetched in the background and never held all at once.
+for conversation in intercom.conversation.iter_all(per_page=150):
+    print(conversation.id, conversation.state, conversation.admin_assignee_id)
+
+# Or through the Conversations matching a search query
+query = {"field": "state", "operator": "=", "value": "open"}
+for conversation in intercom.conversation.search(query):
+    print(conversation.id)
+```
+
+Conversations returned by `iter_all` and `search` are loaded lazily: nested blocks such as `source`
+or `conversation_parts` are only deserialized the first time they are accessed.
 """
 
 from . import api
 from . import models
-from . import schemas
\ No newline at end of file
+from . import schemas
@@ -1,38 +1,175 @@
 """
 # Conversation API
 
-`apis/data_events/api.py`
+`apis/conversation/api.py`
 
-This module contains the conversationAPI class, which defines a client for the conversation API.
+This module contains the ConversationAPI class, which defines a client for the Conversation API.
 It is used to interact with the Intercom Conversation API [1] as defined in the Intercom API Reference [2].
 
 ---
 - [1] https://developers.intercom.com/docs/references/rest-api/api.intercom.io/Conversations/conversation/
 - [2] https://github.com/intercom/Intercom-OpenAPI
+- [3] https://developers.intercom.com/docs/references/rest-api/api.intercom.io/Conversations/searchConversations/
 """
+# Built-ins
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
 # External
 from uplink import (
     get, post,
     returns,
     response_handler,
-    Body, Query,json
+    Body, Query, json
 )
 
 # From Current API
+from .schemas import (
+    ConversationSchema,
+    ConversationListSchema,
+    ConversationPartListSchema
+)
+from .models import Conversation, ConversationList
 
 # Intercom Python SDK
 from ...core.api_base import APIBase
+from ...core.bulk import BulkResult, run_bulk
 from ...core.errors import catch_api_error
+from ...core.json_stream import loads_deferring
+from ...core.pagination import iter_cursor_pages
+from ...core.schema_base import DeferredNested
 
 
 @response_handler(catch_api_error)
 class ConversationAPI(APIBase):  # type: ignore
     URI = "/conversations/"
 
+    @get("{conversation_id}")
+    def __get_by_id(self, conversation_id: Union[str, int],
+                    display_as: Query("display_as", str) = None):  # noqa # type: ignore
+        """ Get a Conversation by ID. Internal method for `get_by_id`, returns the raw response. """
+
+    def get_by_id(self, conversation_id: Union[str, int], display_as: Optional[str] = None,
+                  include_parts: bool = True) -> Conversation:
+        """ Get a Conversation by ID.
+
+        The `conversation_parts` array is not decoded with the rest of the response. It is kept
+        as text and decoded part by part by `Conversation.iter_parts`, or all at once on first access
+        to `Conversation.conversation_parts`.
+
+        Args:
+            conversation_id (Union[str, int]): The ID of the Conversation.
+            display_as (str): Set to 'plaintext' to retrieve conversation messages in plain text. (Optional)
+            include_parts (bool): If False, the conversation parts are skipped over without being decoded,
+                and `conversation_parts` is None. Defaults to True.
+
+        Returns:
+            Conversation: The Conversation with the given ID.
+        """
+        response = self.__get_by_id(conversation_id, display_as=display_as)
+        text = response.content.decode('utf-8')
+
+        if not include_parts:
+            data = loads_deferring(text, ('conversation_parts',), skip=True)
+            return ConversationSchema().load(data)
+
+        data = loads_deferring(text, ('conversation_parts', 'conversation_parts'))
+        parts = data.pop('conversation_parts', None)
+        conversation = ConversationSchema().load(data)
+        if parts is not None:
+            conversation.conversation_parts = DeferredNested(ConversationPartListSchema(), parts)
+
+        return conversation
+
+    # Listing and searching return lazily loaded conversations, see `ConversationSchema`.
+
+    @returns(ConversationListSchema(lazy=True))  # type: ignore
+    @get("")
+    def __list_page(self,
+                    per_page: Query("per_page", int) = 20,  # noqa # type: ignore
+                    starting_after: Query("starting_after", str) = None):  # noqa # type: ignore
+        """ List a page of Conversations. Internal method for `list_page` and `iter_all`. """
+
+    @returns(ConversationListSchema(lazy=True))  # type: ignore
+    @json  # type: ignore
+    @post("search")
+    def __search_page(self, data: Body(type=dict)):  # type: ignore
+        """ Search a page of Conversations. Internal method for `search_page` and `search`. """
+
+    def list_page(self, per_page: int = 20, starting_after: Optional[str] = None) -> ConversationList:
+        """ List a single page of Conversations.
+
+        Args:
+            per_page (int): The number of Conversations to return per page. Max 150.
+            starting_after (str): The cursor of the page to fetch. Defaults to the first page.
+
+        Returns:
+            ConversationList: The page of Conversations. Use `ConversationList.starting_after` to fetch the next one.
+        """
+        return self.__list_page(per_page=per_page, starting_after=starting_after)
+
+    def iter_all(self, per_page: int = 20, starting_after: Optional[str] = None) -> Iterator[Conversation]:
+        """ Iterate over all Conversations.
+
+        Pages are fetched one at a time, the next page being prefetched in the background
+        while the current one is consumed, so only two pages are ever held in memory.
+
+        Args:
+            per_page (int): The number of Conversations to fetch per request. Max 150.
+            starting_after (str): The cursor to start at. Defaults to the first page.
+
+        Yields:
+            Conversation: Each Conversation, in the order returned by the API.
+        """
+        pages = iter_cursor_pages(
+            lambda cursor: self.__list_page(per_page=per_page, starting_after=cursor),
+            lambda page: page.starting_after,
+            starting_after=starting_after
+        )
+        for page in pages:
+            yield from page
+
+    def search_page(self, query: dict, per_page: int = 20, starting_after: Optional[str] = None) -> ConversationList:
+        """ Search a single page of Conversations.
+
+        Args:
+            query (dict): The search query, see [3] in the module documentation for its format.
+                For example: `{"field": "state", "operator": "=", "value": "open"}`.
+            per_page (int): The number of Conversations to return per page. Max 150.
+            starting_after (str): The cursor of the page to fetch. Defaults to the first page.
+
+        Returns:
+            ConversationList: The page of matching Conversations.
+        """
+        pagination = {"per_page": per_page}
+        if starting_after:
+            pagination["starting_after"] = starting_after
+
+        return self.__search_page({"query": query, "pagination": pagination})
+
+    def search(self, query: dict, per_page: int = 20, starting_after: Optional[str] = None) -> Iterator[Conversation]:
+        """ Iterate over all Conversations matching a search query.
+
+        Pages are prefetched in the background, as in `iter_all`.
+
+        Args:
+            query (dict): The search query. See `search_page`.
+            per_page (int): The number of Conversations to fetch per request. Max 150.
+            starting_after (str): The cursor to start at. Defaults to the first page.
+
+        Yields:
+            Conversation: Each matching Conversation.
+        """
+        pages = iter_cursor_pages(
+            lambda cursor: self.search_page(query, per_page=per_page, starting_after=cursor),
+            lambda page: page.starting_after,
+            starting_after=starting_after
+        )
+        for page in pages:
+            yield from page
+
     @json  # type: ignore
     @post("{conversation_id}/reply")
-    def reply_to_conversation(self, conversation_id: str, payload: Body): #type: ignore
+    def reply_to_conversation(self, conversation_id: str, payload: Body):  # type: ignore
         """ Reply to a Conversation.
 
         Args:
@@ -43,3 +180,32 @@ class ConversationAPI(APIBase):  # type: ignore
             Conversation: The Conversation with the given ID.
         """
 
+    def bulk_reply(self, replies: Iterable[Tuple[str, dict]], max_workers: int = 8,
+                   max_retries: int = 5) -> List[BulkResult]:
+        """ Reply to many Conversations concurrently.
+
+        Replies are sent through a bounded pool of worker threads. When the rate limit is hit, all workers
+        pause until it resets and the rejected replies are retried. A failed reply does not abort the batch;
+        its error is reported on its result instead.
+
+        Args:
+            replies (Iterable[Tuple[str, dict]]): Pairs of `(conversation_id, payload)`, consumed lazily.
+                See `reply_to_conversation` for the payload.
+            max_workers (int): The number of replies sent concurrently. Defaults to 8.
+            max_retries (int): The maximum number of retries of a rate limited reply. Defaults to 5.
+
+        Returns:
+            List[BulkResult]: One result per reply, in input order. `BulkResult.key` is the conversation ID, and
+                `BulkResult.result` the replied to Conversation (loaded lazily) if `BulkResult.ok`.
+        """
+        def reply(conversation_id: str, payload: dict) -> Conversation:
+            response = self.reply_to_conversation(conversation_id, payload)
+            return ConversationSchema(lazy=True).load(response.json())
+
+        results = run_bulk(
+            reply,
+            ((conversation_id, (conversation_id, payload)) for conversation_id, payload in replies),
+            max_workers=max_workers,
+            max_retries=max_retries
+        )
+        return sorted(results, key=lambda result: result.index)
@@ -187,13 +187,13 @@ These models provide object oriented interfaces for the schemas defined in `apis
 }
 """
 
-# External
-from bs4 import BeautifulSoup
-
+# Built-ins
 from typing import (
+    Any,
+    Dict,
+    Iterator,
     List,
     Optional,
-    Union,
     TYPE_CHECKING
 )
 
@@ -202,6 +202,7 @@ from . import schemas as c_schemas
 
 # From Current Package
 from ...core.model_base import ModelBase
+from ...core.schema_base import DeferredNested
 
 # Type Check Imports - TYPE_CHECKING is assumed True by type-checkers but is False at runtime.
 # See: https://docs.python.org/3/library/typing.html#typing.TYPE_CHECKING
@@ -213,12 +214,27 @@ class Conversation(ModelBase):
     """
     Represents a Conversation.
 
+    Nested blocks (tags, conversation_rating, source, contacts, teammates, statistics,
+    conversation_parts and linked_objects) may be received as `DeferredNested` payloads when
+    loaded through `ConversationSchema(lazy=True)`. They are deserialized on first access
+    and cached on the instance.
+
     Attributes:
-        See the `ConversationSchema` definition in `apis/Conversation/schemas.py` for details.
+        See the `ConversationSchema` definition in `apis/conversation/schemas.py` for details.
 
     Model-Specific Attributes:
         api_client (ConversationAPI): The API Client Instance. Injected via APIProxyInterface
     """
+    NESTED_FIELDS = (
+        'tags',
+        'conversation_rating',
+        'source',
+        'contacts',
+        'teammates',
+        'statistics',
+        'conversation_parts',
+        'linked_objects',
+    )
 
     def __init__(self, *args, **kwargs):
         self.__type: str = kwargs.get('type', '')
@@ -234,18 +250,501 @@ class Conversation(ModelBase):
         self.__priority: str = kwargs.get('priority', '')
         self.__admin_assignee_id: int = kwargs.get('admin_assignee_id', 0)
         self.__team_assignee_id: str = kwargs.get('team_assignee_id', '')
-        self.__tags: c_schemas.Tags = kwargs.get('tags', None)
-        self.__conversation_rating: c_schemas.ConversationRating = kwargs.get('conversation_rating', None)
-        self.__source: c_schemas.Source = kwargs.get('source', None)
-        self.__contacts: c_schemas.Contacts = kwargs.get('contacts', None)
-        self.__teammates: c_schemas.Teammates = kwargs.get('teammates', None)
         self.__custom_attributes: dict = kwargs.get('custom_attributes', {})
-        self.__first_contact_reply: c_schemas.FirstContactReply = kwargs.get('first_contact_reply', None)
-        self.__sla_applied: c_schemas.SLAApplied = kwargs.get('sla_applied', None)
-        self.__statistics: c_schemas.Statistics = kwargs.get('statistics', None)
-        self.__conversation_parts: c_schemas.ConversationParts = kwargs.get('conversation_parts', None)
-        self.__linked_objects: c_schemas.LinkedObjects = kwargs.get('linked_objects', None)
+        self.__first_contact_reply: Optional[dict] = kwargs.get('first_contact_reply', None)
+        self.__sla_applied: Optional[dict] = kwargs.get('sla_applied', None)
+        self.__nested: Dict[str, Any] = {name: kwargs.get(name, None) for name in self.NESTED_FIELDS}
+
+    # Properties
+
+    @property
+    def api_client(self) -> 'ConversationAPI':
+        """ Get the API Client Instance. """
+        return self._api_client
+
+    @property
+    def type(self) -> str:
+        """
+        The type of the conversation.
+
+        Returns:
+            str: The type of the conversation. Empty if unset.
+        """
+        return self.__type
+
+    @property
+    def id(self) -> str:
+        """
+        The ID of the conversation.
+
+        Returns:
+            str: The ID of the conversation. Empty if unset.
+        """
+        return self.__id
+
+    @property
+    def title(self) -> str:
+        """
+        The title of the conversation.
+
+        Returns:
+            str: The title of the conversation. Empty if unset.
+        """
+        return self.__title
+
+    @property
+    def created_at(self) -> int:
+        """
+        The unix timestamp of when the conversation was created.
+
+        Returns:
+            int: The unix timestamp of when the conversation was created. 0 if unset.
+        """
+        return self.__created_at
+
+    @property
+    def updated_at(self) -> int:
+        """
+        The unix timestamp of when the conversation was last updated.
+
+        Returns:
+            int: The unix timestamp of when the conversation was last updated. 0 if unset.
+        """
+        return self.__updated_at
+
+    @property
+    def waiting_since(self) -> int:
+        """
+        The unix timestamp of when the contact started waiting for a reply.
+
+        Returns:
+            int: The unix timestamp of when the contact started waiting for a reply. 0 if unset.
+        """
+        return self.__waiting_since
+
+    @property
+    def snoozed_until(self) -> int:
+        """
+        The unix timestamp of when the conversation will be unsnoozed.
+
+        Returns:
+            int: The unix timestamp of when the conversation will be unsnoozed. 0 if unset.
+        """
+        return self.__snoozed_until
+
+    @property
+    def open(self) -> bool:
+        """
+        Whether the conversation is open.
+
+        Returns:
+            bool: Whether the conversation is open. False if unset.
+        """
+        return self.__open
+
+    @property
+    def state(self) -> str:
+        """
+        The state of the conversation (open, closed or snoozed).
+
+        Returns:
+            str: The state of the conversation (open, closed or snoozed). Empty if unset.
+        """
+        return self.__state
+
+    @property
+    def read(self) -> bool:
+        """
+        Whether the last contact message has been read.
+
+        Returns:
+            bool: Whether the last contact message has been read. False if unset.
+        """
+        return self.__read
+
+    @property
+    def priority(self) -> str:
+        """
+        The priority of the conversation.
+
+        Returns:
+            str: The priority of the conversation. Empty if unset.
+        """
+        return self.__priority
+
+    @property
+    def admin_assignee_id(self) -> int:
+        """
+        The ID of the admin assigned to the conversation.
+
+        Returns:
+            int: The ID of the admin assigned to the conversation. 0 if unset.
+        """
+        return self.__admin_assignee_id
+
+    @property
+    def team_assignee_id(self) -> str:
+        """
+        The ID of the team assigned to the conversation.
+
+        Returns:
+            str: The ID of the team assigned to the conversation. Empty if unset.
+        """
+        return self.__team_assignee_id
+
+    @property
+    def custom_attributes(self) -> dict:
+        """
+        The custom attributes of the conversation.
+
+        Returns:
+            dict: The custom attributes of the conversation. Empty dict if unset.
+        """
+        return self.__custom_attributes
+
+    @property
+    def first_contact_reply(self) -> Optional[dict]:
+        """
+        The first reply of the contact in the conversation.
+
+        Returns:
+            dict: The first reply of the contact in the conversation. None if unset.
+        """
+        return self.__first_contact_reply
+
+    @property
+    def sla_applied(self) -> Optional[dict]:
+        """
+        The SLA applied to the conversation.
+
+        Returns:
+            dict: The SLA applied to the conversation. None if unset.
+        """
+        return self.__sla_applied
+
+    @property
+    def tags(self) -> Optional[dict]:
+        """
+        The tags applied to the conversation. Deserialized on first access when loaded lazily.
+
+        Returns:
+            dict: The tags applied to the conversation. None if unset.
+        """
+        return self.__get_nested('tags')
+
+    @property
+    def conversation_rating(self) -> Optional[dict]:
+        """
+        The rating given to the conversation. Deserialized on first access when loaded lazily.
+
+        Returns:
+            dict: The rating given to the conversation. None if unset.
+        """
+        return self.__get_nested('conversation_rating')
+
+    @property
+    def source(self) -> Optional[dict]:
+        """
+        The message that started the conversation. Deserialized on first access when loaded lazily.
+
+        Returns:
+            dict: The message that started the conversation. None if unset.
+        """
+        return self.__get_nested('source')
+
+    @property
+    def contacts(self) -> Optional[dict]:
+        """
+        The contacts participating in the conversation. Deserialized on first access when loaded lazily.
+
+        Returns:
+            dict: The contacts participating in the conversation. None if unset.
+        """
+        return self.__get_nested('contacts')
+
+    @property
+    def teammates(self) -> Optional[dict]:
+        """
+        The teammates participating in the conversation. Deserialized on first access when loaded lazily.
+
+        Returns:
+            dict: The teammates participating in the conversation. None if unset.
+        """
+        return self.__get_nested('teammates')
+
+    @property
+    def statistics(self) -> Optional[dict]:
+        """
+        The statistics of the conversation. Deserialized on first access when loaded lazily.
+
+        Returns:
+            dict: The statistics of the conversation. None if unset.
+        """
+        return self.__get_nested('statistics')
+
+    @property
+    def conversation_parts(self) -> Optional[dict]:
+        """
+        The parts of the conversation. Deserialized on first access when loaded lazily.
+
+        Returns:
+            dict: The parts of the conversation. None if unset.
+        """
+        return self.__get_nested('conversation_parts')
+
+    @property
+    def linked_objects(self) -> Optional[dict]:
+        """
+        The objects linked to the conversation. Deserialized on first access when loaded lazily.
+
+        Returns:
+            dict: The objects linked to the conversation. None if unset.
+        """
+        return self.__get_nested('linked_objects')
+
+    # Property Setters
+
+    @api_client.setter
+    def api_client(self, api_client: 'ConversationAPI'):
+        self._api_client = api_client
+
+    @type.setter
+    def type(self, value: str):
+        self.__type = value
+
+    @id.setter
+    def id(self, value: str):
+        self.__id = value
+
+    @title.setter
+    def title(self, value: str):
+        self.__title = value
+
+    @created_at.setter
+    def created_at(self, value: int):
+        self.__created_at = value
+
+    @updated_at.setter
+    def updated_at(self, value: int):
+        self.__updated_at = value
+
+    @waiting_since.setter
+    def waiting_since(self, value: int):
+        self.__waiting_since = value
+
+    @snoozed_until.setter
+    def snoozed_until(self, value: int):
+        self.__snoozed_until = value
+
+    @open.setter
+    def open(self, value: bool):
+        self.__open = value
+
+    @state.setter
+    def state(self, value: str):
+        self.__state = value
+
+    @read.setter
+    def read(self, value: bool):
+        self.__read = value
+
+    @priority.setter
+    def priority(self, value: str):
+        self.__priority = value
+
+    @admin_assignee_id.setter
+    def admin_assignee_id(self, value: int):
+        self.__admin_assignee_id = value
+
+    @team_assignee_id.setter
+    def team_assignee_id(self, value: str):
+        self.__team_assignee_id = value
+
+    @custom_attributes.setter
+    def custom_attributes(self, value: dict):
+        self.__custom_attributes = value
+
+    @first_contact_reply.setter
+    def first_contact_reply(self, value: Optional[dict]):
+        self.__first_contact_reply = value
+
+    @sla_applied.setter
+    def sla_applied(self, value: Optional[dict]):
+        self.__sla_applied = value
+
+    @tags.setter
+    def tags(self, value: Optional[dict]):
+        self.__nested['tags'] = value
+
+    @conversation_rating.setter
+    def conversation_rating(self, value: Optional[dict]):
+        self.__nested['conversation_rating'] = value
+
+    @source.setter
+    def source(self, value: Optional[dict]):
+        self.__nested['source'] = value
+
+    @contacts.setter
+    def contacts(self, value: Optional[dict]):
+        self.__nested['contacts'] = value
+
+    @teammates.setter
+    def teammates(self, value: Optional[dict]):
+        self.__nested['teammates'] = value
+
+    @statistics.setter
+    def statistics(self, value: Optional[dict]):
+        self.__nested['statistics'] = value
+
+    @conversation_parts.setter
+    def conversation_parts(self, value: Optional[dict]):
+        self.__nested['conversation_parts'] = value
+
+    @linked_objects.setter
+    def linked_objects(self, value: Optional[dict]):
+        self.__nested['linked_objects'] = value
+
+    # Methods
+
+    def iter_parts(self) -> Iterator[dict]:
+        """
+        Iterate over the parts of the conversation, one at a time.
+
+        When the parts have not been materialized yet (the conversation was loaded lazily,
+        or retrieved through `ConversationAPI.get_by_id`), each part is decoded and deserialized
+        only when it is reached, and none are cached. Prefer this over `conversation_parts`
+        for conversations with thousands of parts.
+
+        Yields:
+            dict: Each conversation part, as loaded by `ConversationPartSchema`.
+        """
+        value = self.__nested['conversation_parts']
+        if value is None:
+            return
+
+        if not isinstance(value, DeferredNested):
+            yield from value.get('conversation_parts') or []
+            return
+
+        schema = c_schemas.ConversationPartSchema()
+        for part in value.raw.get('conversation_parts') or []:
+            yield schema.load(part)
+
+    def is_loaded(self, name: str) -> bool:
+        """
+        Check whether a nested block has been deserialized.
+
+        Args:
+            name (str): The name of the nested block, e.g. 'conversation_parts'.
+
+        Returns:
+            bool: False if the block is still a deferred raw payload, True otherwise.
+        """
+        return not isinstance(self.__nested[name], DeferredNested)
+
+    def __get_nested(self, name: str):
+        """ Get a nested block, deserializing and caching it first if it was deferred. """
+        value = self.__nested[name]
+        if isinstance(value, DeferredNested):
+            value = value.load()
+            self.__nested[name] = value
+        return value
+
+
+class ConversationList(ModelBase):
+    """
+    Represents a page of Conversations, as returned by the list and search endpoints.
+
+    Attributes:
+        See the `ConversationListSchema` definition in `apis/conversation/schemas.py` for details.
+
+    Model-Specific Attributes:
+        api_client (ConversationAPI): The API Client Instance. Injected via APIProxyInterface
+    """
+    def __init__(self, *args, **kwargs):
+        self.__type: str = kwargs.get('type', '')
+        self.__conversations: List[Conversation] = kwargs.get('conversations', [])
+        self.__total_count: int = kwargs.get('total_count', 0)
+        self.__pages: dict = kwargs.get('pages', {})
+
+    # Properties
+
+    @property
+    def api_client(self) -> 'ConversationAPI':
+        """ Get the API Client Instance. """
+        return self._api_client
+
+    @property
+    def type(self) -> str:
+        """
+        The type of the conversation list.
+
+        Returns:
+            str: The type of the conversation list.
+        """
+        return self.__type
+
+    @property
+    def conversations(self) -> List[Conversation]:
+        """
+        The conversations in this page.
+
+        Returns:
+            List[Conversation]: The conversations in this page.
+        """
+        return self.__conversations
+
+    @property
+    def total_count(self) -> int:
+        """
+        The total number of conversations matching the request, across all pages.
+
+        Returns:
+            int: The total number of conversations.
+        """
+        return self.__total_count
+
+    @property
+    def pages(self) -> dict:
+        """
+        The pagination information of this page.
+
+        Returns:
+            dict: The pagination information of this page.
+        """
+        return self.__pages
+
+    @property
+    def starting_after(self) -> Optional[str]:
+        """
+        The cursor of the next page.
+
+        Returns:
+            str: The cursor to pass as `starting_after` to fetch the next page. None if this is the last page.
+        """
+        return (self.__pages.get('next') or {}).get('starting_after')
+
+    # Property Setters
+
+    @api_client.setter
+    def api_client(self, api_client: 'ConversationAPI'):
+        self._api_client = api_client
+
+    @conversations.setter
+    def conversations(self, conversations: List[Conversation]):
+        self.__conversations = conversations
+
+    @pages.setter
+    def pages(self, pages: dict):
+        self.__pages = pages
+
+    # Dunder Overrides
 
+    def __iter__(self):
+        return iter(self.__conversations)
 
+    def __getitem__(self, index):
+        return self.__conversations[index]
 
-   
\ No newline at end of file
+    def __len__(self):
+        return len(self.__conversations)
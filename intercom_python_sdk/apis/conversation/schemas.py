@@ -15,8 +15,11 @@ These schemas provide serialization/deserialization to and from the models defin
 import marshmallow
 from marshmallow import fields
 
+# From Current API
+from . import models as c_models
+
 # From Current Package
-from ...core.schema_base import SchemaBase
+from ...core.schema_base import SchemaBase, LazyNested
 
 
 class ContactSchema(SchemaBase):
@@ -56,6 +59,21 @@ class TagSchema(SchemaBase):
     def make(self, data, **kwargs):
         return data
 
+
+class TagListSchema(SchemaBase):
+    """ Schema for a list of tags.
+
+    Attributes:
+        type (str): The type of the tag list.
+        tags (list): A list of tags.
+    """
+    type = fields.Str()
+    tags = fields.List(fields.Nested(TagSchema))
+
+    @marshmallow.post_load
+    def make(self, data, **kwargs):
+        return data
+
 # Define other nested schemas for ConversationRating, Source, Teammate, and so on.
 
 class ConversationRatingSchema(SchemaBase):
@@ -259,8 +277,12 @@ class ConversationStatisticsSchema(SchemaBase):
     
 
 class ConversationSchema(SchemaBase):
-    #use the nested classes from the top 
     """ Schema for a conversation.
+
+    Nested blocks (`tags`, `conversation_rating`, `source`, `contacts`, `teammates`, `statistics`,
+    `conversation_parts` and `linked_objects`) are `LazyNested` fields. Loading with
+    `ConversationSchema(lazy=True)` keeps them as raw payloads until they are first accessed on
+    the resulting `Conversation`, which is considerably cheaper for bulk reads.
     """
     type = fields.Str(allow_none=True, required=False)
     id = fields.Str(allow_none=True, required=False)
@@ -275,23 +297,37 @@ class ConversationSchema(SchemaBase):
     priority = fields.Str(allow_none=True, required=False)
     admin_assignee_id = fields.Int(allow_none=True, required=False)
     team_assignee_id = fields.Str(allow_none=True, required=False)
-    tags = fields.Nested(TagSchema, allow_none=True, required=False)
-    conversation_rating = fields.Nested(ConversationRatingSchema, allow_none=True, required=False)
-    source = fields.Nested(ConversationSourceSchema, allow_none=True, required=False)
-    contacts = fields.Nested(ContactsSchema, allow_none=True, required=False)
-    teammates = fields.Nested(TeammatesSchema, allow_none=True, required=False)
+    tags = LazyNested(TagListSchema, allow_none=True, required=False)
+    conversation_rating = LazyNested(ConversationRatingSchema, allow_none=True, required=False)
+    source = LazyNested(ConversationSourceSchema, allow_none=True, required=False)
+    contacts = LazyNested(ContactsSchema, allow_none=True, required=False)
+    teammates = LazyNested(TeammatesSchema, allow_none=True, required=False)
     custom_attributes = fields.Dict(allow_none=True, required=False)
     first_contact_reply = fields.Dict(allow_none=True, required=False)
     sla_applied = fields.Dict(allow_none=True, required=False)
-    statistics = fields.Nested(ConversationStatisticsSchema, allow_none=True, required=False)
-    conversation_parts = fields.Nested(ConversationPartListSchema, allow_none=True, required=False)
-    linked_objects = fields.Nested(LinkedObjectsSchema, allow_none=True, required=False)
-    
+    statistics = LazyNested(ConversationStatisticsSchema, allow_none=True, required=False)
+    conversation_parts = LazyNested(ConversationPartListSchema, allow_none=True, required=False)
+    linked_objects = LazyNested(LinkedObjectsSchema, allow_none=True, required=False)
+
     @marshmallow.post_load
     def make(self, data, **kwargs):
-        return data
-    
+        return c_models.Conversation(**data)
 
 
+class ConversationListSchema(SchemaBase):
+    """ Schema for a page of conversations.
 
+    Attributes:
+        type (str): The type of the list.
+        conversations (list): The conversations in this page.
+        total_count (int): The total number of conversations.
+        pages (dict): The pagination information, including the `starting_after` cursor of the next page.
+    """
+    type = fields.Str()
+    conversations = fields.List(fields.Nested(ConversationSchema))
+    total_count = fields.Int()
+    pages = fields.Dict()
 
+    @marshmallow.post_load
+    def make(self, data, **kwargs):
+        return c_models.ConversationList(**data)
@@ -311,14 +311,16 @@ class DataAttribute(ModelBase):
     # Methods
     def update(self):
         """
-        Update the data attribute to match the current object.
+        Update the data attribute to match the current object, sending only the changed fields.
+        No request is sent if no field was changed.
         """
         if not (self.id and self.api_writable):
             raise ValueError('This data attribute is not writable.')
 
-        data = da_schemas.DataAttributeSchema().dump(self)
-        schema = da_schemas.DataAttributeSchema().load(data, partial=True)
-        self.api_client.update_by_id(self.id, schema)
+        changes = self.dump_changes(da_schemas.DataAttributeSchema)
+        if changes:
+            self.api_client.update_by_id(self.id, changes)
+        self.clear_changes()
 
 
 class DataAttributeList(ModelBase):
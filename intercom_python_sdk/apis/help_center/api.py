@@ -12,7 +12,7 @@ It is used to interact with the Intercom Help Center API [1] as defined in the I
 """
 
 # Built-ins
-from typing import Union, TYPE_CHECKING
+from typing import Iterator, Union, TYPE_CHECKING
 
 # External
 from uplink import (
@@ -32,11 +32,12 @@ from .schemas import (
 )
 
 if TYPE_CHECKING:
-    from .models import CollectionList
+    from .models import Collection, CollectionList, Section, SectionList
 
 # Intercom Python SDK
 from ...core.api_base import APIBase
 from ...core.errors import catch_api_error
+from ...core.pagination import iter_numbered_pages
 
 
 @response_handler(catch_api_error)
@@ -64,25 +65,48 @@ class HelpCenterAPI(APIBase):  # type: ignore
             CollectionList: A list of all Collections.
         """
 
-    def list_all_collections(self):
+    def list_all_collections(self, per_page: int = 50, max_workers: int = 4) -> 'CollectionList':
         """ List all Collections.
 
+        After the first page, the remaining pages are fetched concurrently.
+
+        Args:
+            per_page (int): The number of Collections to fetch per request.
+            max_workers (int): The number of pages fetched concurrently. Defaults to 4.
+
         Returns:
             CollectionList: A list of  all Collections.
         """
-        resp: 'CollectionList' = self.__list_all_collections()  # type: ignore
-        page = resp.pages['page']
-        total = resp.pages['total_pages']
-
-        if page == total:
-            return resp
-        
-        for page in range(page + 1, total + 1):
-            resp.collections.extend(self.__list_all_collections(page=page).collections)
-            resp.pages['page'] = page
+        pages = self.__iter_collection_pages(per_page, max_workers)
+        resp: 'CollectionList' = next(pages)
+        for page in pages:
+            resp.extend(page)
+            resp.pages['page'] = page.pages['page']
 
         return resp
 
+    def iter_collections(self, per_page: int = 50, max_workers: int = 4) -> Iterator['Collection']:
+        """ Iterate over all Collections, without holding them all in memory.
+
+        Pages are fetched concurrently, up to `max_workers` pages ahead of the iteration.
+
+        Args:
+            per_page (int): The number of Collections to fetch per request.
+            max_workers (int): The number of pages fetched concurrently. Defaults to 4.
+
+        Yields:
+            Collection: Each Collection, in order.
+        """
+        for page in self.__iter_collection_pages(per_page, max_workers):
+            yield from page
+
+    def __iter_collection_pages(self, per_page: int, max_workers: int) -> Iterator['CollectionList']:
+        return iter_numbered_pages(
+            lambda page: self.__list_all_collections(page=page, per_page=per_page),
+            lambda resp: (resp.pages or {}).get('total_pages', 1),
+            max_workers=max_workers
+        )
+
     @returns(CollectionSchema(many=False))  # type: ignore
     @json()
     @headers({"Content-Type": "application/x-www-form-urlencoded"})
@@ -135,9 +159,47 @@ class HelpCenterAPI(APIBase):  # type: ignore
 
     @returns(SectionListSchema(many=False))  # type: ignore
     @get("sections")
-    def list_all_sections(self):
+    def __list_all_sections(self, page: Query('page') = 1, per_page: Query('per_page') = 50):  # type: ignore
+        """ List a page of Sections. Internal method for `list_all_sections` and `iter_sections`. """
+
+    def list_all_sections(self, per_page: int = 50, max_workers: int = 4) -> 'SectionList':
         """ List all Sections.
 
+        After the first page, the remaining pages are fetched concurrently.
+
+        Args:
+            per_page (int): The number of Sections to fetch per request.
+            max_workers (int): The number of pages fetched concurrently. Defaults to 4.
+
         Returns:
             SectionList: A list of all Sections.
         """
+        pages = self.__iter_section_pages(per_page, max_workers)
+        resp: 'SectionList' = next(pages)
+        for page in pages:
+            resp.extend(page)
+            resp.pages['page'] = page.pages['page']
+
+        return resp
+
+    def iter_sections(self, per_page: int = 50, max_workers: int = 4) -> Iterator['Section']:
+        """ Iterate over all Sections, without holding them all in memory.
+
+        Pages are fetched concurrently, up to `max_workers` pages ahead of the iteration.
+
+        Args:
+            per_page (int): The number of Sections to fetch per request.
+            max_workers (int): The number of pages fetched concurrently. Defaults to 4.
+
+        Yields:
+            Section: Each Section, in order.
+        """
+        for page in self.__iter_section_pages(per_page, max_workers):
+            yield from page
+
+    def __iter_section_pages(self, per_page: int, max_workers: int) -> Iterator['SectionList']:
+        return iter_numbered_pages(
+            lambda page: self.__list_all_sections(page=page, per_page=per_page),
+            lambda resp: (resp.pages or {}).get('total_pages', 1),
+            max_workers=max_workers
+        )
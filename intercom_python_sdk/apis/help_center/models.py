@@ -11,13 +11,13 @@ These models provide object oriented interfaces for the schemas defined in `apis
 """
 
 # External
-from typing import Union, TYPE_CHECKING, Optional as Opt
+from typing import Iterable, Union, TYPE_CHECKING, Optional as Opt
 
 # From Current API
 from . import schemas as hc_schemas
 
 # From Current Package
-from ...core.model_base import ModelBase
+from ...core.model_base import IdIndex, ModelBase
 
 # Type Check Imports - TYPE_CHECKING is assumed True by type-checkers but is False at runtime.
 # See: https://docs.python.org/3/library/typing.html#typing.TYPE_CHECKING
@@ -185,10 +185,14 @@ class Collection(ModelBase):
         self.__parent_id = parent_id
 
     def update(self):
-        """ Update the Collection. """
-        data = hc_schemas.CollectionSchema().dump(self)
-        schema = hc_schemas.CollectionSchema().load(data)
-        self.api_client.update_collection_by_id(self.id, schema)
+        """
+        Update the Collection, sending only the fields changed since it was loaded.
+        No request is sent if no field was changed.
+        """
+        changes = self.dump_changes(hc_schemas.CollectionSchema)
+        if changes:
+            self.api_client.update_collection_by_id(self.id, changes)
+        self.clear_changes()
 
         return self
 
@@ -199,6 +203,7 @@ class CollectionList(ModelBase):
         self.__data: list = kwargs.get('data', [])
         self.__total_count: int = kwargs.get('total_count', 0)
         self.__pages: dict = kwargs.get('pages', {})
+        self.__index = IdIndex()
 
     # Properties
     @property
@@ -250,11 +255,13 @@ class CollectionList(ModelBase):
     @data.setter
     def data(self, data: list):
         self.__data = data
+        self.__index.invalidate()
 
     @collections.setter
     def collections(self, collections: list):
         """ Alias for data """
         self.__data = collections
+        self.__index.invalidate()
 
     @total_count.setter
     def total_count(self, total_count: int):
@@ -273,9 +280,15 @@ class CollectionList(ModelBase):
         Returns:
             Collection: The Collection with the given ID.
         """
-        return next(
-            (collection for collection in self.data if collection.id == id), None
-        )
+        return self.__index.get(self.data, id)
+
+    def extend(self, collections: 'Iterable[Collection]'):
+        """ Extend the CollectionList with Collections not already in it, e.g. from another CollectionList.
+
+        Args:
+            collections (Iterable[Collection]): The Collections to add.
+        """
+        self.__index.extend(self.data, collections)
 
     def __iter__(self):
         return iter(self.data)
@@ -285,6 +298,7 @@ class CollectionList(ModelBase):
 
     def __setitem__(self, index, value: 'Collection'):
         self.data[index] = value
+        self.__index.invalidate()
 
     def __len__(self):
         return len(self.data)
@@ -431,6 +445,7 @@ class SectionList(ModelBase):
         self.__data: list = kwargs.get('data', [])
         self.__total_count = kwargs.get('total_count', int())
         self.__pages = kwargs.get('pages', int())
+        self.__index = IdIndex()
 
     # Properties
     @property
@@ -477,6 +492,7 @@ class SectionList(ModelBase):
     @data.setter
     def data(self, data: list):
         self.__data = data
+        self.__index.invalidate()
 
     @total_count.setter
     def total_count(self, total_count: int):
@@ -485,3 +501,46 @@ class SectionList(ModelBase):
     @pages.setter
     def pages(self, pages: dict):
         self.__pages = pages
+
+    @property
+    def sections(self) -> list:
+        """ Alias for data """
+        return self.__data
+
+    @sections.setter
+    def sections(self, sections: list):
+        """ Alias for data """
+        self.__data = sections
+        self.__index.invalidate()
+
+    def get_by_id(self, id: Union[str, int]):
+        """ Get a Section by ID.
+
+        Args:
+            id (Union[str, int]): The ID of the Section.
+
+        Returns:
+            Section: The Section with the given ID.
+        """
+        return self.__index.get(self.data, id)
+
+    def extend(self, sections: 'Iterable[Section]'):
+        """ Extend the SectionList with Sections not already in it, e.g. from another SectionList.
+
+        Args:
+            sections (Iterable[Section]): The Sections to add.
+        """
+        self.__index.extend(self.data, sections)
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    def __setitem__(self, index, value: 'Section'):
+        self.data[index] = value
+        self.__index.invalidate()
+
+    def __len__(self):
+        return len(self.data)
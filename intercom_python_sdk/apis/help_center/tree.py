@@ -0,0 +1,265 @@
+"""
+# Help Center Tree
+
+`apis/help_center/tree.py`
+
+This module contains the HelpCenterTree class, which joins the Collections and Sections of the
+Help Center API with the Articles of the Articles API into a single navigable tree.
+
+## Example Usage
+
+```python
+from intercom_python_sdk import Intercom
+from intercom_python_sdk.apis.help_center.tree import HelpCenterTree
+
+intercom = Intercom('my_api_key')
+
+tree = HelpCenterTree.fetch(intercom.help_center, intercom.articles)
+
+for collection in tree.roots():
+    for child in tree.children(collection):  # Sub-collections, sections and articles
+        print(child.id)
+
+article = tree.article(1234567890)
+print(' > '.join(node.name if hasattr(node, 'name') else node.title for node in tree.breadcrumb(article)))
+
+changes = tree.refresh(intercom.help_center, intercom.articles)  # Only re-indexes changed nodes
+```
+"""
+# Built-ins
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    TYPE_CHECKING
+)
+
+# From Current API
+from .models import Collection, Section
+
+# From Current Package
+from ..articles.models import Article
+from ...core.concurrency import ContextThreadPoolExecutor
+
+if TYPE_CHECKING:
+    from .api import HelpCenterAPI
+    from ..articles.api import ArticlesAPI
+
+Node = Union[Collection, Section, Article]
+NodeKey = Tuple[str, str]
+
+COLLECTION = 'collection'
+SECTION = 'section'
+ARTICLE = 'article'
+
+_KINDS = {Collection: COLLECTION, Section: SECTION, Article: ARTICLE}
+
+
+@dataclass
+class TreeChanges:
+    """
+    The nodes changed by `HelpCenterTree.refresh`, as `(kind, id)` keys.
+    """
+    added: List[NodeKey] = field(default_factory=list)
+    updated: List[NodeKey] = field(default_factory=list)
+    removed: List[NodeKey] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.added or self.updated or self.removed)
+
+
+class HelpCenterTree:
+    """
+    The Collections, Sections and Articles of a Help Center, indexed by ID and by parent.
+
+    The indexes are built once, so that looking up a node, its parent or its children is O(1),
+    and a breadcrumb is O(depth).
+
+    Nodes are identified by `(kind, id)` keys, kind being 'collection', 'section' or 'article',
+    as IDs are only unique within a kind. IDs are normalized to strings.
+
+    Args:
+        collections (Iterable[Collection]): The Collections of the Help Center.
+        sections (Iterable[Section]): The Sections of the Help Center.
+        articles (Iterable[Article]): The Articles of the Help Center.
+    """
+
+    def __init__(self, collections: Iterable[Collection] = (), sections: Iterable[Section] = (),
+                 articles: Iterable[Article] = ()):
+        self._nodes: Dict[NodeKey, Node] = {}
+        self._parents: Dict[NodeKey, Optional[NodeKey]] = {}
+        # Children are kept in dicts (rather than lists) for O(1) removal, in insertion order.
+        self._children: Dict[Optional[NodeKey], Dict[NodeKey, None]] = defaultdict(dict)
+
+        for kind, nodes in ((COLLECTION, collections), (SECTION, sections), (ARTICLE, articles)):
+            for node in nodes:
+                self._put(kind, node)
+
+    @classmethod
+    def fetch(cls, help_center: 'HelpCenterAPI', articles: 'ArticlesAPI') -> 'HelpCenterTree':
+        """ Fetch the Collections, Sections and Articles concurrently, and index them.
+
+        Args:
+            help_center (HelpCenterAPI): The Help Center API client, e.g. `intercom.help_center`.
+            articles (ArticlesAPI): The Articles API client, e.g. `intercom.articles`.
+
+        Returns:
+            HelpCenterTree: The tree of the Help Center.
+        """
+        return cls(*cls._fetch_all(help_center, articles))
+
+    @staticmethod
+    def _fetch_all(help_center: 'HelpCenterAPI', articles: 'ArticlesAPI') -> Tuple[list, list, list]:
+        with ContextThreadPoolExecutor(max_workers=3, thread_name_prefix='intercom-help-center') as executor:
+            collections = executor.submit(help_center.list_all_collections)
+            sections = executor.submit(help_center.list_all_sections)
+            article_list = executor.submit(articles.list_all)
+            return collections.result().data, sections.result().data, article_list.result().data
+
+    # Lookups
+
+    @staticmethod
+    def key(node: Node) -> NodeKey:
+        """ The `(kind, id)` key of a node. """
+        return _KINDS[type(node)], str(node.id)
+
+    def get(self, kind: str, id: Union[str, int]) -> Optional[Node]:
+        """ Get a node by kind and ID, or None if it is not in the tree. """
+        return self._nodes.get((kind, str(id)))
+
+    def collection(self, id: Union[str, int]) -> Optional[Collection]:
+        """ Get a Collection by ID. """
+        return self._nodes.get((COLLECTION, str(id)))  # type: ignore
+
+    def section(self, id: Union[str, int]) -> Optional[Section]:
+        """ Get a Section by ID. """
+        return self._nodes.get((SECTION, str(id)))  # type: ignore
+
+    def article(self, id: Union[str, int]) -> Optional[Article]:
+        """ Get an Article by ID. """
+        return self._nodes.get((ARTICLE, str(id)))  # type: ignore
+
+    # Navigation
+
+    def roots(self) -> List[Node]:
+        """ The nodes without a parent: top-level Collections, and Articles not in any Collection. """
+        return [self._nodes[key] for key in self._children.get(None, ())]
+
+    def children(self, node: Optional[Node]) -> List[Node]:
+        """ The direct children of a node: sub-Collections, Sections and Articles. None for the roots. """
+        parent = None if node is None else self.key(node)
+        return [self._nodes[key] for key in self._children.get(parent, ())]
+
+    def parent(self, node: Node) -> Optional[Node]:
+        """ The parent of a node, or None if it is a root, or if its parent is not in the tree. """
+        parent = self._parents.get(self.key(node))
+        return self._nodes.get(parent) if parent else None
+
+    def breadcrumb(self, node: Node) -> List[Node]:
+        """ The ancestors of a node, from the root down to the node itself. """
+        trail = [node]
+        seen = {self.key(node)}
+        parent = self._parents.get(self.key(node))
+        while parent and parent in self._nodes and parent not in seen:
+            seen.add(parent)
+            trail.append(self._nodes[parent])
+            parent = self._parents.get(parent)
+
+        trail.reverse()
+        return trail
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, node: Node):
+        return self._nodes.get(self.key(node)) is not None
+
+    def __iter__(self):
+        return iter(self._nodes.values())
+
+    # Refreshing
+
+    def refresh(self, help_center: 'HelpCenterAPI', articles: 'ArticlesAPI') -> TreeChanges:
+        """ Refresh the tree from the API, re-indexing only the nodes which changed.
+
+        The listings are fetched again (concurrently), but only nodes which are new, were removed,
+        or whose `updated_at` changed are replaced in the tree. Unchanged nodes keep their identity.
+
+        Args:
+            help_center (HelpCenterAPI): The Help Center API client.
+            articles (ArticlesAPI): The Articles API client.
+
+        Returns:
+            TreeChanges: The keys of the added, updated and removed nodes.
+        """
+        collections, sections, article_list = self._fetch_all(help_center, articles)
+        return self.apply(collections, sections, article_list)
+
+    def apply(self, collections: Iterable[Collection], sections: Iterable[Section],
+              articles: Iterable[Article]) -> TreeChanges:
+        """ Update the tree to match the given nodes, re-indexing only the nodes which changed.
+
+        Args:
+            collections (Iterable[Collection]): All the Collections of the Help Center.
+            sections (Iterable[Section]): All the Sections of the Help Center.
+            articles (Iterable[Article]): All the Articles of the Help Center.
+
+        Returns:
+            TreeChanges: The keys of the added, updated and removed nodes.
+        """
+        changes = TreeChanges()
+        seen = set()
+
+        for kind, nodes in ((COLLECTION, collections), (SECTION, sections), (ARTICLE, articles)):
+            for node in nodes:
+                key = (kind, str(node.id))
+                seen.add(key)
+                current = self._nodes.get(key)
+                if current is None:
+                    changes.added.append(key)
+                elif current.updated_at is None or current.updated_at != node.updated_at:
+                    changes.updated.append(key)
+                else:
+                    continue
+                self._put(kind, node)
+
+        for key in [key for key in self._nodes if key not in seen]:
+            self._remove(key)
+            changes.removed.append(key)
+
+        return changes
+
+    # Indexing
+
+    def _put(self, kind: str, node: Node):
+        """ Add or replace a node, moving it under its new parent if it changed. """
+        key = (kind, str(node.id))
+        parent = self._parent_key(kind, node)
+
+        if key in self._parents and self._parents[key] != parent:
+            self._children[self._parents[key]].pop(key, None)
+
+        self._nodes[key] = node
+        self._parents[key] = parent
+        self._children[parent][key] = None
+
+    def _remove(self, key: NodeKey):
+        """ Remove a node. Its children stay indexed under it, and are re-attached if it is added back. """
+        del self._nodes[key]
+        self._children[self._parents.pop(key)].pop(key, None)
+
+    @staticmethod
+    def _parent_key(kind: str, node: Any) -> Optional[NodeKey]:
+        if kind == COLLECTION:
+            return (COLLECTION, str(node.parent_id)) if node.parent_id else None
+        if kind == SECTION:
+            return (COLLECTION, str(node.collection_id)) if node.collection_id else None
+        if node.parent_id and node.parent_type in (COLLECTION, SECTION):
+            return node.parent_type, str(node.parent_id)
+        return None
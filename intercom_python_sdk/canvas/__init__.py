@@ -1,3 +1,5 @@
 from .builder import CanvasBuilder
 from .components import *
 from .response_parser import CanvasResponseParser, CanvasResponse
+from .template import CanvasTemplate, Placeholder
+from .asgi import CanvasApp, InvalidCanvasRequest, UnknownComponent
@@ -0,0 +1,198 @@
+import asyncio
+import inspect
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from marshmallow import ValidationError
+
+from .builder import CanvasBuilder
+from .response_parser import CanvasResponse, CanvasResponseParser
+from .schemas import CanvasResponseSchema
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+HandlerResult = Union[CanvasBuilder, Dict, bytes, str]
+Handler = Callable[[CanvasResponse], Union[HandlerResult, Awaitable[HandlerResult]]]
+
+
+class InvalidCanvasRequest(ValueError):
+    """ Raised when a request body is not a valid Canvas Kit request. """
+
+
+class UnknownComponent(LookupError):
+    """ Raised when no handler is registered for the component of a request. """
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serializes an object to compact JSON bytes, using `orjson` if it is installed
+    (`pip install intercom-python-sdk[fast]`).
+
+    :param obj: The object to serialize.
+    :return: The JSON bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+class CanvasApp:
+    """
+    A framework-agnostic ASGI application serving Canvas Kit requests.
+
+    Each request body is parsed with `CanvasResponseParser`, and dispatched to the handler
+    registered for its `component_id` (or to the default handler). Handlers receive the
+    `CanvasResponse`, and return either a `CanvasBuilder`, a response dictionary, or an
+    already serialized JSON response (e.g. from `CanvasTemplate.render_bytes`).
+
+    Example:
+        app = CanvasApp()
+
+        @app.handler()  # Initialize requests, and any component without a handler
+        def initialize(request):
+            return CanvasBuilder().add_header("Hello").add_submit_button()
+
+        @app.handler("submit")
+        async def submit(request):
+            return CanvasBuilder().add_text(TextParameters(text=f"Thanks {request.input_values['name']}"))
+
+    It can be served by any ASGI server (e.g. `uvicorn module:app`), or mounted in any ASGI framework.
+
+    :param validate: Whether to validate the responses returned by handlers against `CanvasResponseSchema`,
+        e.g. while developing handlers. Already serialized responses are not validated. Defaults to False.
+    :param sync_in_thread: Whether to call synchronous handlers in a worker thread, so that they may block
+        without stalling the event loop. Set to False for handlers which only build canvases. Defaults to True.
+    """
+
+    def __init__(self, validate: bool = False, sync_in_thread: bool = True):
+        self.validate = validate
+        self.sync_in_thread = sync_in_thread
+        self._handlers: Dict[Optional[str], Handler] = {}
+        self._schema = CanvasResponseSchema()
+
+    def handler(self, component_id: Optional[str] = None) -> Callable[[Handler], Handler]:
+        """
+        Decorator registering a handler. See `register`.
+
+        :param component_id: The component to handle. Defaults to None, the default handler.
+        :return: The decorator.
+        """
+        def decorator(func: Handler) -> Handler:
+            self.register(component_id, func)
+            return func
+        return decorator
+
+    def register(self, component_id: Optional[str], func: Handler):
+        """
+        Registers a handler, sync or async, for requests from a component.
+
+        :param component_id: The ID of the component to handle, or None for the default handler,
+            which handles initialize requests and components without a handler of their own.
+        :param func: The handler.
+        """
+        self._handlers[component_id] = func
+
+    async def handle(self, body: bytes) -> bytes:
+        """
+        Handles a Canvas Kit request body, without going through ASGI.
+
+        :param body: The raw JSON request body.
+        :return: The JSON response body.
+        :raises InvalidCanvasRequest: If the body is not a valid Canvas Kit request.
+        :raises UnknownComponent: If no handler is registered for the request.
+        :raises marshmallow.ValidationError: If the handler returned an invalid response.
+        """
+        try:
+            request = CanvasResponseParser.parse_bytes(body)
+        except (ValueError, AttributeError) as e:  # Invalid JSON, or not a JSON object
+            raise InvalidCanvasRequest(str(e)) from e
+
+        func = self._handlers.get(request.component_id) or self._handlers.get(None)
+        if func is None:
+            raise UnknownComponent(f"No handler registered for component {request.component_id!r}")
+
+        if inspect.iscoroutinefunction(func):
+            result = await func(request)
+        elif self.sync_in_thread:
+            result = await asyncio.to_thread(func, request)
+        else:
+            result = func(request)
+
+        return self.serialize(result)
+
+    def serialize(self, result: HandlerResult) -> bytes:
+        """
+        Serializes the result of a handler.
+
+        :param result: The result of the handler.
+        :return: The JSON response body.
+        """
+        if isinstance(result, bytes):
+            return result
+        if isinstance(result, str):
+            return result.encode("utf-8")
+        if isinstance(result, CanvasBuilder):
+            result = result.build()
+
+        if self.validate:
+            errors = self._schema.validate(result)
+            if errors:
+                raise ValidationError(errors)
+
+        return dumps(result)
+
+    async def __call__(self, scope: Dict, receive: Callable, send: Callable):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+
+        if scope["type"] != "http":
+            raise ValueError(f"Unsupported ASGI scope type {scope['type']!r}")
+
+        if scope["method"] != "POST":
+            await self._respond(send, 405, b'{"error":"Method not allowed"}')
+            return
+
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+
+        try:
+            response = await self.handle(b"".join(chunks))
+        except InvalidCanvasRequest:
+            await self._respond(send, 400, b'{"error":"Invalid request body"}')
+            return
+        except UnknownComponent:
+            await self._respond(send, 404, b'{"error":"No handler for this component"}')
+            return
+
+        await self._respond(send, 200, response)
+
+    @staticmethod
+    async def _respond(send: Callable, status: int, body: bytes):
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    async def _lifespan(receive: Callable, send: Callable):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
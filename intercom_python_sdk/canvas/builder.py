@@ -1,42 +1,79 @@
+import json
+from dataclasses import replace
 from typing import Dict, Any, Optional
-from copy import deepcopy
 from . import components as cmps
+from .template import CanvasTemplate
 
 
 class CanvasBuilder:
     """
     This class is used to build a Canvas for Intercom Canvas Kit.
     Reference: https://developers.intercom.com/docs/canvas-kit/
-    """
 
-    _INITIAL_CANVAS: Dict = {"canvas": {"content": {"components": []}}}
+    Components are converted to dicts, with None values omitted, as they are added, and are never
+    modified afterwards. `build` therefore only copies the containers around them, and `build_json`
+    serializes the canvas once until it is next modified through the builder.
+
+    The values given to the builder (stored data values, lists of options, ...) are kept by reference,
+    and must not be modified in place afterwards: `build_json` would keep returning their previous
+    serialization. To change a value, set it again, e.g. with `set_stored_data`.
+    """
 
     def __init__(self):
-        self._current_build = deepcopy(self._INITIAL_CANVAS)
+        self._current_build = self._new_canvas()
+        self._json: Optional[str] = None
+
+    @staticmethod
+    def _new_canvas() -> Dict:
+        return {"canvas": {"content": {"components": []}}}
 
     def build(self) -> Dict:
         """
-        Returns a deep copy of the canvas as a dictionary. Removes None values.
+        Returns the canvas as a dictionary. None values are omitted.
+
+        The containers are copied, so the builder may be reused, but the component dicts and
+        stored data values are shared with the builder and must not be modified.
 
         :return: The final canvas as a dictionary
         """
-        current_build_copy = deepcopy(self._current_build)
-        components = current_build_copy["canvas"]["content"]["components"]
-        new_components = []
+        canvas = self._current_build["canvas"]
+        final_canvas = {"content": {"components": list(canvas["content"]["components"])}}
+        if "stored_data" in canvas:
+            final_canvas["stored_data"] = dict(canvas["stored_data"])
+
+        return {"canvas": final_canvas}
 
-        for component in components:
-            new_component = {k: v for k, v in component.items() if v is not None}
-            new_components.append(new_component)
+    def build_json(self) -> str:
+        """
+        Returns the canvas serialized as compact JSON.
 
-        current_build_copy["canvas"]["content"]["components"] = new_components
+        The result is cached until the canvas is modified through the builder, so that a builder kept
+        around for a static canvas is only serialized once. Values changed in place are not detected,
+        see the class documentation. Use `freeze` if the canvas contains Placeholders.
 
-        return current_build_copy
+        :return: The final canvas as a JSON string
+        """
+        if self._json is None:
+            self._json = json.dumps(self._current_build, separators=(",", ":"))
+        return self._json
+
+    def freeze(self) -> CanvasTemplate:
+        """
+        Precompiles the canvas into a template, to be rendered with per-request values.
+
+        Use `Placeholder` objects in place of the values that change between requests.
+        The builder is left untouched and may be reused.
+
+        :return: The CanvasTemplate of the canvas.
+        """
+        return CanvasTemplate(self._current_build)
 
     def reset(self):
         """
         Resets the canvas to its initial state.
         """
-        self._current_build = deepcopy(self._INITIAL_CANVAS)
+        self._current_build = self._new_canvas()
+        self._json = None
 
     ### Wrappers around other methods/components ###
 
@@ -50,10 +87,10 @@ class CanvasBuilder:
         :param options: The text options for the header. Text and style parameters are ignored.
         :return: The CanvasBuilder instance.
         """
-        options_copy = deepcopy(options) if options else cmps.TextParameters()
-        options_copy.text = text
-        options_copy.style = cmps.TextStyle.HEADER
-        self.add_text(options_copy)
+        header_options = replace(
+            options or cmps.TextParameters(), text=text, style=cmps.TextStyle.HEADER
+        )
+        self.add_text(header_options)
         return self
 
     def add_submit_button(
@@ -196,16 +233,20 @@ class CanvasBuilder:
         Sets the stored data of the canvas.
 
         :param key: The key of the stored data.
-        :param value: The value of the stored data.
+        :param value: The value of the stored data. Kept by reference: set it again rather than modifying it in place.
         :return: The CanvasBuilder instance.
         """
         self._current_build["canvas"].setdefault("stored_data", {})[key] = value
+        self._json = None
         return self
 
     def _append_component(self, component: Dict):
         """
-        Appends a component to the canvas.
+        Appends a component to the canvas, omitting its None values.
 
         :param component: The component to append to the canvas.
         """
-        self._current_build["canvas"]["content"]["components"].append(component)
+        self._current_build["canvas"]["content"]["components"].append(
+            {k: v for k, v in component.items() if v is not None}
+        )
+        self._json = None
@@ -1,6 +1,6 @@
-from typing import Dict, Optional
+import json
+from typing import Dict, Optional, Union
 from dataclasses import dataclass
-from copy import deepcopy
 
 
 @dataclass
@@ -19,9 +19,24 @@ class CanvasResponseParser:
         """
         Initializes a new CanvasResponseParser instance.
 
-        :param canvas: The canvas response JSON object.
+        :param canvas: The canvas response JSON object. It is only read, never copied or modified,
+            so the parsed values are shared with it.
         """
-        self._canvas = deepcopy(canvas)
+        self._canvas = canvas
+
+    @classmethod
+    def parse_bytes(cls, body: Union[bytes, str]) -> CanvasResponse:
+        """
+        Parses the canvas response straight from the raw request body.
+
+        Only `component_id`, `input_values` and `current_canvas.stored_data` are kept;
+        the rest of the payload (the components of the current canvas, the context, etc.)
+        is released as soon as the body is parsed.
+
+        :param body: The raw JSON body of the Canvas Kit request.
+        :return: The CanvasResponse object.
+        """
+        return cls(json.loads(body)).parse()
 
     def parse(self) -> CanvasResponse:
         """
@@ -0,0 +1,68 @@
+from marshmallow import Schema, fields, validate, INCLUDE, RAISE
+
+
+COMPONENT_TYPES = (
+    "button",
+    "checkbox",
+    "data-table",
+    "datepicker",
+    "divider",
+    "dropdown",
+    "image",
+    "input",
+    "list",
+    "single-select",
+    "spacer",
+    "text",
+    "textarea",
+)
+
+
+class ComponentSchema(Schema):
+    """
+    Validates a component of a canvas. Only its type is checked; other keys are passed through.
+
+    References:
+    https://developers.intercom.com/docs/references/canvas-kit/interactivecomponents/button/
+    """
+
+    class Meta:
+        unknown = INCLUDE
+
+    type = fields.Str(required=True, validate=validate.OneOf(COMPONENT_TYPES))
+    id = fields.Str(allow_none=False)
+
+
+class ContentSchema(Schema):
+    class Meta:
+        unknown = RAISE
+
+    components = fields.List(fields.Nested(ComponentSchema), required=True)
+
+
+class CanvasSchema(Schema):
+    """
+    Validates a canvas, as returned by `CanvasBuilder.build`.
+
+    References:
+    https://developers.intercom.com/docs/references/canvas-kit/responseobjects/canvas/
+    """
+
+    class Meta:
+        unknown = RAISE
+
+    content = fields.Nested(ContentSchema)
+    content_url = fields.Url()
+    stored_data = fields.Dict(keys=fields.Str())
+
+
+class CanvasResponseSchema(Schema):
+    """
+    Validates the response to a Canvas Kit request.
+    """
+
+    class Meta:
+        unknown = RAISE
+
+    canvas = fields.Nested(CanvasSchema, required=True)
+    event = fields.Dict()  # e.g. {"type": "completed"}, to end a messenger app flow
@@ -0,0 +1,111 @@
+import json
+import re
+import uuid
+from typing import Any, Dict, List, Tuple
+
+
+_ENCODE = json.JSONEncoder(separators=(",", ":")).encode
+_MISSING = object()
+
+
+class Placeholder:
+    """
+    A named value to be filled in when rendering a CanvasTemplate.
+
+    Use it in place of any component or stored data value (e.g. a text, a label,
+    an input value) when building the canvas, then freeze the builder into a template.
+
+    :param name: The name of the value, passed as a keyword argument to `CanvasTemplate.render`.
+    :param default: The value used when none is given at render time. Required if omitted.
+    """
+
+    __slots__ = ("name", "default")
+
+    def __init__(self, name: str, default: Any = _MISSING):
+        self.name = name
+        self.default = default
+
+    def __repr__(self):
+        return f"Placeholder({self.name!r})"
+
+
+class CanvasTemplate:
+    """
+    A canvas precompiled to JSON, rendered with per-request values for its placeholders.
+
+    The canvas is serialized once, when the template is created, and split around its placeholders.
+    Rendering only serializes the placeholder values and joins them with the static segments,
+    so its cost does not depend on the number of components.
+
+    Placeholder values are inserted as is: a value of None renders as `null` rather than being omitted.
+
+    :param canvas: The canvas as a dictionary, as returned by `CanvasBuilder.build`, containing Placeholders.
+    """
+
+    def __init__(self, canvas: Dict):
+        token = uuid.uuid4().hex
+        placeholders: List[Placeholder] = []
+
+        def mark(value):
+            if isinstance(value, Placeholder):
+                placeholders.append(value)
+                return f"{token}:{len(placeholders) - 1}"
+            if isinstance(value, dict):
+                return {k: mark(v) for k, v in value.items()}
+            if isinstance(value, list):
+                return [mark(v) for v in value]
+            return value
+
+        parts = re.split(f'"{token}:(\\d+)"', _ENCODE(mark(canvas)))
+
+        # Even parts are static JSON, odd parts the index of the placeholder in between.
+        self._segments: Tuple[str, ...] = tuple(parts[::2])
+        self._slots: Tuple[Placeholder, ...] = tuple(placeholders[int(index)] for index in parts[1::2])
+        self._names = frozenset(placeholder.name for placeholder in placeholders)
+
+    @property
+    def placeholders(self) -> frozenset:
+        """ The names of the placeholders of the template. """
+        return self._names
+
+    def render(self, **values: Any) -> str:
+        """
+        Renders the canvas as a JSON string.
+
+        :param values: The value of each placeholder, by name. Must be JSON serializable.
+        :return: The canvas as a JSON string.
+        :raises KeyError: If no value is given for a placeholder without default.
+        :raises TypeError: If a value is given for an unknown placeholder.
+        """
+        unknown = values.keys() - self._names
+        if unknown:
+            raise TypeError(f"Unknown placeholders: {', '.join(sorted(unknown))}")
+
+        segments = self._segments
+        out = [segments[0]]
+        for index, placeholder in enumerate(self._slots, 1):
+            value = values.get(placeholder.name, placeholder.default)
+            if value is _MISSING:
+                raise KeyError(placeholder.name)
+            out.append(_ENCODE(value))
+            out.append(segments[index])
+
+        return "".join(out)
+
+    def render_bytes(self, **values: Any) -> bytes:
+        """
+        Renders the canvas as UTF-8 encoded JSON, e.g. to be written straight to a response body.
+
+        :param values: The value of each placeholder, by name. See `render`.
+        :return: The canvas as JSON bytes.
+        """
+        return self.render(**values).encode("utf-8")
+
+    def render_dict(self, **values: Any) -> Dict:
+        """
+        Renders the canvas as a dictionary.
+
+        :param values: The value of each placeholder, by name. See `render`.
+        :return: The canvas as a dictionary.
+        """
+        return json.loads(self.render(**values))
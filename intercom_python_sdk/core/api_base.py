@@ -5,6 +5,11 @@
 
 Contains the core base classes and methodsfor all API classes in the Intercom Python SDK.
 """
+# Built-ins
+import time
+from contextlib import ExitStack, nullcontext
+from types import GeneratorType
+
 # Third-Party Imports
 from uplink import (
     Consumer,
@@ -14,6 +19,7 @@ from uplink import (
 # Local Imports
 from .configuration import Configuration
 from .model_base import ModelBase
+from .profiling import layer
 
 
 class APIProxyInterface:
@@ -48,6 +54,13 @@ class APIProxyInterface:
         """
         self.api_object = api_class(config)
 
+    @classmethod
+    def wrap(cls, api_object):
+        """ Create a proxy for an existing API object, such as one shared by several proxies. """
+        proxy = cls.__new__(cls)
+        proxy.api_object = api_object
+        return proxy
+
     def __dir__(self):
         """ Proxy the dir() method to the API object. """
         return dir(self.api_object)
@@ -60,7 +73,7 @@ class APIProxyInterface:
         attr = getattr(api_object, item)
         if callable(attr):
             # This is where we wrap the callable to intercept the result
-            return object.__getattribute__(self, '_wrap_callable')(attr)
+            return object.__getattribute__(self, '_wrap_callable')(attr, item)
         else:
             return attr
 
@@ -78,18 +91,80 @@ class APIProxyInterface:
     def __repr__(self):
         return repr(f"<{object.__getattribute__(self, '__class__').__name__}> - {self.api_object}")
 
-    def _wrap_callable(self, method):
+    def _wrap_callable(self, method, name):
         """
         Wraps callable method to intercept the result.
         If the result is a model object, inject the API client into the model object.
+        If the result is a generator, inject into each item as it is yielded.
+        The call is measured and traced, when enabled in the configuration.
         """
         def wrapped(*args, **kwargs):
+            config = self.api_object.config
+            metrics, tracing = getattr(config, 'metrics', None), getattr(config, 'tracing', None)
+            profiling = getattr(config, 'profiling', None)
+            if metrics is None and tracing is None and profiling is None:
+                return call(*args, **kwargs)
+
+            with ExitStack() as stack:
+                if profiling is not None:
+                    stack.enter_context(profiling.call(api_name(self.api_object), name))
+                scope = stack.enter_context(metrics.scope()) if metrics is not None else None
+                call_span = stack.enter_context(tracing.call_span(api_name(self.api_object), name)) \
+                    if tracing is not None else None
+                return call(*args, scope=scope, tracing=tracing, call_span=call_span, **kwargs)
+
+        def call(*args, scope=None, tracing=None, call_span=None, **kwargs):
             result = method(*args, **kwargs)
+            if isinstance(result, GeneratorType):
+                return object.__getattribute__(self, '_wrap_generator')(
+                    result, name, call_span.hand_over() if call_span is not None else None)
+            started = time.perf_counter()
             inject_into_instances = object.__getattribute__(self, '_inject_into_instances')
-            inject_into_instances(result, ModelBase, 'api_client', self.api_object)
+            with tracing.span('intercom.inject') if tracing is not None else nullcontext(), layer('inject'):
+                inject_into_instances(result, ModelBase, 'api_client', self.api_object)
+            if scope is not None:
+                scope.inject_time = time.perf_counter() - started
             return result
         return wrapped
 
+    def _wrap_generator(self, generator, name, call_span=None):
+        """
+        Wraps a generator (e.g. a streaming listing) so that the API client is injected
+        into each yielded item, without consuming the generator upfront.
+
+        The requests are made while the generator is consumed, so each step is measured, profiled and
+        traced as part of the call: the span of the call (handed over by `_wrap_callable`) is current
+        during each step, and ended once the generator is exhausted or closed.
+        """
+        inject_into_instances = object.__getattribute__(self, '_inject_into_instances')
+        api_object = object.__getattribute__(self, 'api_object')
+        config = api_object.config
+        metrics, profiling = getattr(config, 'metrics', None), getattr(config, 'profiling', None)
+        try:
+            while True:
+                with ExitStack() as stack:
+                    if profiling is not None:
+                        stack.enter_context(profiling.call(api_name(api_object), name, count=False))
+                    scope = stack.enter_context(metrics.scope()) if metrics is not None else None
+                    if call_span is not None:
+                        stack.enter_context(call_span.current())
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        return
+                    started = time.perf_counter()
+                    with layer('inject'):  # Not traced: a span per item would flood the trace
+                        inject_into_instances(item, ModelBase, 'api_client', api_object)
+                    if scope is not None:
+                        scope.inject_time = time.perf_counter() - started
+                yield item
+        finally:
+            try:
+                generator.close()
+            finally:
+                if call_span is not None:
+                    call_span.end()
+
     def _inject_into_instances(self, obj, cls, attribute_name, attribute_value, visited=None):
         """
         Allows us to inject an attribute into all instances of a class, contained
@@ -99,7 +174,8 @@ class APIProxyInterface:
         that may be contained within some nested data structure (like a list of objects).
         """
         if visited is None:
-            visited = set()
+            # Never walk into the injected value itself: the API client is shared with other threads.
+            visited = {id(attribute_value)}
 
         if id(obj) in visited:
             return
@@ -168,6 +244,11 @@ class APIBase(Consumer):
 
 
 # Functions
+def api_name(api_object) -> str:
+    """ The name of the class of an API object, or of the API object it is a view of (see `pool.WorkspaceAPI`). """
+    return getattr(api_object, 'api_class', type(api_object)).__name__
+
+
 def create_api_client(api_class: 'APIBase', config: Configuration) -> APIProxyInterface:  # type: ignore
     """
     Creates a proxy interface for an API client for the provided API class.
@@ -0,0 +1,255 @@
+"""
+# Bulk Execution
+
+`core/bulk.py`
+
+Helpers for running many API calls through a bounded pool of worker threads.
+Each item is reported individually, so that one failure does not abort the whole batch,
+and rate limited calls are retried once the rate limit window resets.
+"""
+# Built-ins
+import json
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    wait
+)
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Tuple
+)
+
+# External
+import requests
+
+# From Current Package
+from .errors import IntercomErrorList
+from .metrics import current_attempt
+from .concurrency import ContextThreadPoolExecutor
+
+RATE_LIMIT_ERROR_CODE = "rate_limit_exceeded"
+
+
+@dataclass
+class BulkResult:
+    """
+    The outcome of a single item of a bulk operation.
+
+    Attributes:
+        index (int): The position of the item in the input.
+        key (Hashable): The key of the item, e.g. the ID of the object it targets.
+        result (Any): The value returned for the item. None if it failed.
+        error (Exception): The exception raised for the item. None if it succeeded.
+        attempts (int): The number of attempts made, including retries after rate limiting.
+    """
+    index: int
+    key: Hashable
+    result: Any = None
+    error: Optional[BaseException] = None
+    attempts: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """ Whether the item succeeded. """
+        return self.error is None
+
+
+class RateLimitGate:
+    """
+    Pauses all workers of a bulk operation once one of them hits the rate limit,
+    until the rate limit window resets.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """ Block until the rate limit window has reset. """
+        while True:
+            with self._lock:
+                delay = self._resume_at - self._clock()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def pause_until(self, timestamp: float):
+        """ Hold back all workers until the given unix timestamp. """
+        with self._lock:
+            self._resume_at = max(self._resume_at, timestamp)
+
+
+class BulkCheckpoint:
+    """
+    Records the keys of the items of a bulk operation which succeeded, so that the operation can be
+    resumed after the process dies, without redoing them.
+
+    Keys are appended to a file, one JSON string per line, and flushed as each item succeeds.
+    A line cut short by a crash is ignored on load, and its item done again.
+
+    Args:
+        path (str): The path of the checkpoint file. Created if it does not exist.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._done: Set[str] = set()
+        line = '\n'
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        self._done.add(json.loads(line))
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            pass
+        self._file = open(path, 'a', encoding='utf-8')
+        if not line.endswith('\n'):
+            self._file.write('\n')  # Don't append to a line cut short
+
+    def __contains__(self, key: Hashable) -> bool:
+        return str(key) in self._done
+
+    def __len__(self):
+        return len(self._done)
+
+    def record(self, key: Hashable):
+        """ Record an item as done. """
+        key = str(key)
+        if key not in self._done:
+            self._done.add(key)
+            self._file.write(json.dumps(key) + '\n')
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def get_rate_limit_reset(error: BaseException, clock: Callable[[], float] = time.time) -> Optional[float]:
+    """
+    Check whether an exception was caused by Intercom's rate limit.
+
+    Args:
+        error (BaseException): The exception raised by an API call.
+
+    Returns:
+        float: The unix timestamp at which requests may resume, from the `X-RateLimit-Reset`
+            or `Retry-After` response headers (now if neither is present). None if the error is
+            not a rate limit error.
+    """
+    if isinstance(error, IntercomErrorList):
+        response = error.response
+        rate_limited = any(e.code == RATE_LIMIT_ERROR_CODE for e in error.errors)
+    elif isinstance(error, requests.HTTPError):
+        response = error.response
+        rate_limited = False
+    else:
+        return None
+
+    rate_limited = rate_limited or (response is not None and response.status_code == 429)
+    if not rate_limited:
+        return None
+
+    headers = response.headers if response is not None else {}
+    if headers.get('X-RateLimit-Reset', '').isdigit():
+        return float(headers['X-RateLimit-Reset'])
+
+    retry_after = headers.get('Retry-After', '')
+    if retry_after.isdigit():
+        return clock() + int(retry_after)
+    if retry_after:
+        try:
+            return parsedate_to_datetime(retry_after).timestamp()
+        except (TypeError, ValueError):
+            pass
+
+    return clock()
+
+
+def run_bulk(
+    func: Callable[..., Any],
+    items: Iterable[Tuple[Hashable, tuple]],
+    max_workers: int = 8,
+    max_retries: int = 5,
+    backoff: float = 1.0,
+) -> Iterator[BulkResult]:
+    """
+    Call `func` once per item through a bounded pool of worker threads.
+
+    Items are consumed from `items` lazily, with at most `max_workers * 2` in flight at once,
+    so that arbitrarily large (or unbounded) iterables can be processed in constant memory.
+
+    When a call is rate limited, all workers are paused until the rate limit resets and the call
+    is retried, up to `max_retries` times. A rate limited request was rejected by the API, so it is
+    always safe to retry. Any other exception is recorded on the item's result and not retried.
+
+    Args:
+        func (Callable): The function to call. Called as `func(*args)` for each item.
+        items (Iterable[Tuple[Hashable, tuple]]): Pairs of `(key, args)`. The key identifies the item in the results.
+        max_workers (int): The number of worker threads. Keep it at or below the connection pool size
+            of the session (10 by default for `requests`). Defaults to 8.
+        max_retries (int): The maximum number of retries of a rate limited call. Defaults to 5.
+        backoff (float): Minimum number of seconds to wait before retrying a rate limited call,
+            doubled on each retry. Defaults to 1.
+
+    Yields:
+        BulkResult: The result of each item, in completion order.
+    """
+    gate = RateLimitGate()
+
+    def run_one(index: int, key: Hashable, args: tuple) -> BulkResult:
+        result = BulkResult(index=index, key=key)
+        while True:
+            gate.wait()
+            result.attempts += 1
+            token = current_attempt.set(result.attempts)
+            try:
+                result.result = func(*args)
+                return result
+            except Exception as error:  # noqa: Each item must report its own error
+                reset = get_rate_limit_reset(error)
+                if reset is None or result.attempts > max_retries:
+                    result.error = error
+                    return result
+                gate.pause_until(max(reset, time.time() + backoff * 2 ** (result.attempts - 1)))
+            finally:
+                current_attempt.reset(token)
+
+    item_iter = iter(enumerate(items))
+    with ContextThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='intercom-bulk') as executor:
+        pending = set()
+
+        def submit_next() -> bool:
+            try:
+                index, (key, args) = next(item_iter)
+            except StopIteration:
+                return False
+            pending.add(executor.submit(run_one, index, key, args))
+            return True
+
+        while len(pending) < max_workers * 2 and submit_next():
+            pass
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                submit_next()
+                yield future.result()
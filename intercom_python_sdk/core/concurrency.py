@@ -0,0 +1,21 @@
+"""
+# Concurrency
+
+`core/concurrency.py`
+
+Concurrency utilities shared by the SDK, such as the thread pool used by the pagination helpers,
+`run_bulk` and the help center tree.
+"""
+# Built-ins
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    A thread pool running each task in a copy of the context it was submitted from, so that
+    context variables (such as the current span) carry over into the worker threads.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
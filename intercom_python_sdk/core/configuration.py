@@ -23,6 +23,14 @@ from uplink.converters import ConverterFactory
 from uplink.hooks import TransactionHook
 from validator_collection import checkers
 
+# From Current Package
+from .http_cache import CachedModelConverter, CachingAdapter, HTTPCache
+from .metrics import Metrics
+from .profiling import Profiling
+from .read_cache import ReadCache, ReadThroughAdapter
+from .single_flight import SingleFlightAdapter
+from .tracing import Tracing
+
 
 class Configuration:
     """
@@ -41,7 +49,13 @@ class Configuration:
         api_version: Opt[Union[str, int]] = None,
         converters: Union[Tuple[ConverterFactory], Tuple[()]] = (),  # Uplink converters
         hooks: Union[Tuple[TransactionHook], Tuple[()]] = (),  # Uplink hooks
-        proxy: Opt[Dict] = None
+        proxy: Opt[Dict] = None,
+        http_cache: Union[bool, HTTPCache] = False,
+        single_flight: bool = False,
+        read_cache: Opt[ReadCache] = None,
+        metrics: Opt[Metrics] = None,
+        tracing: Opt[Tracing] = None,
+        profiling: Opt[Profiling] = None
     ):
         """
         Initializes a new instance of the Configuration class.
@@ -51,6 +65,18 @@ class Configuration:
             base_url: The base URL of the API. Default is "https://api.intercom.io".
             api_version: The version of the API. Default is None (will use your Intercom settings).
             proxy: Optional proxy configuration for debugging. Treat like a requests.Session() proxy argument.
+            http_cache: Set to True (or pass an `HTTPCache`) to revalidate read endpoints with conditional requests,
+                reusing the already deserialized model when unchanged. See `core/http_cache.py`. Default is False.
+            single_flight: Set to True to send identical concurrent GET requests only once, sharing the response
+                between the callers. See `core/single_flight.py`. Default is False.
+            read_cache: Optional `ReadCache` instance, to answer reads of slowly changing objects (e.g. Articles)
+                from a cache for the time-to-live of their type. See `core/read_cache.py`. Default is None.
+            metrics: Optional `Metrics` instance, to record the timings, sizes and statuses of each request.
+                See `core/metrics.py`. Default is None.
+            tracing: Optional `Tracing` instance, to trace each call with OpenTelemetry spans.
+                See `core/tracing.py`. Default is None.
+            profiling: Optional `Profiling` instance, to attribute the time spent in each API method to the
+                layers of the SDK. See `core/profiling.py`. Default is None.
 
         Raises:
             ValueError: If the provided api_version is not valid.
@@ -65,6 +91,39 @@ class Configuration:
         self._converters = converters
         self._hooks = hooks
 
+        self._http_cache = HTTPCache() if http_cache is True else (http_cache or None)
+        if self._http_cache is not None:
+            adapter = CachingAdapter(self._http_cache)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+            self._converters = (CachedModelConverter(),) + tuple(converters)
+
+        self._single_flight = single_flight
+        if single_flight:
+            for prefix in ("https://", "http://"):
+                self._session.mount(prefix, SingleFlightAdapter(self._session.get_adapter(prefix)))
+
+        self._read_cache = read_cache
+        if read_cache is not None:
+            for prefix in ("https://", "http://"):
+                self._session.mount(prefix, ReadThroughAdapter(read_cache, self._session.get_adapter(prefix), base_url))
+
+        self._metrics = metrics
+        if metrics is not None:
+            self._hooks = (metrics.hook,) + tuple(hooks)
+            self._converters = (metrics.converter(self._converters),) + tuple(self._converters)
+
+        self._tracing = tracing
+        if tracing is not None:
+            self._hooks = (tracing.hook,) + tuple(self._hooks)
+            self._converters = (tracing.converter(self._converters),) + tuple(self._converters)
+
+        self._profiling = profiling
+        if profiling is not None:
+            profiling.instrument(self._session)
+            self._hooks = (profiling.hook,) + tuple(self._hooks)
+            self._converters = (profiling.converter(self._converters),) + tuple(self._converters)
+
         if self._api_version:
             self._headers["Intercom-Version"] = self._api_version
 
@@ -141,6 +200,40 @@ class Configuration:
         """The hooks to be used in the API."""
         return self._hooks
 
+    @property
+    def http_cache(self) -> Opt[HTTPCache]:
+        """The HTTP cache of the session, if enabled."""
+        return self._http_cache
+
+    @property
+    def single_flight(self) -> bool:
+        """Whether identical concurrent GET requests are sent only once."""
+        return self._single_flight
+
+    @property
+    def read_cache(self) -> Opt[ReadCache]:
+        """The read-through cache of the API clients, if enabled."""
+        return self._read_cache
+
+    @property
+    def metrics(self) -> Opt[Metrics]:
+        """The metrics collector of the API clients, if enabled."""
+        return self._metrics
+
+    @property
+    def tracing(self) -> Opt[Tracing]:
+        """The tracing of the API clients, if enabled."""
+        return self._tracing
+
+    @property
+    def profiling(self) -> Opt[Profiling]:
+        """The profiling of the API clients, if enabled."""
+        return self._profiling
+
     @base_url.setter
     def base_url(self, value):
         self._base_url = value
+        for prefix in ("https://", "http://"):
+            adapter = self._session.get_adapter(prefix)
+            if isinstance(adapter, ReadThroughAdapter):
+                adapter.base_url = value
@@ -51,13 +51,18 @@ class IntercomErrorObject(Exception):
 
 
 class IntercomErrorList(Exception):
-    """ Custom exception for a list of Intercom error objects. """
+    """ Custom exception for a list of Intercom error objects.
+
+    The `response` attribute holds the HTTP response the errors were read from (e.g. to inspect
+    its status code or rate limit headers), when raised by `catch_api_error`.
+    """
     def __init__(self, type: str, errors: List[IntercomErrorObject], request_id: str = None):
         message = f"Intercom API returned multiple errors: {pformat(errors)}"
         super().__init__(message)
         self.type = type
         self.errors = errors
         self.request_id = request_id
+        self.response = None
 
 
 def catch_api_error(response):
@@ -72,6 +77,7 @@ def catch_api_error(response):
 
     try:
         error_list = IntercomErrorListSchema().load(data)
+        error_list.response = response
         raise error_list
     except ValidationError as e:
         raise ValueError(f"Error parsing error response: {e.messages}")
\ No newline at end of file
@@ -0,0 +1,205 @@
+"""
+# HTTP Cache
+
+`core/http_cache.py`
+
+An opt-in HTTP cache for read endpoints, enabled with `Configuration(http_cache=True)`.
+
+GET responses carrying an `ETag` or `Last-Modified` validator are stored, and the next request
+for the same URL is sent as a conditional request (`If-None-Match` / `If-Modified-Since`).
+When the API answers `304 Not Modified`, the stored response is replayed instead, and the model
+deserialized from it the first time is copied instead of parsing the payload again.
+
+Each call gets its own copy of the model, so that local changes made by one caller (and the fields
+tracked as changed for `update`) are not seen by the others.
+"""
+# Built-ins
+import copy
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple
+)
+
+# External
+import marshmallow
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from uplink.converters import ConverterFactory
+from uplink.converters.interfaces import Converter
+
+# Headers that select a different representation of the same URL.
+KEY_HEADERS = ('Authorization', 'Intercom-Version', 'Accept')
+
+
+class CacheEntry:
+    """
+    A stored response and its validators.
+
+    Attributes:
+        etag (str): The `ETag` of the response, if any.
+        last_modified (str): The `Last-Modified` date of the response, if any.
+        status_code (int): The status code of the response.
+        headers (CaseInsensitiveDict): The headers of the response.
+        content (bytes): The body of the response.
+        encoding (str): The encoding of the response body.
+        models (dict): Models deserialized from the body, by schema. Never returned, only copied.
+    """
+
+    def __init__(self, response: requests.Response):
+        self.etag = response.headers.get('ETag')
+        self.last_modified = response.headers.get('Last-Modified')
+        self.status_code = response.status_code
+        self.headers = CaseInsensitiveDict(response.headers)
+        self.content = response.content
+        self.encoding = response.encoding
+        self.models: Dict[Any, Any] = {}
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """ The headers used to revalidate this entry. """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """
+    A thread-safe, in-memory store of cache entries, evicting the least recently used entries first.
+
+    Args:
+        max_entries (int): The maximum number of responses kept. Defaults to 256.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, CacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Hashable, entry: CacheEntry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key_for(request: requests.PreparedRequest) -> Tuple[Optional[str], ...]:
+        """ The cache key of a request: its URL and the headers that select its representation. """
+        return (request.url,) + tuple(request.headers.get(name) for name in KEY_HEADERS)
+
+
+class CachingAdapter(BaseAdapter):
+    """
+    A transport adapter which sends conditional GET requests and replays stored responses on `304`.
+
+    Replayed responses have a `200` status code, and carry `from_cache = True`.
+    All responses going through the cache carry their `http_cache_entry`.
+
+    Args:
+        cache (HTTPCache): The cache to store responses in.
+        adapter (BaseAdapter): The adapter actually sending requests. Defaults to a new `HTTPAdapter`.
+    """
+
+    def __init__(self, cache: HTTPCache, adapter: Optional[BaseAdapter] = None):
+        super().__init__()
+        self.cache = cache
+        self.adapter = adapter or HTTPAdapter()
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, **kwargs) -> requests.Response:
+        # Streamed responses can't be stored, and explicit conditional requests are left to the caller.
+        if request.method != 'GET' or stream or 'If-None-Match' in request.headers \
+                or 'If-Modified-Since' in request.headers:
+            return self.adapter.send(request, stream=stream, **kwargs)
+
+        key = self.cache.key_for(request)
+        entry = self.cache.get(key)
+        if entry is not None:
+            request.headers.update(entry.conditional_headers())
+
+        response = self.adapter.send(request, stream=stream, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            return self._replay(entry, request, response)
+
+        response.from_cache = False
+        if response.status_code == 200 and 'no-store' not in response.headers.get('Cache-Control', '') \
+                and ('ETag' in response.headers or 'Last-Modified' in response.headers):
+            response.http_cache_entry = CacheEntry(response)
+            self.cache.set(key, response.http_cache_entry)
+
+        return response
+
+    def _replay(self, entry: CacheEntry, request: requests.PreparedRequest,
+                not_modified: requests.Response) -> requests.Response:
+        """ Build a response from a stored entry, as revalidated by a `304` response. """
+        if not_modified.raw is not None:
+            not_modified.close()  # Release its connection to the pool
+        response = requests.Response()
+        response.status_code = entry.status_code
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response._content = entry.content
+        response._content_consumed = True
+        response.encoding = entry.encoding
+        response.url = request.url
+        response.request = request
+        response.elapsed = not_modified.elapsed
+        response.connection = self
+        response.from_cache = True
+        response.http_cache_entry = entry
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+
+class CachedModelConverter(ConverterFactory):
+    """
+    Deserializes responses with marshmallow schemas, like uplink's default converter, but keeps the
+    resulting model on the cache entry of the response, to return copies of it when the response is replayed.
+    """
+
+    class ResponseBodyConverter(Converter):
+        def __init__(self, schema: marshmallow.Schema, key: Hashable):
+            self._schema = schema
+            self._key = key
+
+        def convert(self, response):
+            entry = getattr(response, 'http_cache_entry', None)
+            if entry is None:
+                return self._schema.load(response.json())
+
+            if not (getattr(response, 'from_cache', False) and self._key in entry.models):
+                entry.models[self._key] = self._schema.load(response.json())
+            # A copy, as the API client is injected into the returned model, and callers may change it.
+            return copy.deepcopy(entry.models[self._key])
+
+    def create_response_body_converter(self, cls, request_definition=None):
+        # Models are keyed by the schema given to `@returns`, class or instance.
+        if isinstance(cls, type) and issubclass(cls, marshmallow.Schema):
+            return self.ResponseBodyConverter(cls(), cls)
+        if isinstance(cls, marshmallow.Schema):
+            return self.ResponseBodyConverter(cls, cls)
+        return None
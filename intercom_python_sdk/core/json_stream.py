@@ -0,0 +1,132 @@
+"""
+# JSON Streaming Helpers
+
+`core/json_stream.py`
+
+Helpers to decode large JSON responses without materializing all of them at once.
+A single array within the document can be deferred, and is then decoded item by item
+straight from the response text as it is iterated over, or skipped entirely.
+"""
+# Built-ins
+import json
+import re
+from typing import (
+    Any,
+    Iterator,
+    Sequence,
+    Tuple
+)
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Matches either a complete JSON string (so brackets within strings are ignored) or a bracket.
+_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]')
+
+
+class LazyJSONArray:
+    """
+    A JSON array kept as text, whose items are decoded one at a time on iteration.
+
+    Iterating twice decodes the items twice; nothing is cached.
+
+    Args:
+        text (str): The JSON document containing the array.
+        start (int): The index of the opening bracket of the array in `text`.
+    """
+    __slots__ = ('_text', '_start')
+
+    def __init__(self, text: str, start: int):
+        self._text = text
+        self._start = start
+
+    def __iter__(self) -> Iterator[Any]:
+        text = self._text
+        index = _skip_whitespace(text, self._start + 1)
+        if text[index] == ']':
+            return
+
+        while True:
+            item, index = _DECODER.raw_decode(text, index)
+            yield item
+            index = _skip_whitespace(text, index)
+            if text[index] == ']':
+                return
+            index = _skip_whitespace(text, index + 1)  # Past the comma
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} at {self._start}>"
+
+
+def loads_deferring(text: str, path: Sequence[str], skip: bool = False) -> Any:
+    """
+    Decode a JSON document, deferring the array found at `path`.
+
+    Args:
+        text (str): The JSON document.
+        path (Sequence[str]): The keys leading to the array to defer,
+            e.g. `('conversation_parts', 'conversation_parts')`.
+        skip (bool): If True, the value at `path` is skipped without being decoded, and its key omitted.
+            Otherwise it is returned as a `LazyJSONArray`. Defaults to False.
+
+    Returns:
+        The decoded document.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    value, _ = _decode_value(text, _skip_whitespace(text, 0), tuple(path), skip)
+    return value
+
+
+def _decode_value(text: str, index: int, path: Tuple[str, ...], skip: bool) -> Tuple[Any, int]:
+    """ Decode the value starting at `index`, deferring the value at `path` (relative to it). """
+    if not path and text[index] == '[':
+        return LazyJSONArray(text, index), _skip_container(text, index)
+
+    if not path or text[index] != '{':
+        return _DECODER.raw_decode(text, index)
+
+    obj = {}
+    index = _skip_whitespace(text, index + 1)
+    if text[index] == '}':
+        return obj, index + 1
+
+    while True:
+        key, index = _DECODER.raw_decode(text, index)
+        index = _skip_whitespace(text, index)
+        if text[index] != ':':
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, index)
+        index = _skip_whitespace(text, index + 1)
+
+        if key != path[0]:
+            obj[key], index = _DECODER.raw_decode(text, index)
+        elif skip and len(path) == 1:
+            index = _skip_container(text, index) if text[index] in '[{' else _DECODER.raw_decode(text, index)[1]
+        else:
+            obj[key], index = _decode_value(text, index, path[1:], skip)
+
+        index = _skip_whitespace(text, index)
+        if text[index] == '}':
+            return obj, index + 1
+        if text[index] != ',':
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, index)
+        index = _skip_whitespace(text, index + 1)
+
+
+def _skip_whitespace(text: str, index: int) -> int:
+    return _WHITESPACE.match(text, index).end()  # type: ignore
+
+
+def _skip_container(text: str, index: int) -> int:
+    """ Return the index just past the array or object starting at `index`, without decoding it. """
+    depth = 0
+    for match in _TOKEN.finditer(text, index):
+        token = match.group()
+        if token in ('[', '{'):
+            depth += 1
+        elif token in (']', '}'):
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    raise json.JSONDecodeError("Unterminated array or object", text, index)
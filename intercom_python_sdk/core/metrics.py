@@ -0,0 +1,389 @@
+"""
+# Metrics
+
+`core/metrics.py`
+
+Per-request instrumentation of the API clients. Enable it by passing a `Metrics` instance to the
+`Configuration`; each request then produces a `RequestMetrics` record, sent to the given sinks.
+
+A sink is any callable taking a `RequestMetrics`. `MetricsAggregator` keeps Prometheus-style
+counters and histograms in process, and `PrometheusSink` exports them through `prometheus_client`,
+if it is installed.
+
+## Example Usage
+
+```python
+from uplink.auth import BearerToken
+from intercom_python_sdk import Intercom
+from intercom_python_sdk.core.configuration import Configuration
+from intercom_python_sdk.core.metrics import Metrics, MetricsAggregator
+
+aggregator = MetricsAggregator()
+config = Configuration(auth=BearerToken('my_api_key'), metrics=Metrics(aggregator, print))
+intercom = Intercom(config=config)
+
+intercom.articles.list_all()
+print(aggregator.render())  # Prometheus text format
+```
+"""
+# Built-ins
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple
+)
+from urllib.parse import urlparse
+
+# External
+from marshmallow import Schema
+from uplink.converters import ConverterFactory, MarshmallowConverter
+from uplink.converters.interfaces import Converter
+from uplink.hooks import TransactionHook
+
+Sink = Callable[['RequestMetrics'], Any]
+
+# The attempt number of the calls made in the current context, set by retrying callers such as `run_bulk`.
+current_attempt: ContextVar[int] = ContextVar('intercom_current_attempt', default=1)
+
+# Path segments with a digit are IDs, e.g. `/articles/123` is reported as `GET /articles/{id}`.
+_ID_SEGMENT = re.compile(r'(?<=/)[^/]*\d[^/]*')
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def endpoint_of(method: str, url: str) -> str:
+    """ The endpoint label of a request, e.g. 'GET /articles/{id}'. """
+    return f"{method} {_ID_SEGMENT.sub('{id}', urlparse(url).path)}"
+
+
+@dataclass
+class RequestMetrics:
+    """
+    The measurements of a single API request. Times are in seconds.
+
+    Attributes:
+        endpoint (str): The method and path of the request, with IDs replaced by `{id}`.
+        status_code (int): The status code of the response. None if no response was received.
+        request_time (float): From sending the request to receiving the whole response, including
+            connection setup (DNS, connect and TLS, when a new connection is needed).
+        time_to_headers (float): From sending the request to parsing the response headers.
+        transfer_time (float): The rest of `request_time`, mostly reading the response body.
+        response_size (int): The size of the response body, in bytes.
+        deserialize_time (float): Loading the response with its schema. None if it was not loaded.
+        inject_time (float): Injecting the API client into the returned models. None if not through the API proxy.
+        attempt (int): The attempt number of the call, above 1 when retried (e.g. after a rate limit).
+        error (str): The type of the exception raised, if any.
+    """
+    endpoint: str
+    status_code: Optional[int] = None
+    request_time: float = 0.0
+    time_to_headers: float = 0.0
+    transfer_time: float = 0.0
+    response_size: int = 0
+    deserialize_time: Optional[float] = None
+    inject_time: Optional[float] = None
+    attempt: int = 1
+    error: Optional[str] = None
+
+
+class _Scope:
+    """ The requests made during a call through the API proxy, held back until injection is timed. """
+
+    def __init__(self):
+        self.records: List[RequestMetrics] = []
+        self.inject_time: Optional[float] = None
+
+
+class Metrics:
+    """
+    Collects `RequestMetrics` from the API clients sharing a `Configuration`, and sends them to sinks.
+
+    Requests are timed by a transaction hook, deserialization by a converter wrapping the configured
+    ones, and injection by the API proxy. A sink raising an exception does not fail the request.
+
+    Args:
+        *sinks (Callable): Called with each `RequestMetrics`.
+    """
+
+    def __init__(self, *sinks: Sink):
+        self.sinks = list(sinks)
+        self._local = threading.local()
+        self.hook = MetricsHook(self)
+
+    def converter(self, converters=()) -> 'MetricsConverter':
+        """ A converter timing the given converters, falling back to uplink's marshmallow converter. """
+        return MetricsConverter(self, tuple(converters) + (MarshmallowConverter(),))
+
+    def add_sink(self, sink: Sink):
+        self.sinks.append(sink)
+
+    def emit(self, record: RequestMetrics):
+        """ Send a record to the sinks, or hold it back until the current proxy call returns. """
+        scopes = getattr(self._local, 'scopes', None)
+        if scopes:
+            scopes[-1].records.append(record)
+            return
+
+        for sink in self.sinks:
+            try:
+                sink(record)
+            except Exception:  # noqa: Instrumentation must not break API calls
+                pass
+
+    @contextmanager
+    def scope(self) -> Iterator[_Scope]:
+        """ Hold back the records of the requests made in this context, to set their `inject_time`. """
+        scopes = self._local.__dict__.setdefault('scopes', [])
+        current = _Scope()
+        scopes.append(current)
+        try:
+            yield current
+        finally:
+            scopes.pop()
+            if current.records:
+                # The models were injected into the result of the last request.
+                current.records[-1].inject_time = current.inject_time
+            for record in current.records:
+                self.emit(record)
+
+    # Request state, set by the hook and the converter. Requests are blocking, one at a time per thread.
+
+    def _start(self, request_builder):
+        self._local.pending = (time.perf_counter(), request_builder)
+
+    def _take_pending(self) -> Tuple[Optional[float], Any]:
+        pending = getattr(self._local, 'pending', None)
+        self._local.pending = None
+        return pending or (None, None)
+
+    def _set_loading(self, record: RequestMetrics):
+        self._local.loading = record
+
+    def _take_loading(self) -> Optional[RequestMetrics]:
+        record = getattr(self._local, 'loading', None)
+        self._local.loading = None
+        return record
+
+
+def _loads_schema(request_builder) -> bool:
+    """ Whether the response of the request is loaded by a marshmallow schema (see `@returns`). """
+    return_type = getattr(getattr(request_builder, 'return_type', None), 'type', None)
+    return isinstance(return_type, Schema) or (isinstance(return_type, type) and issubclass(return_type, Schema))
+
+
+class MetricsHook(TransactionHook):
+    """ Times requests, for `Metrics`. Added to the hooks of the `Configuration`. """
+
+    def __init__(self, metrics: Metrics):
+        self._metrics = metrics
+
+    def audit_request(self, consumer, request_builder):
+        # Called before the request is built, so the endpoint is read from the response.
+        self._metrics._start(request_builder)
+
+    def handle_response(self, consumer, response):
+        # Session hooks see the response before the `@returns` converter does.
+        started, request_builder = self._metrics._take_pending()
+        if started is None:
+            return response
+
+        request_time = time.perf_counter() - started
+        time_to_headers = min(response.elapsed.total_seconds(), request_time)
+        content = getattr(response, '_content', None)
+        record = RequestMetrics(
+            endpoint=endpoint_of(response.request.method, response.request.url),
+            status_code=response.status_code,
+            request_time=request_time,
+            time_to_headers=time_to_headers,
+            transfer_time=request_time - time_to_headers,
+            response_size=len(content) if isinstance(content, bytes) else int(
+                response.headers.get('Content-Length') or 0),
+            attempt=current_attempt.get(),
+        )
+
+        if 200 <= response.status_code < 300 and _loads_schema(request_builder):
+            self._metrics._set_loading(record)  # Emitted by the converter, once loaded
+        else:
+            self._metrics.emit(record)
+        return response
+
+    def handle_exception(self, consumer, exc_type, exc_val, exc_tb):
+        # Also called for exceptions raised by the response handlers, once the response was recorded.
+        started, request_builder = self._metrics._take_pending()
+        if started is None:
+            return
+
+        request = getattr(exc_val, 'request', None)
+        self._metrics.emit(RequestMetrics(
+            endpoint=endpoint_of(request.method, request.url) if request is not None else 'unknown',
+            request_time=time.perf_counter() - started,
+            attempt=current_attempt.get(),
+            error=exc_type.__name__,
+        ))
+
+
+class MetricsConverter(ConverterFactory):
+    """ Times the deserialization of responses, for `Metrics`. Wraps the converters of the `Configuration`. """
+
+    class ResponseBodyConverter(Converter):
+        def __init__(self, metrics: Metrics, converter: Converter):
+            self._metrics = metrics
+            self._converter = converter
+
+        def convert(self, response):
+            record = self._metrics._take_loading()
+            started = time.perf_counter()
+            try:
+                return self._converter(response)
+            except Exception as error:
+                if record is not None:
+                    record.error = type(error).__name__
+                raise
+            finally:
+                if record is not None:
+                    record.deserialize_time = time.perf_counter() - started
+                    self._metrics.emit(record)
+
+    def __init__(self, metrics: Metrics, converters: Tuple[ConverterFactory, ...]):
+        self._metrics = metrics
+        self._converters = converters
+
+    def create_response_body_converter(self, cls, request_definition=None):
+        for factory in self._converters:
+            converter = factory.create_response_body_converter(cls, request_definition)
+            if converter is not None:
+                return self.ResponseBodyConverter(self._metrics, converter)
+        return None
+
+
+class MetricsAggregator:
+    """
+    A sink keeping Prometheus-style counters and histograms of the requests, by endpoint.
+
+    Args:
+        buckets (Tuple[float]): The upper bounds of the histogram buckets, in seconds.
+    """
+
+    HISTOGRAMS = ('request_time', 'time_to_headers', 'transfer_time', 'deserialize_time', 'inject_time')
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests: Dict[Tuple[str, str], int] = defaultdict(int)
+            self.response_bytes: Dict[str, int] = defaultdict(int)
+            self.retries: Dict[str, int] = defaultdict(int)
+            # name -> endpoint -> [bucket counts..., +Inf count, sum]
+            self.histograms: Dict[str, Dict[str, List[float]]] = {name: {} for name in self.HISTOGRAMS}
+
+    def __call__(self, record: RequestMetrics):
+        status = str(record.status_code) if record.status_code is not None else (record.error or 'error')
+        with self._lock:
+            self.requests[(record.endpoint, status)] += 1
+            self.response_bytes[record.endpoint] += record.response_size
+            if record.attempt > 1:
+                self.retries[record.endpoint] += 1
+            for name in self.HISTOGRAMS:
+                value = getattr(record, name)
+                if value is not None:
+                    self._observe(self.histograms[name], record.endpoint, value)
+
+    def _observe(self, histogram: Dict[str, List[float]], endpoint: str, value: float):
+        counts = histogram.get(endpoint)
+        if counts is None:
+            counts = histogram[endpoint] = [0] * (len(self.buckets) + 2)
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def render(self, prefix: str = 'intercom_sdk') -> str:
+        """ The metrics in the Prometheus text exposition format. """
+        lines = []
+        with self._lock:
+            lines.append(f'# TYPE {prefix}_requests_total counter')
+            for (endpoint, status), count in sorted(self.requests.items()):
+                lines.append(f'{prefix}_requests_total{{endpoint="{endpoint}",status="{status}"}} {count}')
+            for name, counter in (('response_bytes_total', self.response_bytes), ('retries_total', self.retries)):
+                lines.append(f'# TYPE {prefix}_{name} counter')
+                for endpoint, count in sorted(counter.items()):
+                    lines.append(f'{prefix}_{name}{{endpoint="{endpoint}"}} {count}')
+            for name, histogram in self.histograms.items():
+                metric = f'{prefix}_{name}_seconds'
+                lines.append(f'# TYPE {metric} histogram')
+                for endpoint, counts in sorted(histogram.items()):
+                    cumulative = 0
+                    for bound, count in zip(self.buckets + ('+Inf',), counts[:-1]):
+                        cumulative += count
+                        lines.append(f'{metric}_bucket{{endpoint="{endpoint}",le="{bound}"}} {cumulative}')
+                    lines.append(f'{metric}_sum{{endpoint="{endpoint}"}} {counts[-1]}')
+                    lines.append(f'{metric}_count{{endpoint="{endpoint}"}} {cumulative}')
+        return '\n'.join(lines) + '\n'
+
+
+class PrometheusSink:
+    """
+    A sink recording the requests with `prometheus_client` metrics.
+
+    Args:
+        registry: The `prometheus_client` registry. Defaults to its global registry.
+        prefix (str): The prefix of the metric names.
+
+    Raises:
+        ImportError: If `prometheus_client` is not installed.
+    """
+
+    def __init__(self, registry=None, prefix: str = 'intercom_sdk'):
+        try:
+            import prometheus_client
+        except ImportError as e:  # pragma: no cover
+            raise ImportError("PrometheusSink requires the 'prometheus_client' package.") from e
+
+        kwargs = {'registry': registry} if registry is not None else {}
+        self.requests = prometheus_client.Counter(
+            f'{prefix}_requests', 'Intercom API requests.', ['endpoint', 'status'], **kwargs)
+        self.response_bytes = prometheus_client.Counter(
+            f'{prefix}_response_bytes', 'Intercom API response bytes.', ['endpoint'], **kwargs)
+        self.retries = prometheus_client.Counter(
+            f'{prefix}_retries', 'Retried Intercom API requests.', ['endpoint'], **kwargs)
+        self.histograms = {
+            name: prometheus_client.Histogram(
+                f'{prefix}_{name}_seconds', f'Intercom API {name.replace("_", " ")}.', ['endpoint'], **kwargs)
+            for name in MetricsAggregator.HISTOGRAMS
+        }
+
+    def __call__(self, record: RequestMetrics):
+        status = str(record.status_code) if record.status_code is not None else (record.error or 'error')
+        self.requests.labels(record.endpoint, status).inc()
+        self.response_bytes.labels(record.endpoint).inc(record.response_size)
+        if record.attempt > 1:
+            self.retries.labels(record.endpoint).inc()
+        for name, histogram in self.histograms.items():
+            value = getattr(record, name)
+            if value is not None:
+                histogram.labels(record.endpoint).observe(value)
+
+
+__all__ = [
+    'Metrics',
+    'MetricsAggregator',
+    'MetricsConverter',
+    'MetricsHook',
+    'PrometheusSink',
+    'RequestMetrics',
+    'current_attempt',
+    'endpoint_of',
+]
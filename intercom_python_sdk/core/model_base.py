@@ -6,13 +6,33 @@
 Extensible models applicable to all APIS.
 """
 # Built-ins
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pprint import pformat
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional
+
+# Set while schemas load models, so that the fields they are built with are not tracked as changed.
+_loading: ContextVar[bool] = ContextVar('intercom_loading_models', default=False)
+
+
+@contextmanager
+def loading_models():
+    """ Build models from API data in this block: their `__init__` fields are not tracked as changed. """
+    token = _loading.set(True)
+    try:
+        yield
+    finally:
+        _loading.reset(token)
 
 
 class ModelBase:
     """
     Base model for all API models.
 
+    Properties set through their setters are tracked as changed, so that `update` methods
+    can send only the changed fields. The fields a model is built with are tracked as changed
+    too when it is built in code, but not when it is loaded from API data by a schema.
+
     Raises:
         NotImplementedError: When setting a property with no setter.
     """
@@ -20,6 +40,8 @@ class ModelBase:
     def __new__(cls, *args, **kwargs):
         instance = super().__new__(cls)
         instance._api_client = None
+        instance._changed_fields = set() if _loading.get() else {
+            name for name in kwargs if isinstance(getattr(cls, name, None), property)}
         return instance
 
     def __setattr__(self, name, value):
@@ -28,6 +50,8 @@ class ModelBase:
             raise NotImplementedError(f"Setting {name} property is either not supported by the API \
                                       or not implemented in the SDK.")
         super().__setattr__(name, value)
+        if name != 'api_client' and isinstance(getattr(type(self), name, None), property):
+            self._changed_fields.add(name)
 
     def __repr__(self):
         properties = {attr: getattr(self, attr) for attr in dir(self)
@@ -48,3 +72,94 @@ class ModelBase:
     @api_client.setter
     def api_client(self, api_client):
         self._api_client = api_client
+
+    @property
+    def changed_fields(self) -> FrozenSet[str]:
+        """ The names of the properties set since the model was created, or since `clear_changes`. """
+        return frozenset(self._changed_fields)
+
+    def clear_changes(self):
+        """ Forget the changed fields, e.g. once they were sent to the API. """
+        self._changed_fields.clear()
+
+    def dump_changes(self, schema_class) -> Dict[str, Any]:
+        """
+        Dump the changed fields of the model with the given schema, for a minimal update payload.
+
+        Args:
+            schema_class: The schema class of the model.
+
+        Returns:
+            dict: The serialized changed fields, or an empty dict if no field of the schema was changed.
+        """
+        only = self._changed_fields.intersection(schema_class().fields)
+        if not only:
+            return {}
+        return schema_class(only=only).dump(self)
+
+
+class IdIndex:
+    """
+    A lazily built index of models by ID, over the data list of a list model.
+
+    The index is built on first lookup, and kept up to date by the mutators of the list model:
+    `extend` adds the new models to it, and `__setitem__` and the `data` setter call `invalidate`.
+    It is also rebuilt when the length of the list changes, e.g. after `data.append`, and when a
+    model found no longer has the ID it was indexed under. Lookups of missing IDs never rebuild it,
+    so models replaced directly in the data list (`data[i] = model`) are not found until `invalidate`.
+
+    Uses `__slots__` so that `APIProxyInterface` does not walk into the index.
+    """
+    __slots__ = ('_items', '_index', '_size')
+
+    def __init__(self):
+        self.invalidate()
+
+    def invalidate(self):
+        """ Drop the index, to be rebuilt on next lookup. """
+        self._items: Optional[List[Any]] = None
+        self._index: Dict[Hashable, Any] = {}
+        self._size = 0
+
+    def _build(self, items: List[Any]) -> Dict[Hashable, Any]:
+        index: Dict[Hashable, Any] = {}
+        for item in items:
+            index.setdefault(item.id, item)  # The first match wins, as with a linear scan
+        self._items, self._index, self._size = items, index, len(items)
+        return index
+
+    def _current(self, items: List[Any]) -> Dict[Hashable, Any]:
+        if self._items is not items or self._size != len(items):
+            return self._build(items)
+        return self._index
+
+    def get(self, items: List[Any], id: Hashable) -> Optional[Any]:
+        """
+        Get the first model of `items` with the given ID.
+
+        Args:
+            items (list): The data list of the list model.
+            id (Hashable): The ID to look up. Compared as is, as with `==`.
+
+        Returns:
+            The model, or None if there is none with this ID.
+        """
+        item = self._current(items).get(id)
+        if item is not None and item.id != id:  # Its ID was changed since it was indexed
+            item = self._build(items).get(id)
+        return item
+
+    def extend(self, items: List[Any], new_items: Iterable[Any]):
+        """
+        Append the models of `new_items` whose ID is not in `items` yet, keeping the index up to date.
+
+        Args:
+            items (list): The data list of the list model.
+            new_items (Iterable): The models to append.
+        """
+        index = self._current(items)
+        for item in new_items:
+            if item.id not in index:
+                items.append(item)
+                index[item.id] = item
+        self._size = len(items)
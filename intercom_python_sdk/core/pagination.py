@@ -0,0 +1,107 @@
+"""
+# Pagination Helpers
+
+`core/pagination.py`
+
+Generic helpers used by API classes to stream paginated endpoints.
+"""
+# Built-ins
+from collections import deque
+from typing import (
+    Callable,
+    Iterator,
+    Optional,
+    TypeVar
+)
+
+# From Current Package
+from .concurrency import ContextThreadPoolExecutor
+
+Page = TypeVar('Page')
+
+
+def iter_cursor_pages(
+    fetch_page: Callable[[Optional[str]], Page],
+    get_cursor: Callable[[Page], Optional[str]],
+    starting_after: Optional[str] = None,
+    prefetch: bool = True
+) -> Iterator[Page]:
+    """
+    Iterate over the pages of a cursor paginated endpoint.
+
+    While a page is being consumed, the next page is fetched in a background thread,
+    so that network latency overlaps with processing. At most two pages are held at once.
+
+    Args:
+        fetch_page (Callable): Fetches a page given a `starting_after` cursor (None for the first page).
+        get_cursor (Callable): Returns the cursor of the page following the given page, or None if it is the last.
+        starting_after (str): The cursor to start at. Defaults to None (the first page).
+        prefetch (bool): Whether to fetch the next page in the background. Defaults to True.
+
+    Yields:
+        The pages, in order.
+    """
+    if not prefetch:
+        cursor = starting_after
+        while True:
+            page = fetch_page(cursor)
+            yield page
+            cursor = get_cursor(page)
+            if not cursor:
+                return
+
+    executor = ContextThreadPoolExecutor(max_workers=1, thread_name_prefix='intercom-prefetch')
+    try:
+        page = fetch_page(starting_after)
+        while True:
+            cursor = get_cursor(page)
+            next_page = executor.submit(fetch_page, cursor) if cursor else None
+            yield page
+            if next_page is None:
+                return
+            page = next_page.result()
+    finally:
+        # If the consumer stops early, don't block on a page nobody will read.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_numbered_pages(
+    fetch_page: Callable[[int], Page],
+    get_total_pages: Callable[[Page], int],
+    start: int = 1,
+    max_workers: int = 4
+) -> Iterator[Page]:
+    """
+    Iterate over the pages of a page-number paginated endpoint.
+
+    The first page is fetched alone, to learn the total number of pages. The following pages
+    are then fetched concurrently, up to `max_workers` pages ahead of the consumer, and yielded in order.
+
+    Args:
+        fetch_page (Callable): Fetches a page given its number.
+        get_total_pages (Callable): Returns the total number of pages, given a page.
+        start (int): The number of the first page to fetch. Defaults to 1.
+        max_workers (int): The number of pages fetched concurrently. Defaults to 4.
+
+    Yields:
+        The pages, in order.
+    """
+    page = fetch_page(start)
+    total = get_total_pages(page) or start
+    yield page
+    if total <= start:
+        return
+
+    executor = ContextThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='intercom-pages')
+    try:
+        numbers = iter(range(start + 1, total + 1))
+        pending = deque(executor.submit(fetch_page, number) for _, number in zip(range(max_workers), numbers))
+        while pending:
+            page = pending.popleft().result()
+            number = next(numbers, None)
+            if number is not None:
+                pending.append(executor.submit(fetch_page, number))
+            yield page
+    finally:
+        # If the consumer stops early, don't block on pages nobody will read.
+        executor.shutdown(wait=False, cancel_futures=True)
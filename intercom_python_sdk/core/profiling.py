@@ -0,0 +1,477 @@
+"""
+# Profiling
+
+`core/profiling.py`
+
+An opt-in profiling mode, attributing the time spent in each call through an API client to the
+layers of the SDK. Enable it by passing a `Profiling` instance to the `Configuration`.
+
+For each API method (e.g. `ArticlesAPI.list_all`), the wall time and the CPU time of the calling
+thread are accumulated per layer:
+
+- `sdk`: the method itself and the API proxy, i.e. anything not in the layers below.
+- `request_build`: building the request, by uplink and `requests`, and the hooks.
+- `http`: sending the request and reading the response, by `requests`.
+- `json_decode`: decoding the response body.
+- `schema_load`: deserializing the decoded body with the marshmallow schemas, `post_load` methods included.
+- `model_init`: the construction of models.
+- `inject`: injecting the API client into the returned models.
+
+Times are exclusive: the time of a layer does not include the time of the layers it calls, so the
+layers of a method add up to its total time. Work done concurrently in worker threads (e.g. by the
+pagination helpers) is attributed to the method that started it, but not subtracted from it, so
+its layers can add up to more than its wall time.
+
+Profiling has no cost until it is enabled: the model and schema classes are only wrapped to
+attribute their time to layers while a `Profiling` instance is in use (from its first `instrument`,
+done by the `Configuration`, to its `stop`).
+
+Allocations are measured with `tracemalloc` on a sample of the calls, as tracing allocations
+slows down the whole process while it is enabled. They are the net number of memory blocks and
+bytes allocated by each layer; with several threads making calls at once, they include the
+allocations of the other threads.
+
+## Example Usage
+
+```python
+from uplink.auth import BearerToken
+from intercom_python_sdk import Intercom
+from intercom_python_sdk.core.configuration import Configuration
+from intercom_python_sdk.core.profiling import Profiling
+
+profiling = Profiling(sample_allocations=0.1)
+config = Configuration(auth=BearerToken('my_api_key'), profiling=profiling)
+intercom = Intercom(config=config)
+
+intercom.articles.list_all()
+print(profiling.table())
+profiling.stop()  # Unwraps the SDK, once no other Profiling instance is in use
+```
+"""
+# Built-ins
+import functools
+import json
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# External
+import requests
+from uplink.converters import ConverterFactory, MarshmallowConverter
+from uplink.converters.interfaces import Converter
+from uplink.hooks import TransactionHook
+
+# From Current Package
+from .model_base import ModelBase
+from .schema_base import SchemaBase
+
+LAYERS = ('sdk', 'request_build', 'http', 'json_decode', 'schema_load', 'model_init', 'inject')
+
+_NULL_CONTEXT = nullcontext()
+
+
+@dataclass
+class LayerStats:
+    """
+    The time spent in a layer of the SDK, by the calls of an API method.
+
+    Attributes:
+        calls (int): The number of times the layer was entered.
+        wall_time (float): The wall time spent in the layer, in seconds.
+        cpu_time (float): The CPU time of the thread spent in the layer, in seconds.
+        sampled_calls (int): The number of times the layer was entered while allocations were traced.
+        alloc_blocks (int): The net number of memory blocks allocated in the layer, over the sampled calls.
+        alloc_bytes (int): The net number of bytes allocated in the layer, over the sampled calls.
+    """
+    calls: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    sampled_calls: int = 0
+    alloc_blocks: int = 0
+    alloc_bytes: int = 0
+
+
+@dataclass
+class MethodStats:
+    """
+    The profile of an API method.
+
+    Attributes:
+        calls (int): The number of calls of the method.
+        wall_time (float): The total wall time of the calls, in seconds.
+        cpu_time (float): The total CPU time of the calling thread during the calls, in seconds.
+        layers (Dict[str, LayerStats]): The time spent in each layer of the SDK.
+    """
+    calls: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    layers: Dict[str, LayerStats] = field(default_factory=dict)
+
+
+class _Frame:
+    """ A layer being executed, for a call being profiled. """
+    __slots__ = ('profiling', 'method', 'layer', 'parent', 'thread', 'sampled', 'wall', 'cpu', 'blocks', 'bytes',
+                 'child_wall', 'child_cpu', 'child_blocks', 'child_bytes')
+
+    def __init__(self, profiling: 'Profiling', method: MethodStats, layer: str, parent: Optional['_Frame'],
+                 sampled: bool):
+        self.profiling = profiling
+        self.method = method
+        self.layer = layer
+        self.parent = parent
+        self.thread = threading.get_ident()
+        self.sampled = sampled
+        self.child_wall = self.child_cpu = 0.0
+        self.child_blocks = self.child_bytes = 0
+        if sampled:
+            self.blocks = sys.getallocatedblocks()
+            self.bytes = tracemalloc.get_traced_memory()[0]
+        self.cpu = time.thread_time()
+        self.wall = time.perf_counter()
+
+    def end(self) -> Tuple[float, float]:
+        wall = time.perf_counter() - self.wall
+        cpu = time.thread_time() - self.cpu
+        blocks = sys.getallocatedblocks() - self.blocks if self.sampled else 0
+        allocated = tracemalloc.get_traced_memory()[0] - self.bytes if self.sampled else 0
+        self.profiling._add(self.method, self.layer, wall - self.child_wall, cpu - self.child_cpu,
+                            self.sampled, blocks - self.child_blocks, allocated - self.child_bytes)
+
+        parent = self.parent
+        if parent is not None and parent.thread == self.thread:
+            parent.child_wall += wall
+            parent.child_cpu += cpu
+            parent.child_blocks += blocks
+            parent.child_bytes += allocated
+        return wall, cpu
+
+
+# The layer being executed, in the current context. None when no call is being profiled.
+_current_frame: ContextVar[Optional[_Frame]] = ContextVar('intercom_profiling_frame', default=None)
+
+
+@contextmanager
+def _layer(parent: _Frame, name: str) -> Iterator[_Frame]:
+    frame = _Frame(parent.profiling, parent.method, name, parent, parent.sampled)
+    token = _current_frame.set(frame)
+    try:
+        yield frame
+    finally:
+        _current_frame.reset(token)
+        frame.end()
+
+
+def layer(name: str):
+    """
+    A context manager attributing the time spent in it to a layer, when a call is being profiled.
+    Does nothing otherwise.
+    """
+    parent = _current_frame.get()
+    if parent is None:
+        return _NULL_CONTEXT
+    return _layer(parent, name)
+
+
+def profiled(name: str) -> Callable[[Callable], Callable]:
+    """ A decorator attributing the time spent in a function to a layer, when a call is being profiled. """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            parent = _current_frame.get()
+            if parent is None:
+                return func(*args, **kwargs)
+            with _layer(parent, name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _subclasses(cls: type) -> Iterator[type]:
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+def _profiled_load(load: Callable) -> Callable:
+    """ Wraps `SchemaBase.load`, attributing it to `schema_load`. Nested schemas are part of their root's load. """
+    @functools.wraps(load)
+    def wrapper(self, data, **kwargs):
+        parent = _current_frame.get()
+        if parent is None or parent.layer == 'schema_load':
+            return load(self, data, **kwargs)
+        with _layer(parent, 'schema_load'):
+            return load(self, data, **kwargs)
+    return wrapper
+
+
+class _Instrumentation:
+    """
+    The wrappers of the model and schema classes, installed while at least one `Profiling` is in use.
+    """
+
+    def __init__(self):
+        self.users = 0
+        self.originals: Dict[Tuple[type, str], Callable] = {}  # By class and attribute
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            self.users += 1
+            if self.users == 1:
+                self._install()
+
+    def release(self):
+        with self.lock:
+            self.users -= 1
+            if self.users == 0:
+                for (cls, name), original in self.originals.items():
+                    setattr(cls, name, original)
+                self.originals.clear()
+
+    def _install(self):
+        self._wrap(SchemaBase, 'load', _profiled_load)
+        for cls in _subclasses(ModelBase):
+            if '__init__' in cls.__dict__:
+                self._wrap(cls, '__init__', profiled('model_init'))
+
+    def _wrap(self, cls: type, name: str, wrap: Callable[[Callable], Callable]):
+        original = cls.__dict__[name]
+        self.originals[(cls, name)] = original
+        setattr(cls, name, wrap(original))
+
+
+_instrumentation = _Instrumentation()
+
+
+class Profiling:
+    """
+    Profiles the calls of the API clients sharing a `Configuration`. See the module documentation.
+
+    Args:
+        sample_allocations (float): The fraction of calls for which allocations are measured, between
+            0 and 1. Defaults to 0 (allocations are not measured).
+    """
+
+    def __init__(self, sample_allocations: float = 0.0):
+        if not 0 <= sample_allocations <= 1:
+            raise ValueError('sample_allocations must be between 0 and 1.')
+        self.sample_allocations = sample_allocations
+        self.hook = ProfilingHook()
+        self._methods: Dict[str, MethodStats] = {}
+        self._lock = threading.Lock()
+        self._tracing = 0  # The number of sampled calls in progress, while tracemalloc was started by us
+        self._random = random.Random()
+        self._sessions: List[Tuple[requests.Session, Callable]] = []  # With their original `send`
+
+    def converter(self, converters=()) -> 'ProfilingConverter':
+        """ A converter profiling the given converters, falling back to uplink's marshmallow converter. """
+        return ProfilingConverter(tuple(converters) + (MarshmallowConverter(),))
+
+    @property
+    def active(self) -> bool:
+        """ Whether calls are profiled: from the first `instrument` until `stop`. """
+        return bool(self._sessions)
+
+    def instrument(self, session: requests.Session):
+        """
+        Attribute the time spent sending requests with the session to the `http` layer.
+
+        The first time, also wraps the model and schema classes of the SDK, until `stop`.
+        """
+        send = session.send
+
+        @functools.wraps(send)
+        def profiled_send(request, **kwargs):
+            with layer('http'):
+                return send(request, **kwargs)
+
+        with self._lock:
+            first = not self._sessions
+            self._sessions.append((session, send))
+        if first:
+            _instrumentation.acquire()
+        session.send = profiled_send
+
+    def stop(self):
+        """
+        Stop profiling: unwrap the sessions, and the model and schema classes once no other `Profiling`
+        is in use. The profile so far is kept. Calling `instrument` again resumes profiling.
+        """
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session, send in sessions:
+            session.send = send
+        if sessions:
+            _instrumentation.release()
+
+    @contextmanager
+    def call(self, api: str, method: str, count: bool = True) -> Iterator[None]:
+        """
+        Profile a call through an API client.
+
+        Args:
+            api (str): The name of the API client class.
+            method (str): The name of the method.
+            count (bool): Whether this is a new call, rather than the resumption of a call,
+                e.g. to consume more items of a generator. Defaults to True.
+        """
+        if not self.active:
+            yield
+            return
+        name = f'{api}.{method}'
+        with self._lock:
+            stats = self._methods.setdefault(name, MethodStats())
+
+        sampled = self.sample_allocations > 0 and self._random.random() < self.sample_allocations
+        if sampled:
+            self._start_tracing()
+        frame = _Frame(self, stats, 'sdk', _current_frame.get(), sampled)
+        token = _current_frame.set(frame)
+        try:
+            yield
+        finally:
+            _current_frame.reset(token)
+            wall, cpu = frame.end()
+            with self._lock:
+                stats.calls += count
+                stats.wall_time += wall
+                stats.cpu_time += cpu
+            if sampled:
+                self._stop_tracing()
+
+    def _start_tracing(self):
+        with self._lock:
+            if self._tracing or not tracemalloc.is_tracing():
+                if not self._tracing:
+                    tracemalloc.start()
+                self._tracing += 1
+
+    def _stop_tracing(self):
+        with self._lock:
+            if self._tracing:
+                self._tracing -= 1
+                if not self._tracing:
+                    tracemalloc.stop()
+
+    def _add(self, method: MethodStats, layer: str, wall: float, cpu: float, sampled: bool, blocks: int,
+             allocated: int):
+        with self._lock:
+            stats = method.layers.get(layer)
+            if stats is None:
+                stats = method.layers[layer] = LayerStats()
+            stats.calls += 1
+            stats.wall_time += wall
+            stats.cpu_time += cpu
+            if sampled:
+                stats.sampled_calls += 1
+                stats.alloc_blocks += blocks
+                stats.alloc_bytes += allocated
+
+    # Reporting
+
+    def stats(self) -> Dict[str, MethodStats]:
+        """ A copy of the profile of each API method called so far. """
+        with self._lock:
+            return {
+                name: MethodStats(stats.calls, stats.wall_time, stats.cpu_time, {
+                    layer_name: LayerStats(**asdict(layer_stats)) for layer_name, layer_stats in stats.layers.items()
+                })
+                for name, stats in self._methods.items()
+            }
+
+    def reset(self):
+        """ Forget the profile so far. """
+        with self._lock:
+            self._methods = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """ The profile of each API method called so far, as a JSON serializable dictionary. """
+        return {name: asdict(stats) for name, stats in self.stats().items()}
+
+    def to_json(self, **kwargs) -> str:
+        """ The profile of each API method called so far, as JSON. Keyword arguments are passed to `json.dumps`. """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def table(self) -> str:
+        """ The profile of each API method called so far, as a text table. """
+        lines = []
+        for name, stats in sorted(self.stats().items(), key=lambda item: -item[1].wall_time):
+            lines.append(f'{name}: {stats.calls} calls, {stats.wall_time * 1e3:.2f} ms wall, '
+                         f'{stats.cpu_time * 1e3:.2f} ms CPU')
+            lines.append(f"  {'layer':<14}{'entries':>9}{'wall ms':>11}{'cpu ms':>11}{'wall %':>8}"
+                         f"{'blocks/entry':>14}{'bytes/entry':>13}")
+            for layer_name in LAYERS:
+                layer_stats = stats.layers.get(layer_name)
+                if layer_stats is None:
+                    continue
+                share = layer_stats.wall_time / stats.wall_time * 100 if stats.wall_time else 0.0
+                if layer_stats.sampled_calls:
+                    blocks = f'{layer_stats.alloc_blocks / layer_stats.sampled_calls:.0f}'
+                    allocated = f'{layer_stats.alloc_bytes / layer_stats.sampled_calls:.0f}'
+                else:
+                    blocks = allocated = '-'
+                lines.append(f'  {layer_name:<14}{layer_stats.calls:>9}{layer_stats.wall_time * 1e3:>11.2f}'
+                             f'{layer_stats.cpu_time * 1e3:>11.2f}{share:>8.1f}{blocks:>14}{allocated:>13}')
+        return '\n'.join(lines)
+
+
+class ProfilingHook(TransactionHook):
+    """ Attributes the building of requests to the `request_build` layer, for `Profiling`. """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def audit_request(self, consumer, request_builder):
+        # Called before the request is built, and ended once the response is received.
+        parent = _current_frame.get()
+        if parent is None:
+            return
+        frame = _Frame(parent.profiling, parent.method, 'request_build', parent, parent.sampled)
+        self._local.pending = (frame, _current_frame.set(frame))
+
+    def _end(self):
+        pending = getattr(self._local, 'pending', None)
+        if pending is not None:
+            self._local.pending = None
+            frame, token = pending
+            _current_frame.reset(token)
+            frame.end()
+
+    def handle_response(self, consumer, response):
+        self._end()
+        return response
+
+    def handle_exception(self, consumer, exc_type, exc_val, exc_tb):
+        # Also called for exceptions raised by the response handlers, once the layer has ended.
+        self._end()
+
+
+class ProfilingConverter(ConverterFactory):
+    """
+    Attributes the deserialization of responses to the `json_decode` layer, for `Profiling`.
+    The schemas and models attribute their own time to the layers below it.
+    """
+
+    class ResponseBodyConverter(Converter):
+        def __init__(self, converter: Converter):
+            self._converter = converter
+
+        def convert(self, response):
+            with layer('json_decode'):
+                return self._converter(response)
+
+    def __init__(self, converters: Tuple[ConverterFactory, ...]):
+        self._converters = converters
+
+    def create_response_body_converter(self, cls, request_definition=None):
+        for factory in self._converters:
+            converter = factory.create_response_body_converter(cls, request_definition)
+            if converter is not None:
+                return self.ResponseBodyConverter(converter)
+        return None
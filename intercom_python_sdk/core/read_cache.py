@@ -0,0 +1,475 @@
+"""
+# Read-Through Cache
+
+`core/read_cache.py`
+
+An opt-in cache of slowly changing objects, enabled by passing a `ReadCache` to the `Configuration`.
+
+Reads of an object by ID (`articles.get_by_id`, `help_center.get_collection_by_id` and
+`get_section_by_id`, `teams.get_team_by_id`, `admins.get_admin_by_id`) and the listing of data
+attributes (`data_attributes.list_all`, used by `get_by_id`) are answered from the cache for the
+time-to-live of their type, without any request to the API. The `update`/`delete` calls of an object
+invalidate its cached reads, once sent.
+
+Unlike `core/http_cache.py`, which revalidates each read with the API, this trades freshness for
+latency: changes made to an object by anyone else (e.g. in the Intercom UI) are only seen once the
+cached read has expired. Pick the time-to-live of each type accordingly.
+
+The response bodies are stored in a backend: `MemoryBackend` (in process, the default), `DiskBackend`
+(a local directory, shared by the processes of a host) or `RedisBackend` (any Redis-protocol server,
+shared by all the processes using it). Each call still deserializes the body, so the models returned
+are never shared between callers.
+
+Cached reads are keyed by their URL and the headers selecting their representation (including the
+`Authorization` header, hashed), so that the workspaces of an `IntercomPool` never share them.
+
+## Example Usage
+
+```python
+from uplink.auth import BearerToken
+from intercom_python_sdk import Intercom, Configuration
+from intercom_python_sdk.core.read_cache import DiskBackend, ReadCache
+
+cache = ReadCache(DiskBackend('/var/cache/intercom'), ttls={'Article': 300, 'Team': 3600}, default_ttl=60)
+intercom = Intercom(config=Configuration(auth=BearerToken('my_api_key'), read_cache=cache))
+
+intercom.articles.get_by_id(1)  # Sent to the API
+intercom.articles.get_by_id(1)  # From the cache, for 5 minutes or until the article is updated
+```
+"""
+# Built-ins
+import datetime
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Pattern,
+    Set,
+    Tuple
+)
+from urllib.parse import urlsplit
+
+# External
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# From Current Package
+from .http_cache import HTTPCache
+
+# The cached reads, by type: a path with an `id` group is the read of one object.
+CACHED_READS: Tuple[Tuple[str, Pattern], ...] = (
+    ('Article', re.compile(r'/articles/(?P<id>[^/]+)')),
+    ('Collection', re.compile(r'/help_center/collections/(?P<id>[^/]+)')),
+    ('Section', re.compile(r'/help_center/sections/(?P<id>[^/]+)')),
+    ('Team', re.compile(r'/teams/(?P<id>[^/]+)')),
+    ('Admin', re.compile(r'/admins/(?P<id>[^/]+)')),
+    ('DataAttribute', re.compile(r'/data_attributes/?')),
+)
+
+# The writes invalidating cached reads, by type: those with an `id` group invalidate the reads of that object.
+INVALIDATING_WRITES: Tuple[Tuple[str, Pattern], ...] = (
+    ('Article', re.compile(r'/articles/(?P<id>[^/]+)')),
+    ('Collection', re.compile(r'/help_center/collections/(?P<id>[^/]+)')),
+    ('Section', re.compile(r'/help_center/sections/(?P<id>[^/]+)')),
+    ('Admin', re.compile(r'/admins/(?P<id>[^/]+)/away')),
+    ('DataAttribute', re.compile(r'/data_attributes(/[^/]+)?/?')),
+)
+
+
+def _api_path(request: requests.PreparedRequest, base_path: str = '') -> Optional[str]:
+    """ The path of a request relative to the base URL of the API, or None if it is not under it. """
+    path = urlsplit(request.url).path
+    if not base_path:
+        return path
+    if not path.startswith(base_path + '/'):
+        return None
+    return path[len(base_path):]
+
+
+def _group(type_name: str, match: 're.Match') -> str:
+    """ The group of the cached reads of an object, or of all the reads of a type if they are listings. """
+    return f"{type_name}:{match.groupdict().get('id') or '*'}"
+
+
+class CacheBackend:
+    """
+    The interface of the stores of a `ReadCache`.
+
+    Values are stored in groups (one per object, e.g. `Article:1`) so that all the cached reads of an object,
+    by different workspaces or API versions, are invalidated at once.
+    """
+
+    def get(self, group: str, key: str) -> Optional[bytes]:
+        """ The value stored for a key, or None if there is none or it has expired. """
+        raise NotImplementedError
+
+    def set(self, group: str, key: str, value: bytes, ttl: float):
+        """ Store a value for a key, for `ttl` seconds. """
+        raise NotImplementedError
+
+    def invalidate(self, group: str):
+        """ Drop all the values of a group. """
+        raise NotImplementedError
+
+    def clear(self):
+        """ Drop all the values. """
+        raise NotImplementedError
+
+
+class MemoryBackend(CacheBackend):
+    """
+    A thread-safe, in-process store, evicting the least recently used values first.
+
+    Args:
+        max_entries (int): The maximum number of values kept. Defaults to 1024.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple[str, str], Tuple[float, bytes]]' = OrderedDict()
+        self._groups: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, group: str, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get((group, key))
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.time():
+                self._remove((group, key))
+                return None
+            self._entries.move_to_end((group, key))
+            return value
+
+    def set(self, group: str, key: str, value: bytes, ttl: float):
+        with self._lock:
+            self._entries[(group, key)] = (time.time() + ttl, value)
+            self._entries.move_to_end((group, key))
+            self._groups.setdefault(group, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, entry_key: Tuple[str, str]):
+        group, key = entry_key
+        del self._entries[entry_key]
+        keys = self._groups.get(group)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._groups[group]
+
+    def invalidate(self, group: str):
+        with self._lock:
+            for key in self._groups.pop(group, ()):
+                del self._entries[(group, key)]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._groups.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskBackend(CacheBackend):
+    """
+    A store in a local directory, with a file per value, which several processes can share.
+
+    Files are replaced atomically, and the least recently used files are removed once there are
+    more than `max_entries` of them (counted by this process, which recounts them when pruning,
+    as other processes sharing the directory add and remove files too).
+
+    Args:
+        directory (str): The directory of the cache. Created if needed.
+        max_entries (int): The maximum number of values kept. Defaults to 10000.
+    """
+
+    def __init__(self, directory: str, max_entries: int = 10000):
+        self.directory = directory
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+        self._count = sum(len(files) for _, _, files in os.walk(directory))
+        self._lock = threading.Lock()
+
+    def _group_path(self, group: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(group.encode()).hexdigest()[:32])
+
+    def get(self, group: str, key: str) -> Optional[bytes]:
+        path = os.path.join(self._group_path(group), key)
+        try:
+            with open(path, 'rb') as file:
+                expires, _, value = file.read().partition(b'\n')
+            if float(expires) <= time.time():
+                os.remove(path)
+                with self._lock:
+                    self._count -= 1
+                return None
+            os.utime(path)  # Marks it as recently used
+        except (OSError, ValueError):
+            return None
+        return value
+
+    def set(self, group: str, key: str, value: bytes, ttl: float):
+        directory = self._group_path(group)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(dir=directory, prefix='.')
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(repr(time.time() + ttl).encode() + b'\n' + value)
+            path = os.path.join(directory, key)
+            new = not os.path.exists(path)  # Overwrites do not add an entry
+            os.replace(temporary, path)
+        except OSError:  # E.g. the group was invalidated meanwhile: the value is not cached
+            return
+        if not new:
+            return
+        with self._lock:
+            self._count += 1
+            if self._count > self.max_entries:
+                self._prune()
+
+    def _prune(self):
+        """ Remove the least recently used files, down to 90% of `max_entries`. Called with the lock held. """
+        files = []
+        for directory, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(directory, name)
+                try:
+                    files.append((os.stat(path).st_mtime, path))
+                except OSError:
+                    pass
+        files.sort()
+        excess = len(files) - int(self.max_entries * 0.9)
+        for _, path in files[:max(excess, 0)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._count = len(files) - max(excess, 0)
+
+    def invalidate(self, group: str):
+        directory = self._group_path(group)
+        try:
+            removed = len(os.listdir(directory))
+        except OSError:
+            return
+        shutil.rmtree(directory, ignore_errors=True)
+        with self._lock:
+            self._count = max(self._count - removed, 0)
+
+    def clear(self):
+        with self._lock:
+            for name in os.listdir(self.directory):
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+            self._count = 0
+
+
+class RedisBackend(CacheBackend):
+    """
+    A store in a Redis-protocol server (Redis, Valkey, KeyDB, ...), which all the processes using it share.
+
+    Values expire with the time-to-live of their type. Bound the size of the cache with the `maxmemory` of
+    the server and an `allkeys-lru` eviction policy.
+
+    Args:
+        client: A client of the server, with the interface of `redis.Redis` (e.g. `redis.Redis.from_url(url)`).
+        prefix (str): The prefix of the keys of the cache. Defaults to 'intercom:'.
+    """
+
+    def __init__(self, client: Any, prefix: str = 'intercom:'):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, group: str, key: str) -> Optional[bytes]:
+        return self.client.get(f"{self.prefix}{group}:{key}")
+
+    def set(self, group: str, key: str, value: bytes, ttl: float):
+        # The keys of a group are kept in a set, expiring with them: they share the time-to-live of their type.
+        milliseconds = max(int(ttl * 1000), 1)
+        pipeline = self.client.pipeline()
+        pipeline.set(f"{self.prefix}{group}:{key}", value, px=milliseconds)
+        pipeline.sadd(f"{self.prefix}{group}", key)
+        pipeline.pexpire(f"{self.prefix}{group}", milliseconds)
+        pipeline.execute()
+
+    def invalidate(self, group: str):
+        keys = self.client.smembers(f"{self.prefix}{group}")
+        names = [f"{self.prefix}{group}:{key.decode() if isinstance(key, bytes) else key}" for key in keys]
+        self.client.delete(f"{self.prefix}{group}", *names)
+
+    def clear(self):
+        names = list(self.client.scan_iter(match=f"{self.prefix}*"))
+        if names:
+            self.client.delete(*names)
+
+
+class ReadCache:
+    """
+    The read-through cache of the API clients. See the module documentation.
+
+    Args:
+        backend (CacheBackend): The store of the cache. Defaults to a `MemoryBackend`.
+        ttls (dict): The time-to-live of the cached reads of each type, in seconds, by model name
+            (`Article`, `Collection`, `Section`, `Team`, `Admin` or `DataAttribute`). 0 disables caching a type.
+        default_ttl (float): The time-to-live of the types not in `ttls`, in seconds. Defaults to 60.
+
+    Attributes:
+        hits (int): The number of reads answered from the cache.
+        misses (int): The number of cacheable reads sent to the API.
+        invalidations (int): The number of writes which invalidated cached reads.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: float = 60.0):
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.hits = self.misses = self.invalidations = 0
+        self._writes = 0  # Reads are only stored if no write was made while they were in flight
+        self._lock = threading.Lock()
+
+    def ttl_of(self, type_name: str) -> float:
+        """ The time-to-live of the cached reads of a type, in seconds. """
+        return self.ttls.get(type_name, self.default_ttl)
+
+    def read_of(self, request: requests.PreparedRequest, base_path: str = '') -> Optional[Tuple[str, str]]:
+        """
+        The type and group of a cacheable read, or None if the request is not one.
+
+        Args:
+            request (requests.PreparedRequest): The request.
+            base_path (str): The path of the base URL of the API, e.g. '/intercom' behind a proxy. Defaults to ''.
+        """
+        path = _api_path(request, base_path) if request.method == 'GET' else None
+        if path is None:
+            return None
+        for type_name, pattern in CACHED_READS:
+            match = pattern.fullmatch(path)
+            if match is not None:
+                return (type_name, _group(type_name, match)) if self.ttl_of(type_name) > 0 else None
+        return None
+
+    @staticmethod
+    def key_for(request: requests.PreparedRequest) -> str:
+        """ The key of a read within its group: a digest of its URL and of the headers selecting its representation. """
+        return hashlib.sha256(repr(HTTPCache.key_for(request)).encode()).hexdigest()[:32]
+
+    def invalidate(self, request: requests.PreparedRequest, base_path: str = ''):
+        """ Drop the cached reads invalidated by a write request, if any. See `read_of` for `base_path`. """
+        path = _api_path(request, base_path)
+        if path is None:
+            return
+        for type_name, pattern in INVALIDATING_WRITES:
+            match = pattern.fullmatch(path)
+            if match is not None:
+                self.invalidate_object(type_name, match.groupdict().get('id'))
+                return
+
+    def invalidate_object(self, type_name: str, object_id: Any = None):
+        """
+        Drop the cached reads of an object, e.g. after changing it by other means than the API clients.
+
+        Args:
+            type_name (str): The model name of the object, e.g. 'Article'.
+            object_id: The ID of the object. None for the types which are cached as a listing (`DataAttribute`).
+        """
+        with self._lock:
+            self._writes += 1
+            self.invalidations += 1
+        self.backend.invalidate(f"{type_name}:{'*' if object_id is None else object_id}")
+
+    def clear(self):
+        """ Drop all the cached reads. """
+        self.backend.clear()
+
+    def _increment(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+class ReadThroughAdapter(BaseAdapter):
+    """
+    A transport adapter answering cacheable reads from a `ReadCache`, and invalidating it on writes.
+
+    Responses from the cache have a `200` status code, and carry `from_read_cache = True`.
+
+    Args:
+        cache (ReadCache): The cache.
+        adapter (BaseAdapter): The adapter actually sending requests. Defaults to a new `HTTPAdapter`.
+        base_url (str): The base URL of the API, whose path is stripped from request paths before
+            matching them to cached reads and invalidating writes. Defaults to ''.
+    """
+
+    def __init__(self, cache: ReadCache, adapter: Optional[BaseAdapter] = None, base_url: str = ''):
+        super().__init__()
+        self.cache = cache
+        self.adapter = adapter or HTTPAdapter()
+        self.base_url = base_url
+
+    @property
+    def base_url(self) -> str:
+        """ The base URL of the API. """
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, base_url: str):
+        self._base_url = base_url
+        self._base_path = urlsplit(base_url).path.rstrip('/')
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, **kwargs) -> requests.Response:
+        if request.method not in ('GET', 'HEAD', 'OPTIONS'):
+            try:
+                return self.adapter.send(request, stream=stream, **kwargs)
+            finally:
+                self.cache.invalidate(request, self._base_path)  # Even if it failed, as it may have been applied
+
+        read = None if stream else self.cache.read_of(request, self._base_path)
+        if read is None:
+            return self.adapter.send(request, stream=stream, **kwargs)
+
+        type_name, group = read
+        key = self.cache.key_for(request)
+        content = self.cache.backend.get(group, key)
+        if content is not None:
+            self.cache._increment('hits')
+            return self._replay(content, request)
+
+        self.cache._increment('misses')
+        writes = self.cache._writes
+        response = self.adapter.send(request, stream=stream, **kwargs)
+        if response.status_code == 200 and 'no-store' not in response.headers.get('Cache-Control', '') \
+                and writes == self.cache._writes:
+            self.cache.backend.set(group, key, response.content, self.cache.ttl_of(type_name))
+        response.from_read_cache = False
+        return response
+
+    def _replay(self, content: bytes, request: requests.PreparedRequest) -> requests.Response:
+        """ Build a response from a cached body. """
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict({'Content-Type': 'application/json',
+                                                'Content-Length': str(len(content))})
+        response._content = content
+        response._content_consumed = True
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.elapsed = datetime.timedelta(0)
+        response.connection = self
+        response.from_read_cache = True
+        return response
+
+    def close(self):
+        self.adapter.close()
@@ -0,0 +1,461 @@
+"""
+# Fair-Share Scheduler
+
+`core/scheduler.py`
+
+Runs API calls for many tenants (e.g. Intercom workspaces) on a shared pool of worker threads,
+so that one tenant flooding the pool with calls cannot starve the others.
+
+Each tenant has its own queue. Workers take calls from the queues by weighted round-robin: a tenant
+of weight 3 gets up to three calls dispatched for each call of a tenant of weight 1, and every tenant
+with queued calls is served in each round, which bounds the wait of its calls whatever the length
+of the other queues.
+
+A tenant can also be capped to a number of concurrent requests, and to a rate of requests (a token
+bucket), to stay within its Intercom rate limit budget. These limits apply to each HTTP request, not
+to whole calls: a `SchedulingAdapter` mounted on the session holds a slot of the request's tenant while
+sending it, so the pages fetched concurrently by `iter_all` and the calls made without `submit` count
+too. `IntercomPool(scheduler=...)` mounts one on its session. The concurrency cap also applies to the
+calls run by the workers, so that a capped tenant does not take workers only to wait for its own slots.
+
+A request rejected by Intercom's rate limit pauses its tenant until the rate limit resets. A call
+failing with a rate limit error is retried then; the other tenants keep being served in the meantime.
+
+A tenant is any hashable key: the token of a workspace from an `IntercomPool`, or the
+`Configuration` of an `Intercom` client.
+
+## Example Usage
+
+```python
+from intercom_python_sdk import IntercomPool
+from intercom_python_sdk.core.scheduler import FairScheduler
+
+scheduler = FairScheduler(max_workers=16, max_concurrency=4, rate=15)
+pool = IntercomPool(scheduler=scheduler)
+
+client = pool.client('workspace_token')
+future = client.submit(client.articles.list_all)
+articles = future.result()
+client.admins.me()  # Not queued, but still sent within the limits of the workspace
+
+scheduler.configure('vip_workspace_token', weight=4)  # Served four times as often as the others
+```
+"""
+# Built-ins
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError, Future
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple
+)
+
+# External
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+# From Current Package
+from .bulk import get_rate_limit_reset
+from .metrics import current_attempt
+
+
+@dataclass
+class TenantStats:
+    """
+    The state of a tenant of a `FairScheduler`.
+
+    Attributes:
+        queued (int): The number of calls waiting to be run.
+        running (int): The number of calls being run.
+        completed (int): The number of calls completed, successfully or not.
+        rate_limited (int): The number of calls rejected by the rate limit of the API, and retried.
+        sending (int): The number of requests being sent.
+        sent (int): The number of requests sent.
+    """
+    queued: int = 0
+    running: int = 0
+    completed: int = 0
+    rate_limited: int = 0
+    sending: int = 0
+    sent: int = 0
+
+
+class _Call:
+    __slots__ = ('future', 'context', 'fn', 'args', 'kwargs', 'attempts')
+
+    def __init__(self, fn: Callable, args: tuple, kwargs: dict):
+        self.future: Future = Future()
+        self.context = contextvars.copy_context()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.attempts = 0
+
+
+class _Tenant:
+    __slots__ = ('key', 'queue', 'weight', 'max_concurrency', 'rate', 'burst', 'tokens', 'refilled_at',
+                 'credit', 'paused_until', 'waiting', 'forgotten', 'stats')
+
+    def __init__(self, key: Hashable, weight: int, max_concurrency: Optional[int], rate: Optional[float],
+                 burst: Optional[int], now: float):
+        self.key = key
+        self.queue: Deque[_Call] = deque()
+        self.weight = weight
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.tokens = float(self.burst)
+        self.refilled_at = now
+        self.credit = weight
+        self.paused_until = 0.0
+        self.waiting = 0  # Requests waiting for a slot
+        self.forgotten = False  # Dropped once idle
+        self.stats = TenantStats()
+
+    def ready_in(self, now: float, active: int) -> float:
+        """
+        Seconds until the tenant may start a call or send a request (0 if now), or infinity if its `active`
+        calls or requests are at its concurrency cap.
+        """
+        if self.max_concurrency is not None and active >= self.max_concurrency:
+            return float('inf')
+        delay = self.paused_until - now
+        if self.rate is not None:
+            self.tokens = min(float(self.burst), self.tokens + (now - self.refilled_at) * self.rate)
+            self.refilled_at = now
+            if self.tokens < 1:
+                delay = max(delay, (1 - self.tokens) / self.rate)
+        return max(delay, 0.0)
+
+
+class FairScheduler:
+    """
+    Runs calls on a shared pool of worker threads, fairly between tenants. See the module documentation.
+
+    The limits given here are the defaults of every tenant; use `configure` to change them for one tenant.
+
+    Args:
+        max_workers (int): The number of worker threads. Keep it at or below the connection pool size
+            of the sessions used by the calls. Defaults to 8.
+        weight (int): The number of calls dispatched for a tenant in each round. Defaults to 1.
+        max_concurrency (int): The maximum number of requests of a tenant sent at once, and of its calls run at once.
+            Defaults to None (no cap).
+        rate (float): The maximum number of requests of a tenant sent per second. Defaults to None (no cap).
+        burst (int): The number of requests a tenant may send at once, within its `rate`. Defaults to the rate.
+        max_retries (int): The maximum number of retries of a rate limited call. Defaults to 5.
+    """
+
+    def __init__(self, max_workers: int = 8, weight: int = 1, max_concurrency: Optional[int] = None,
+                 rate: Optional[float] = None, burst: Optional[int] = None, max_retries: int = 5):
+        if max_workers < 1 or weight < 1:
+            raise ValueError("max_workers and weight must be at least 1.")
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self._defaults = {'weight': weight, 'max_concurrency': max_concurrency, 'rate': rate, 'burst': burst}
+        self._tenants: Dict[Hashable, _Tenant] = {}
+        self._ring: Deque[_Tenant] = deque()  # The tenants with queued calls, in round-robin order
+        self._workers: List[threading.Thread] = []
+        self._idle_workers = 0
+        self._shutdown = False
+        self._condition = threading.Condition()
+
+    # Tenants
+
+    def _tenant(self, key: Hashable) -> _Tenant:
+        tenant = self._tenants.get(key)
+        if tenant is None:
+            tenant = self._tenants[key] = _Tenant(key, now=time.time(), **self._defaults)
+        return tenant
+
+    def configure(self, tenant: Hashable, weight: Optional[int] = None, max_concurrency: Optional[int] = None,
+                  rate: Optional[float] = None, burst: Optional[int] = None):
+        """
+        Set the limits of a tenant. Limits left to None keep their current value.
+
+        Args:
+            tenant (Hashable): The tenant.
+            weight (int): The number of calls dispatched for the tenant in each round.
+            max_concurrency (int): The maximum number of requests of the tenant sent at once,
+                and of its calls run at once.
+            rate (float): The maximum number of requests of the tenant sent per second.
+            burst (int): The number of requests the tenant may send at once, within its `rate`.
+        """
+        with self._condition:
+            state = self._tenant(tenant)
+            if weight is not None:
+                if weight < 1:
+                    raise ValueError("weight must be at least 1.")
+                state.weight = state.credit = weight
+            if max_concurrency is not None:
+                state.max_concurrency = max_concurrency
+            if rate is not None:
+                state.rate = rate
+                state.burst = burst if burst is not None else max(1, int(rate))
+                state.tokens = min(state.tokens, float(state.burst))
+            elif burst is not None:
+                state.burst = burst
+            self._condition.notify_all()
+
+    def forget(self, tenant: Hashable):
+        """
+        Drop the state of a tenant, e.g. once it is evicted from a pool. A tenant with queued or running calls,
+        or with requests being sent, is dropped once they are done, unless it is given new calls meanwhile.
+        """
+        with self._condition:
+            state = self._tenants.get(tenant)
+            if state is not None:
+                state.forgotten = True
+                self._drop_if_forgotten(state)
+
+    def _drop_if_forgotten(self, tenant: _Tenant):
+        """ Drop a forgotten tenant once it is idle. Called with the lock held. """
+        if tenant.forgotten and not tenant.queue and not tenant.stats.running and not tenant.waiting \
+                and not tenant.stats.sending and self._tenants.get(tenant.key) is tenant:
+            del self._tenants[tenant.key]
+
+    def stats(self) -> Dict[Hashable, TenantStats]:
+        """ A copy of the state of each tenant. """
+        with self._condition:
+            return {key: TenantStats(len(tenant.queue), tenant.stats.running, tenant.stats.completed,
+                                     tenant.stats.rate_limited, tenant.stats.sending, tenant.stats.sent)
+                    for key, tenant in self._tenants.items()}
+
+    # Requests
+
+    @contextmanager
+    def request(self, tenant: Hashable) -> Iterator[None]:
+        """
+        Hold a slot of a tenant while sending a request, e.g. `with scheduler.request(tenant): ...`.
+        Blocks until the tenant is below its concurrency cap, has a token of its rate, and is not paused.
+
+        Args:
+            tenant (Hashable): The tenant the request is sent for.
+        """
+        with self._condition:
+            state = self._tenant(tenant)
+            state.waiting += 1
+            try:
+                while True:
+                    delay = state.ready_in(time.time(), state.stats.sending)
+                    if delay == 0:
+                        break
+                    self._condition.wait(None if delay == float('inf') else delay)
+            finally:
+                state.waiting -= 1
+            state.stats.sending += 1
+            if state.rate is not None:
+                state.tokens -= 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                state.stats.sending -= 1
+                state.stats.sent += 1
+                self._drop_if_forgotten(state)
+                self._condition.notify_all()
+
+    def pause(self, tenant: Hashable, until: float):
+        """
+        Hold the calls and requests of a tenant, e.g. until its rate limit resets.
+
+        Args:
+            tenant (Hashable): The tenant.
+            until (float): The unix timestamp at which the tenant is served again.
+        """
+        with self._condition:
+            state = self._tenant(tenant)
+            state.paused_until = max(state.paused_until, until)
+            self._condition.notify_all()
+
+    # Calls
+
+    def submit(self, tenant: Hashable, fn: Callable, /, *args, **kwargs) -> Future:
+        """
+        Queue a call for a tenant. It runs in a copy of the current context, like `ContextThreadPoolExecutor`.
+
+        Args:
+            tenant (Hashable): The tenant the call is made for.
+            fn (Callable): The function to call, as `fn(*args, **kwargs)`.
+
+        Returns:
+            Future: The future result of the call.
+
+        Raises:
+            RuntimeError: If the scheduler was shut down.
+        """
+        call = _Call(fn, args, kwargs)
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit calls after shutdown.")
+            state = self._tenant(tenant)
+            state.forgotten = False
+            if not state.queue:
+                self._ring.append(state)
+            state.queue.append(call)
+            state.stats.queued += 1
+            if not self._idle_workers and len(self._workers) < self.max_workers:
+                worker = threading.Thread(target=self._work, name=f'intercom-scheduler-{len(self._workers)}',
+                                          daemon=True)
+                self._workers.append(worker)
+                worker.start()
+            self._condition.notify_all()  # Requests waiting for a slot share the condition
+        return call.future
+
+    def _next(self) -> Optional[Tuple[_Tenant, _Call]]:
+        """ Take the next call to run, by weighted round-robin. Called with the lock held. Blocks until one is due. """
+        while True:
+            if self._shutdown and not self._ring:
+                return None
+
+            now = time.time()
+            wait = None
+            for _ in range(len(self._ring)):
+                tenant = self._ring[0]
+                delay = tenant.ready_in(now, tenant.stats.running)
+                if delay > 0:
+                    self._ring.rotate(-1)
+                    wait = delay if wait is None else min(wait, delay)
+                    continue
+
+                call = tenant.queue.popleft()
+                tenant.stats.queued -= 1
+                tenant.stats.running += 1  # Its tokens are taken by its requests
+                tenant.credit -= 1
+                if not tenant.queue:
+                    self._ring.popleft()
+                    tenant.credit = tenant.weight
+                elif tenant.credit <= 0:
+                    self._ring.rotate(-1)
+                    tenant.credit = tenant.weight
+                return tenant, call
+
+            self._idle_workers += 1
+            try:
+                self._condition.wait(None if wait is None or wait == float('inf') else wait)
+            finally:
+                self._idle_workers -= 1
+
+    def _work(self):
+        while True:
+            with self._condition:
+                taken = self._next()
+            if taken is None:
+                return
+            tenant, call = taken
+            if call.attempts == 0 and not call.future.set_running_or_notify_cancel():
+                self._done(tenant)
+                continue
+            self._run(tenant, call)
+
+    def _run(self, tenant: _Tenant, call: _Call):
+        call.attempts += 1
+        try:
+            result = call.context.run(self._call_with_attempt, call)
+        except BaseException as error:  # noqa: The error is reported on the future
+            reset = get_rate_limit_reset(error) if isinstance(error, Exception) else None
+            if reset is not None and call.attempts <= self.max_retries:
+                with self._condition:
+                    tenant.stats.running -= 1
+                    tenant.stats.rate_limited += 1
+                    tenant.paused_until = max(tenant.paused_until, reset)
+                    if not tenant.queue:
+                        self._ring.append(tenant)
+                    tenant.queue.appendleft(call)
+                    tenant.stats.queued += 1
+                    self._condition.notify_all()
+                return
+            call.future.set_exception(error)
+        else:
+            call.future.set_result(result)
+        self._done(tenant)
+
+    @staticmethod
+    def _call_with_attempt(call: _Call) -> Any:
+        current_attempt.set(call.attempts)
+        return call.fn(*call.args, **call.kwargs)
+
+    def _done(self, tenant: _Tenant):
+        with self._condition:
+            tenant.stats.running -= 1
+            tenant.stats.completed += 1
+            self._drop_if_forgotten(tenant)
+            self._condition.notify_all()
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """
+        Stop accepting calls, and stop the workers once the queued calls are done.
+
+        Args:
+            wait (bool): Whether to block until the workers have stopped. Defaults to True.
+            cancel_futures (bool): Whether to cancel the queued calls instead of running them. Defaults to False.
+        """
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                for tenant in self._ring:
+                    while tenant.queue:
+                        call = tenant.queue.popleft()
+                        tenant.stats.queued -= 1
+                        if call.attempts:  # Retried after a rate limit: its future is already running
+                            call.future.set_exception(CancelledError())
+                        else:
+                            call.future.cancel()
+                    self._drop_if_forgotten(tenant)
+                self._ring.clear()
+            self._condition.notify_all()
+            workers = list(self._workers)
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+
+class SchedulingAdapter(BaseAdapter):
+    """
+    A transport adapter which sends each request within the limits of its tenant on a `FairScheduler`.
+
+    A response rejected by Intercom's rate limit (429) pauses the tenant until the rate limit resets.
+
+    Args:
+        scheduler (FairScheduler): The scheduler holding the limits of the tenants.
+        tenant (Callable): Returns the tenant of the request being sent, from the current context.
+            Requests without a tenant (None) are sent right away.
+        adapter (BaseAdapter): The adapter actually sending requests. Defaults to a new `HTTPAdapter`.
+    """
+
+    def __init__(self, scheduler: FairScheduler, tenant: Callable[[], Optional[Hashable]],
+                 adapter: Optional[BaseAdapter] = None):
+        super().__init__()
+        self.scheduler = scheduler
+        self.tenant = tenant
+        self.adapter = adapter or HTTPAdapter()
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        tenant = self.tenant()
+        if tenant is None:
+            return self.adapter.send(request, **kwargs)
+
+        with self.scheduler.request(tenant):
+            response = self.adapter.send(request, **kwargs)
+            if response.status_code == 429:  # Paused before the slot is released to the next request
+                self.scheduler.pause(tenant, get_rate_limit_reset(requests.HTTPError(response=response)))
+        return response
+
+    def close(self):
+        self.adapter.close()
@@ -7,11 +7,20 @@ Extensible schemas applicable to all APIS.
 """
 # External
 import marshmallow
+from marshmallow import fields
+
+# From Current Package
+from .model_base import loading_models
 
 
 class SchemaBase(marshmallow.Schema):
     """
     Base schema for all API schemas.
+
+    Args:
+        lazy (bool): When True, `LazyNested` fields are not deserialized on load. Their raw payload
+            is wrapped in a `DeferredNested` object instead, to be loaded on first access by the model.
+            Propagates to nested schemas, so that e.g. a lazy list schema yields lazy items.
     """
 
     class Meta:
@@ -22,5 +31,79 @@ class SchemaBase(marshmallow.Schema):
         """
         unknown = marshmallow.EXCLUDE  # Exclude unknown fields from deserialization
 
+    def __init__(self, *args, lazy: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy = lazy
+
+    @property
+    def lazy(self) -> bool:
+        """ Whether `LazyNested` fields of this schema (and of its nested schemas) are deferred on load. """
+        return self._lazy
+
+    @lazy.setter
+    def lazy(self, value: bool):
+        self._lazy = value
+        if not value:
+            return
+
+        for field in self.fields.values():
+            field = getattr(field, 'inner', field)  # Unwrap fields.List
+            if isinstance(field, fields.Nested) and not isinstance(field, LazyNested) \
+                    and isinstance(field.schema, SchemaBase):
+                field.schema.lazy = True
+
+    def load(self, data, **kwargs):
+        # Attributed to the `schema_load` layer while profiling, see `Profiling.instrument`.
+        with loading_models():
+            return super().load(data, **kwargs)
+
     def to_dict(self):
         return {name: type(field).__name__ for name, field in self.fields.items()}
+
+
+class DeferredNested:
+    """
+    A raw nested payload whose deserialization has been deferred.
+
+    Produced by `LazyNested` fields when the root schema is loaded with `lazy=True`.
+    Uses `__slots__` so that `APIProxyInterface` does not walk into the raw payload.
+
+    Args:
+        schema (marshmallow.Schema): The schema instance used to load the payload.
+        raw (dict): The raw payload, as received from the API.
+    """
+    __slots__ = ('schema', 'raw')
+
+    def __init__(self, schema: marshmallow.Schema, raw):
+        self.schema = schema
+        self.raw = raw
+
+    def __deepcopy__(self, memo):
+        # Never changed once created: copies of a model share its deferred payloads, and their schema.
+        return self
+
+    def load(self):
+        """
+        Deserialize the raw payload with its schema.
+
+        Returns:
+            The deserialized value.
+
+        Raises:
+            marshmallow.ValidationError: If the raw payload does not validate against the schema.
+        """
+        return self.schema.load(self.raw)
+
+
+class LazyNested(fields.Nested):
+    """
+    A nested field which defers deserialization when its root schema is loaded with `lazy=True`.
+
+    Models receiving a `DeferredNested` value are expected to call `DeferredNested.load()`
+    the first time the value is accessed, and cache the result.
+    """
+
+    def _deserialize(self, value, attr, data, partial=None, **kwargs):
+        if value is not None and getattr(self.root, 'lazy', False):
+            return DeferredNested(self.schema, value)
+        return super()._deserialize(value, attr, data, partial=partial, **kwargs)
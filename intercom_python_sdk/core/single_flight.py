@@ -0,0 +1,117 @@
+"""
+# Single-Flight Requests
+
+`core/single_flight.py`
+
+An opt-in coalescing of identical concurrent reads, enabled with `Configuration(single_flight=True)`.
+
+When several threads send the same GET request at the same time (e.g. `admins.me()` or
+`articles.get_by_id(1)` for the same id), only the first one is sent to the API; the others
+wait for its response and get a copy of it. Requests are identical when they have the same
+method, URL (including the query parameters) and the headers that select a representation,
+so the calls of different workspaces of an `IntercomPool` are never coalesced.
+
+Each caller still deserializes its own copy of the response, and so gets its own model instance.
+Requests made after the response was received are sent again: this is not a cache
+(see `core/http_cache.py` for that).
+"""
+# Built-ins
+import threading
+from typing import (
+    Dict,
+    Hashable,
+    Optional
+)
+
+# External
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# From Current Package
+from .http_cache import HTTPCache
+
+
+class _Flight:
+    """ A request being sent, and its outcome once received. """
+    __slots__ = ('done', 'response', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response: Optional[requests.Response] = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlightAdapter(BaseAdapter):
+    """
+    A transport adapter which sends identical concurrent GET requests only once.
+
+    Responses shared with waiting requests carry `coalesced = True`.
+
+    Args:
+        adapter (BaseAdapter): The adapter actually sending requests. Defaults to a new `HTTPAdapter`.
+
+    Attributes:
+        coalesced (int): The number of requests answered with the response of another request.
+    """
+
+    def __init__(self, adapter: Optional[BaseAdapter] = None):
+        super().__init__()
+        self.adapter = adapter or HTTPAdapter()
+        self.coalesced = 0
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, **kwargs) -> requests.Response:
+        # Streamed responses can only be read once.
+        if request.method != 'GET' or stream:
+            return self.adapter.send(request, stream=stream, **kwargs)
+
+        key = HTTPCache.key_for(request)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                flight.waiters += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return self._share(flight.response, request)
+
+        try:
+            response = self.adapter.send(request, stream=stream, **kwargs)
+            response.content  # Read the body before sharing it
+            flight.response = response
+            return response
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+                self.coalesced += flight.waiters
+            flight.done.set()
+
+    def _share(self, original: requests.Response, request: requests.PreparedRequest) -> requests.Response:
+        """ Build a copy of a response, for another request. """
+        response = requests.Response()
+        response.status_code = original.status_code
+        response.reason = original.reason
+        response.headers = CaseInsensitiveDict(original.headers)
+        response._content = original.content
+        response._content_consumed = True
+        response.encoding = original.encoding
+        response.url = request.url
+        response.request = request
+        response.elapsed = original.elapsed
+        response.connection = self
+        response.coalesced = True
+        return response
+
+    def close(self):
+        self.adapter.close()
@@ -0,0 +1,240 @@
+"""
+# Tracing
+
+`core/tracing.py`
+
+OpenTelemetry tracing of the API clients. Enable it by passing a `Tracing` instance to the
+`Configuration`; it requires the `opentelemetry-api` package.
+
+Each call through an API client gets a span (e.g. `ArticlesAPI.get_by_id`), with child spans for
+the HTTP request, the deserialization of the response and the injection of the API client into
+the returned models. The thread pools of the SDK run their work in the context of the caller,
+so requests made concurrently (e.g. by `run_bulk` or the pagination helpers) are traced under it.
+
+## Example Usage
+
+```python
+from uplink.auth import BearerToken
+from intercom_python_sdk import Intercom
+from intercom_python_sdk.core.configuration import Configuration
+from intercom_python_sdk.core.tracing import Tracing
+
+config = Configuration(auth=BearerToken('my_api_key'), tracing=Tracing())
+intercom = Intercom(config=config)
+```
+"""
+# Built-ins
+import threading
+from contextlib import contextmanager
+from typing import Any, ContextManager, Iterator, Optional, Tuple
+
+# External
+from uplink.converters import ConverterFactory, MarshmallowConverter
+from uplink.converters.interfaces import Converter
+from uplink.hooks import TransactionHook
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import Status, StatusCode
+except ImportError:  # pragma: no cover
+    trace = None
+
+# From Current Package
+from .errors import IntercomErrorList
+from .metrics import endpoint_of
+
+TRACER_NAME = 'intercom_python_sdk'
+
+
+def _set_error(span, description: Optional[str] = None):
+    if trace is not None:
+        span.set_status(Status(StatusCode.ERROR, description))
+
+
+class Tracing:
+    """
+    Traces the calls of the API clients sharing a `Configuration`.
+
+    Args:
+        tracer_provider: The OpenTelemetry tracer provider. Defaults to the global one.
+        tracer: The tracer to use, instead of getting one from the tracer provider.
+
+    Raises:
+        ImportError: If no tracer is given and `opentelemetry-api` is not installed.
+    """
+
+    def __init__(self, tracer_provider=None, tracer=None):
+        if tracer is None:
+            if trace is None:
+                raise ImportError("Tracing requires the 'opentelemetry-api' package.")
+            tracer = trace.get_tracer(TRACER_NAME, tracer_provider=tracer_provider)
+        self.tracer = tracer
+        self._local = threading.local()
+        self.hook = TracingHook(self)
+
+    def converter(self, converters=()) -> 'TracingConverter':
+        """ A converter tracing the given converters, falling back to uplink's marshmallow converter. """
+        return TracingConverter(self, tuple(converters) + (MarshmallowConverter(),))
+
+    @contextmanager
+    def call_span(self, api: str, method: str) -> Iterator['CallSpan']:
+        """
+        The span of a call through an API client, current while the call runs.
+
+        Ended once the call returns, unless it was handed over to the generator returned by the call
+        (see `CallSpan.hand_over`), which then ends it once exhausted or closed.
+        """
+        call = CallSpan(self, f'{api}.{method}', {'intercom.api': api, 'intercom.method': method})
+        try:
+            with call.current():
+                yield call
+        finally:
+            if not call.handed_over:
+                call.end()
+
+    def use_span(self, span) -> ContextManager[Any]:
+        """ Make an already started span the current span, without ending it. """
+        if trace is not None:
+            # Errors are recorded by `CallSpan.current`
+            return trace.use_span(span, end_on_exit=False, record_exception=False, set_status_on_exception=False)
+        return self.tracer.use_span(span)  # A tracer given without opentelemetry installed must provide it
+
+    def span(self, name: str, **attributes):
+        """ A child span of the current span. """
+        return self.tracer.start_as_current_span(name, attributes=attributes)
+
+    # Request state, set by the hook. Requests are blocking, one at a time per thread.
+
+    def _start(self):
+        self._local.pending = self.tracer.start_span('intercom.http')
+
+    def _take_pending(self) -> Optional[Any]:
+        span = getattr(self._local, 'pending', None)
+        self._local.pending = None
+        return span
+
+
+class CallSpan:
+    """
+    The span of a call through an API client. See `Tracing.call_span`.
+
+    Attributes:
+        span: The OpenTelemetry span.
+        handed_over (bool): Whether the span is ended by the generator returned by the call.
+    """
+
+    def __init__(self, tracing: Tracing, name: str, attributes: dict):
+        self._tracing = tracing
+        self.span = tracing.tracer.start_span(name, attributes=attributes)
+        self.handed_over = False
+
+    def hand_over(self) -> 'CallSpan':
+        """ Leave the span open once the call returns, for the generator it returned. """
+        self.handed_over = True
+        return self
+
+    @contextmanager
+    def current(self) -> Iterator[Any]:
+        """ Make the span current, e.g. for each step of a generator, recording the errors raised meanwhile. """
+        with self._tracing.use_span(self.span):
+            try:
+                yield self.span
+            except IntercomErrorList as error:
+                request_id = error.request_id or next((e.request_id for e in error.errors if e.request_id), None)
+                if request_id:
+                    self.span.set_attribute('intercom.request_id', request_id)
+                self.span.set_attribute('intercom.error_codes', [e.code for e in error.errors])
+                self._fail(error)
+                raise
+            except Exception as error:
+                self._fail(error)
+                raise
+
+    def _fail(self, error: Exception):
+        self.span.record_exception(error)
+        _set_error(self.span, str(error))
+
+    def end(self):
+        self.span.end()
+
+
+class TracingHook(TransactionHook):
+    """ Traces HTTP requests, for `Tracing`. Added to the hooks of the `Configuration`. """
+
+    def __init__(self, tracing: Tracing):
+        self._tracing = tracing
+
+    def audit_request(self, consumer, request_builder):
+        # Called before the request is built, so its attributes are read from the response.
+        self._tracing._start()
+
+    def handle_response(self, consumer, response):
+        span = self._tracing._take_pending()
+        if span is None:
+            return response
+
+        request = response.request
+        endpoint = endpoint_of(request.method, request.url)
+        span.update_name(endpoint)
+        for name, value in self._attributes(request, endpoint):
+            span.set_attribute(name, value)
+        span.set_attribute('http.response.status_code', response.status_code)
+        content = getattr(response, '_content', None)
+        if isinstance(content, bytes):
+            span.set_attribute('http.response.body.size', len(content))
+        request_id = response.headers.get('X-Request-Id')
+        if request_id:
+            span.set_attribute('intercom.request_id', request_id)
+        if response.status_code >= 400:
+            _set_error(span)
+        span.end()
+        return response
+
+    def handle_exception(self, consumer, exc_type, exc_val, exc_tb):
+        # Also called for exceptions raised by the response handlers, once the span has ended.
+        span = self._tracing._take_pending()
+        if span is None:
+            return
+
+        request = getattr(exc_val, 'request', None)
+        if request is not None:
+            endpoint = endpoint_of(request.method, request.url)
+            span.update_name(endpoint)
+            for name, value in self._attributes(request, endpoint):
+                span.set_attribute(name, value)
+        span.record_exception(exc_val)
+        _set_error(span, str(exc_val))
+        span.end()
+
+    @staticmethod
+    def _attributes(request, endpoint: str) -> Iterator[Tuple[str, Any]]:
+        yield 'http.request.method', request.method
+        yield 'url.template', endpoint.split(' ', 1)[1]
+        if request.body is not None:
+            yield 'http.request.body.size', len(request.body)
+
+
+class TracingConverter(ConverterFactory):
+    """ Traces the deserialization of responses, for `Tracing`. Wraps the converters of the `Configuration`. """
+
+    class ResponseBodyConverter(Converter):
+        def __init__(self, tracing: Tracing, converter: Converter, schema_name: str):
+            self._tracing = tracing
+            self._converter = converter
+            self._schema_name = schema_name
+
+        def convert(self, response):
+            with self._tracing.span('intercom.deserialize', **{'intercom.schema': self._schema_name}):
+                return self._converter(response)
+
+    def __init__(self, tracing: Tracing, converters: Tuple[ConverterFactory, ...]):
+        self._tracing = tracing
+        self._converters = converters
+
+    def create_response_body_converter(self, cls, request_definition=None):
+        for factory in self._converters:
+            converter = factory.create_response_body_converter(cls, request_definition)
+            if converter is not None:
+                schema_name = cls.__name__ if isinstance(cls, type) else type(cls).__name__
+                return self.ResponseBodyConverter(self._tracing, converter, schema_name)
+        return None
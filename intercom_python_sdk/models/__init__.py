@@ -43,6 +43,11 @@ from ..apis.help_center.models import (
     SectionList
 )
 
+from ..apis.conversation.models import (
+    Conversation,
+    ConversationList
+)
+
 from ..apis.teams.models import (
     Team, 
     TeamList
@@ -0,0 +1,256 @@
+"""
+# Intercom Client Pool
+
+`pool.py`
+
+This module contains the IntercomPool class, for applications working with many Intercom workspaces.
+
+Each `Intercom` client has its own `Configuration`, `requests.Session` (and so its own connections)
+and set of API clients. An `IntercomPool` has a single set of them, shared by all the workspaces:
+each workspace gets a lightweight `WorkspaceClient`, whose calls are made with the workspace's token.
+The models returned by a `WorkspaceClient` keep using the workspace's token, e.g. for `update()`.
+
+Workspace clients are kept in a least recently used cache, so that the memory used by the pool
+depends on the number of active workspaces, not on the total number of workspaces; the number
+of connections is bounded by the connection pool of the shared session.
+
+## Example Usage
+
+```python
+from intercom_python_sdk import IntercomPool
+
+pool = IntercomPool(max_workspaces=256)
+
+pool.client('workspace_a_token').articles.list_all()
+pool.client('workspace_b_token').admins.me()
+```
+"""
+# Built-ins
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+from types import GeneratorType
+from concurrent.futures import Future
+from typing import Any, Callable, Iterator, Optional
+
+# External
+from requests.adapters import HTTPAdapter
+from uplink.auth import BearerToken
+
+# Current package
+from .apis import tags_to_api_dict
+from .core.api_base import APIProxyInterface
+from .core.configuration import Configuration
+from .core.scheduler import FairScheduler, SchedulingAdapter
+
+# The token of the workspace whose calls are being made, in the current context.
+current_token: ContextVar[Optional[str]] = ContextVar('intercom_workspace_token', default=None)
+
+
+class WorkspaceAuth(BearerToken):
+    """ Authorizes each request with the token of the workspace whose call is being made. """
+
+    def __init__(self):
+        super().__init__(None)
+
+    @property
+    def _header_value(self):
+        token = current_token.get()
+        if token is None:
+            raise RuntimeError("No workspace token is set. Make calls through `IntercomPool.client(token)`.")
+        return f"{self._prefix} {token}"
+
+
+class WorkspaceAPI:
+    """
+    A view of a shared API client, making its calls with the token of a workspace.
+
+    Injected into the models it returns as their `api_client`, so that their methods use the same token.
+    Generators returned by the API client are consumed with the token too.
+
+    Args:
+        api: The shared API client.
+        token (str): The token of the workspace.
+    """
+    __slots__ = ('_api', '_token')
+
+    def __init__(self, api, token: str):
+        self._api = api
+        self._token = token
+
+    @property
+    def api_class(self) -> type:
+        """ The class of the shared API client. """
+        return type(self._api)
+
+    @property
+    def token(self) -> str:
+        return self._token
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('__'):
+            raise AttributeError(name)
+        attr = getattr(self._api, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            context_token = current_token.set(self._token)
+            try:
+                result = attr(*args, **kwargs)
+            finally:
+                current_token.reset(context_token)
+            if isinstance(result, GeneratorType):
+                return self._iterate(result)
+            return result
+
+        return call
+
+    def _iterate(self, generator: Iterator) -> Iterator:
+        try:
+            while True:
+                context_token = current_token.set(self._token)
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    return
+                finally:
+                    current_token.reset(context_token)
+                yield item
+        finally:
+            generator.close()
+
+    def __repr__(self):
+        return f"<{type(self).__name__} of {self._api!r}>"
+
+
+class WorkspaceClient:
+    """
+    The client of a workspace, from an `IntercomPool`. Has the same API clients as `Intercom`
+    (e.g. `client.articles`), which share the configuration and connections of the pool.
+
+    Args:
+        apis (dict): The shared API clients of the pool, by tag.
+        token (str): The token of the workspace.
+        scheduler (FairScheduler): The scheduler of the pool, if any.
+    """
+
+    def __init__(self, apis: dict, token: str, scheduler: Optional[FairScheduler] = None):
+        self.token = token
+        self.scheduler = scheduler
+        for tag, api in apis.items():
+            setattr(self, tag, APIProxyInterface.wrap(WorkspaceAPI(api, token)))
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """
+        Queue a call for this workspace on the scheduler of the pool, e.g. `client.submit(client.articles.list_all)`.
+
+        Returns:
+            Future: The future result of the call.
+
+        Raises:
+            RuntimeError: If the pool has no scheduler.
+        """
+        if self.scheduler is None:
+            raise RuntimeError("The pool has no scheduler. Pass one with `IntercomPool(scheduler=...)`.")
+        return self.scheduler.submit(self.token, fn, *args, **kwargs)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.token[:4]}...>"
+
+
+class IntercomPool:
+    """
+    A pool of clients for many Intercom workspaces, sharing one configuration, connection pool and
+    set of API clients. See the module documentation.
+
+    Args:
+        max_workspaces (int): The number of workspace clients kept, least recently used first out. Defaults to 256.
+        pool_connections (int): The number of hosts to keep connection pools for. Defaults to 10.
+        pool_maxsize (int): The maximum number of connections kept per host, shared by all workspaces.
+            Should be at least the number of threads making calls. Defaults to 32.
+        scheduler (FairScheduler): Runs the calls queued with `WorkspaceClient.submit`, fairly between
+            workspaces, and holds each request of a workspace to its limits. See `core/scheduler.py`.
+            Defaults to None.
+        **config_kwargs: Passed to the shared `Configuration`, e.g. `base_url`, `api_version` or `metrics`.
+            The `auth` is provided by the pool.
+    """
+
+    def __init__(self, max_workspaces: int = 256, pool_connections: int = 10, pool_maxsize: int = 32,
+                 scheduler: Optional[FairScheduler] = None, **config_kwargs):
+        if 'auth' in config_kwargs:
+            raise ValueError("The pool authorizes requests with the token of each workspace; do not pass `auth`.")
+        self.max_workspaces = max_workspaces
+        self.scheduler = scheduler
+        self.config = Configuration(auth=WorkspaceAuth(), **config_kwargs)
+
+        session = self.config.session
+        for prefix in ('https://', 'http://'):
+            # Resize the HTTPAdapter actually sending requests, behind the HTTP cache or single-flight adapters.
+            # The scheduler wraps it, so that responses served from a cache or shared do not use the budget.
+            parent, adapter = None, session.get_adapter(prefix)
+            while type(adapter) is not HTTPAdapter and hasattr(adapter, 'adapter'):
+                parent, adapter = adapter, adapter.adapter
+            if type(adapter) is HTTPAdapter:  # Keep custom adapters
+                adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            if scheduler is not None:
+                adapter = SchedulingAdapter(scheduler, current_token.get, adapter)
+            if parent is None:
+                session.mount(prefix, adapter)
+            else:
+                parent.adapter = adapter
+
+        self.apis = {tag: api_class(self.config) for tag, api_class in tags_to_api_dict.items()}
+        self._clients: 'OrderedDict[str, WorkspaceClient]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def client(self, token: str) -> WorkspaceClient:
+        """
+        Get the client of a workspace, creating it if needed.
+
+        Args:
+            token (str): The access token of the workspace.
+
+        Returns:
+            WorkspaceClient: The client of the workspace.
+        """
+        if not token:
+            raise ValueError("A workspace token is required.")
+        with self._lock:
+            client = self._clients.get(token)
+            if client is not None:
+                self._clients.move_to_end(token)
+                return client
+
+            client = self._clients[token] = WorkspaceClient(self.apis, token, self.scheduler)
+            while len(self._clients) > self.max_workspaces:
+                evicted, _ = self._clients.popitem(last=False)
+                if self.scheduler is not None:
+                    self.scheduler.forget(evicted)
+            return client
+
+    def evict(self, token: str):
+        """ Forget the client of a workspace, e.g. when it is uninstalled. """
+        with self._lock:
+            self._clients.pop(token, None)
+        if self.scheduler is not None:
+            self.scheduler.forget(token)
+
+    def __len__(self):
+        """ The number of workspace clients currently kept. """
+        return len(self._clients)
+
+    def __contains__(self, token: str) -> bool:
+        return token in self._clients
+
+    def close(self):
+        """ Close the connections of the pool, once the calls queued on its scheduler are done. """
+        if self.scheduler is not None:
+            self.scheduler.shutdown()
+        self.config.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
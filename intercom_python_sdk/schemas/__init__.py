@@ -46,6 +46,11 @@ from ..apis.help_center.schemas import (
     SectionListSchema,
 )
 
+from ..apis.conversation.schemas import (
+    ConversationSchema,
+    ConversationListSchema,
+)
+
 from ..apis.teams.schemas import (
     TeamSchema,
     TeamListSchema,
@@ -0,0 +1,352 @@
+"""
+# Reference Data Snapshots
+
+`snapshot.py`
+
+This module contains the Snapshot class, which saves the reference data of a workspace to a file,
+so that new processes can start serving from it instead of downloading it again.
+
+The reference data is the lists of admins, teams, data attributes, and help center collections
+and sections. A snapshot is stored in a compact binary file: msgpack if the `msgpack` package is
+installed, or zlib-compressed JSON otherwise. The file is decoded in one read when loaded; each list
+is only deserialized into models when first accessed.
+
+`Snapshot.warm_start` loads the snapshot file if there is one, and refreshes it in the background
+when it is older than `max_age`; only the first start of all, without a file, waits for the downloads.
+
+## Example Usage
+
+```python
+from intercom_python_sdk import Intercom, Snapshot
+
+intercom = Intercom('my_api_key')
+snapshot = Snapshot.warm_start(intercom, '/var/cache/intercom/reference.snapshot', max_age=3600)
+
+snapshot.admins  # AdminList, from the file, then from the refreshed snapshot once downloaded
+snapshot.collections  # CollectionList
+```
+"""
+# Built-ins
+import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import Future
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Tuple
+)
+
+# External
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+# Current package
+from .core.model_base import ModelBase
+from .core.concurrency import ContextThreadPoolExecutor
+from .schemas import (
+    AdminListSchema,
+    CollectionListSchema,
+    DataAttributeListSchema,
+    SectionListSchema,
+    TeamListSchema
+)
+
+MAGIC = b'INTERCOMSNAP'
+FORMAT_VERSION = 1
+ENCODINGS = {'json': 0, 'msgpack': 1}
+
+# The lists of a snapshot: their schema, the API client they are read with, and how they are read.
+REFERENCE_LISTS: Dict[str, Tuple[type, str, Callable[[Any], Any]]] = {
+    'admins': (AdminListSchema, 'admins', lambda api: api.list_admins()),
+    'teams': (TeamListSchema, 'teams', lambda api: api.get_all_teams()),
+    'data_attributes': (DataAttributeListSchema, 'data_attributes', lambda api: api.list_all()),
+    'collections': (CollectionListSchema, 'help_center', lambda api: api.list_all_collections()),
+    'sections': (SectionListSchema, 'help_center', lambda api: api.list_all_sections()),
+}
+
+
+def encode(document: dict, encoding: Optional[str] = None) -> bytes:
+    """
+    Encode a snapshot document to the bytes of a snapshot file.
+
+    Args:
+        document (dict): The document.
+        encoding (str): 'msgpack' or 'json'. Defaults to msgpack if installed, else JSON.
+
+    Returns:
+        bytes: The content of the file.
+    """
+    if encoding is None:
+        encoding = 'msgpack' if msgpack is not None else 'json'
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unknown snapshot encoding: {encoding!r}. Use one of {sorted(ENCODINGS)}.")
+    if encoding == 'msgpack':
+        if msgpack is None:
+            raise ImportError("The msgpack snapshot encoding requires the 'msgpack' package.")
+        body = msgpack.packb(document, use_bin_type=True)
+    else:
+        body = zlib.compress(json.dumps(document, separators=(',', ':')).encode(), 1)
+    return MAGIC + bytes([FORMAT_VERSION, ENCODINGS[encoding]]) + body
+
+
+def decode(content: bytes) -> dict:
+    """
+    Decode the bytes of a snapshot file to its document.
+
+    Raises:
+        ValueError: If the content is not a snapshot of a supported version.
+        ImportError: If the snapshot is encoded with msgpack, and it is not installed.
+    """
+    header = len(MAGIC) + 2
+    if len(content) < header or not content.startswith(MAGIC):
+        raise ValueError("Not a snapshot file.")
+    version, encoding = content[len(MAGIC)], content[len(MAGIC) + 1]
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {version}.")
+
+    body = content[header:]
+    if encoding == ENCODINGS['msgpack']:
+        if msgpack is None:
+            raise ImportError("This snapshot is encoded with msgpack, which requires the 'msgpack' package.")
+        try:
+            return msgpack.unpackb(body, raw=False)
+        except Exception as error:
+            raise ValueError(f"Corrupt snapshot file: {error}") from error
+    if encoding == ENCODINGS['json']:
+        try:
+            return json.loads(zlib.decompress(body))
+        except (zlib.error, ValueError) as error:
+            raise ValueError(f"Corrupt snapshot file: {error}") from error
+    raise ValueError(f"Unsupported snapshot encoding: {encoding}.")
+
+
+class Snapshot:
+    """
+    The reference data of a workspace, saved to and loaded from a file. See the module documentation.
+
+    The models of a snapshot are shared by all its users: treat them as read-only. Their methods (e.g. `update()`)
+    use the API clients of the client the snapshot was captured or loaded with, if any.
+
+    Args:
+        lists (dict): The serialized lists, by name (see `REFERENCE_LISTS`).
+        created_at (float): The time the lists were downloaded, as a Unix timestamp.
+        client: The `Intercom` (or `IntercomPool` workspace) client, to inject into the models. Defaults to None.
+    """
+
+    def __init__(self, lists: Dict[str, Any], created_at: float, client: Any = None):
+        self.client = client
+        self._lists = lists
+        self._created_at = created_at
+        self._models: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self.refreshing: Optional[Future] = None
+
+    # Capture and storage
+
+    @classmethod
+    def capture(cls, client: Any) -> 'Snapshot':
+        """
+        Download the reference data of a workspace, concurrently.
+
+        Args:
+            client: The `Intercom` (or `IntercomPool` workspace) client to download it with.
+
+        Returns:
+            Snapshot: The snapshot, with its models already loaded.
+        """
+        created_at = time.time()
+        with ContextThreadPoolExecutor(max_workers=len(REFERENCE_LISTS)) as executor:
+            futures = {name: executor.submit(read, getattr(client, api))
+                       for name, (_, api, read) in REFERENCE_LISTS.items()}
+            models = {name: future.result() for name, future in futures.items()}
+
+        lists = {name: REFERENCE_LISTS[name][0]().dump(model) for name, model in models.items()}
+        snapshot = cls(lists, created_at, client)
+        snapshot._models = models
+        return snapshot
+
+    def save(self, path: str, encoding: Optional[str] = None):
+        """
+        Write the snapshot to a file, atomically: readers see either the previous file or the new one.
+
+        Args:
+            path (str): The path of the file.
+            encoding (str): 'msgpack' or 'json'. Defaults to msgpack if installed, else JSON.
+        """
+        with self._lock:
+            document = {'created_at': self._created_at, 'lists': self._lists}
+        content = encode(document, encoding)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=directory, prefix='.snapshot-')
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(content)
+            os.replace(temporary, path)
+        except BaseException:
+            os.remove(temporary)
+            raise
+
+    @classmethod
+    def load(cls, path: str, client: Any = None) -> 'Snapshot':
+        """
+        Read a snapshot from a file.
+
+        Args:
+            path (str): The path of the file.
+            client: The `Intercom` (or `IntercomPool` workspace) client to inject into the models. Defaults to None.
+
+        Returns:
+            Snapshot: The snapshot.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file is not a valid snapshot.
+        """
+        with open(path, 'rb') as file:
+            document = decode(file.read())
+        try:
+            return cls(document['lists'], document['created_at'], client)
+        except (KeyError, TypeError) as error:
+            raise ValueError(f"Invalid snapshot file: {error}") from error
+
+    @classmethod
+    def warm_start(cls, client: Any, path: str, max_age: Optional[float] = 3600,
+                   encoding: Optional[str] = None) -> 'Snapshot':
+        """
+        Load the snapshot of a file, refreshing it in the background if it is older than `max_age`.
+
+        If there is no valid snapshot file, the reference data is downloaded (and saved) before returning.
+
+        Args:
+            client: The `Intercom` (or `IntercomPool` workspace) client.
+            path (str): The path of the snapshot file.
+            max_age (float): The age in seconds above which the snapshot is refreshed. None to never refresh it.
+                Defaults to one hour.
+            encoding (str): The encoding of the refreshed snapshot files. See `save`.
+
+        Returns:
+            Snapshot: The snapshot. Its `refreshing` future is set while it is being refreshed.
+        """
+        try:
+            snapshot = cls.load(path, client)
+        except (OSError, ValueError, ImportError):
+            snapshot = cls.capture(client)
+            snapshot.save(path, encoding)
+            return snapshot
+
+        if max_age is not None and snapshot.age > max_age:
+            snapshot.refresh_in_background(path, encoding)
+        return snapshot
+
+    def refresh(self, path: Optional[str] = None, encoding: Optional[str] = None):
+        """
+        Download the reference data again, replacing the lists of this snapshot, and save it if a path is given.
+
+        Raises:
+            RuntimeError: If the snapshot has no client to download with.
+        """
+        if self.client is None:
+            raise RuntimeError("The snapshot has no client to refresh with. Load it with one.")
+        fresh = type(self).capture(self.client)
+        with self._lock:
+            self._lists, self._created_at, self._models = fresh._lists, fresh._created_at, fresh._models
+        if path is not None:
+            self.save(path, encoding)
+
+    def refresh_in_background(self, path: Optional[str] = None, encoding: Optional[str] = None) -> Future:
+        """
+        Refresh the snapshot in a background thread, while its current lists keep being served.
+
+        Returns:
+            Future: Resolved once refreshed, or with the error of the refresh. Also kept as `refreshing`.
+        """
+        with self._lock:
+            if self.refreshing is not None and not self.refreshing.done():
+                return self.refreshing
+            future = self.refreshing = Future()
+
+        def run():
+            try:
+                self.refresh(path, encoding)
+            except BaseException as error:  # noqa: The error is reported on the future
+                future.set_exception(error)
+            else:
+                future.set_result(self)
+
+        threading.Thread(target=run, name='intercom-snapshot-refresh', daemon=True).start()
+        return future
+
+    # Contents
+
+    @property
+    def created_at(self) -> float:
+        """ The time the lists were downloaded, as a Unix timestamp. """
+        return self._created_at
+
+    @property
+    def age(self) -> float:
+        """ The number of seconds since the lists were downloaded. """
+        return time.time() - self._created_at
+
+    def get(self, name: str) -> Any:
+        """
+        A list of the snapshot, deserialized on first access.
+
+        Args:
+            name (str): The name of the list: 'admins', 'teams', 'data_attributes', 'collections' or 'sections'.
+        """
+        with self._lock:
+            model = self._models.get(name)
+            if model is not None:
+                return model
+            if name not in REFERENCE_LISTS:
+                raise KeyError(name)
+            schema, api, _ = REFERENCE_LISTS[name]
+            model = self._models[name] = self._inject(schema().load(self._lists[name]), api)
+            return model
+
+    def _inject(self, model: Any, api: str) -> Any:
+        """ Inject the API client of the snapshot's client into the models, as the API clients do. """
+        proxy = getattr(self.client, api, None)
+        if proxy is not None:
+            inject = object.__getattribute__(proxy, '_inject_into_instances')
+            inject(model, ModelBase, 'api_client', proxy.api_object)
+        return model
+
+    @property
+    def admins(self):
+        """ AdminList: The admins of the workspace. """
+        return self.get('admins')
+
+    @property
+    def teams(self) -> dict:
+        """ dict: The teams of the workspace, as returned by `teams.get_all_teams()`. """
+        return self.get('teams')
+
+    @property
+    def data_attributes(self):
+        """ DataAttributeList: The data attributes of the workspace. """
+        return self.get('data_attributes')
+
+    @property
+    def collections(self):
+        """ CollectionList: The help center collections of the workspace. """
+        return self.get('collections')
+
+    @property
+    def sections(self):
+        """ SectionList: The help center sections of the workspace. """
+        return self.get('sections')
+
+    def __repr__(self):
+        return f"<{type(self).__name__} of {time.ctime(self._created_at)}>"
@@ -34,6 +34,8 @@ class FakedSchemaFactory:
 
             if isinstance(inner, fields.Nested):
                 list_val = lambda: self.fake_schema(inner.nested)[1]  # noqa # type: ignore
+            elif isinstance(inner, fields.Dict):
+                list_val = self.fake.pydict
             else:
                 list_val = self.schema_map[inner.__class__]  # noqa # type: ignore
 
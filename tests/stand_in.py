@@ -0,0 +1,566 @@
+"""
+# Intercom Stand-In
+
+`tests/stand_in.py`
+
+A local stand-in for the Intercom API, serving the endpoints used by the API clients of the SDK
+with data from `FakedSchemaFactory`, so that HTTP behavior (pagination, concurrency, retries,
+caching) can be tested and benchmarked without network access.
+
+It can be used in process, as a `requests` transport adapter mounted on the session of a
+`Configuration`, or over localhost, as a threaded HTTP server. Latency, list sizes, payload sizes,
+injected 429/5xx errors and rate limiting are configurable.
+
+## Example Usage
+
+```python
+from tests.stand_in import StandIn, StandInAdapter, StandInServer
+
+stand_in = StandIn(totals={'article': 500}, latency=0.02, errors={429: 0.05})
+
+intercom = Intercom('TEST')
+intercom.articles.api_object.config.session.mount('https://', StandInAdapter(stand_in))
+
+with StandInServer(stand_in) as server:  # Or over localhost
+    config = Configuration(auth=BearerToken('TEST'), base_url=server.base_url)
+```
+
+Or from a shell, for external load-testing tools:
+
+    python -m tests.stand_in --port 8000 --latency 0.02 --error 429=0.05 --rate-limit 1000
+"""
+# Built-ins
+import argparse
+import copy
+import gzip
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union
+)
+from urllib.parse import parse_qs, urlparse
+
+# External
+import requests
+from marshmallow import Schema
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Intercom Python SDK
+from intercom_python_sdk.apis.admins.schemas import AdminSchema
+from intercom_python_sdk.apis.articles.schemas import ArticleSchema
+from intercom_python_sdk.apis.conversation.schemas import ConversationSchema
+from intercom_python_sdk.apis.data_attributes.schemas import DataAttributeSchema
+from intercom_python_sdk.apis.data_events.schemas import DataEventSchema
+from intercom_python_sdk.apis.help_center.schemas import CollectionSchema, SectionSchema
+from intercom_python_sdk.apis.teams.schemas import TeamSchema
+
+from .faked_schema_factory import FakedSchemaFactory
+
+Reply = Tuple[int, Dict[str, str], bytes]
+
+
+class Kind:
+    """ A kind of object served by the stand-in. """
+
+    def __init__(self, schema: Type[Schema], id_type: type = str, total: int = 20, pad_field: Optional[str] = None):
+        self.schema = schema
+        self.id_type = id_type
+        self.total = total
+        self.pad_field = pad_field
+
+
+KINDS: Dict[str, Kind] = {
+    'admin': Kind(AdminSchema, total=5),
+    'article': Kind(ArticleSchema, id_type=int, total=120, pad_field='body'),
+    'conversation': Kind(ConversationSchema, total=60),
+    'data_attribute': Kind(DataAttributeSchema, id_type=int, total=20, pad_field='description'),
+    'event': Kind(DataEventSchema, total=30),
+    'collection': Kind(CollectionSchema, total=15, pad_field='description'),
+    'section': Kind(SectionSchema, total=40),
+    'team': Kind(TeamSchema, id_type=int, total=4),
+}
+
+# The `updated_at` of the first object of each kind. Later objects are older, by a second each.
+BASE_TIMESTAMP = 1700000000
+
+
+class StandIn:
+    """
+    The state and behavior of the stand-in, independent of the transport.
+
+    Objects are generated from a few `FakedSchemaFactory` templates per kind, with their own IDs,
+    so that large lists are cheap. They can be created, updated and deleted.
+
+    Args:
+        totals (Dict[str, int]): The number of objects of each kind (see `KINDS`), e.g. `{'article': 500}`.
+        latency (Union[float, Tuple[float, float]]): Seconds to wait before replying, or a (min, max) range.
+        payload_size (int): Characters added to a text field of each object, e.g. the body of Articles.
+        export_size (int): The approximate size in bytes of a downloaded data export, before compression.
+        errors (Dict[int, float]): The probability of replying with each error status instead,
+            e.g. `{429: 0.1, 503: 0.01}`.
+        rate_limit (int): The number of requests allowed per `rate_limit_window`, after which requests
+            are rejected with a 429 until the window resets. Defaults to None (no limit).
+        rate_limit_window (float): The length of a rate limit window, in seconds. Defaults to 10, as Intercom.
+        templates (int): The number of distinct fake objects generated per kind. Defaults to 3.
+        seed (int): The seed of the fake data and of the injected errors. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        totals: Optional[Dict[str, int]] = None,
+        latency: Union[float, Tuple[float, float]] = 0.0,
+        payload_size: int = 0,
+        export_size: int = 1024,
+        errors: Optional[Dict[int, float]] = None,
+        rate_limit: Optional[int] = None,
+        rate_limit_window: float = 10.0,
+        templates: int = 3,
+        seed: int = 0
+    ):
+        self.latency = latency
+        self.payload_size = payload_size
+        self.export_size = export_size
+        self.errors = dict(errors or {})
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.n_templates = templates
+        self.seed = seed
+
+        self.requests: Counter = Counter()  # By route, e.g. 'GET /articles/{id}'
+        self.statuses: Counter = Counter()
+
+        self._totals = {kind: spec.total for kind, spec in KINDS.items()}
+        self._totals.update(totals or {})
+        self._templates: Dict[str, List[dict]] = {}
+        self._ids: Dict[str, List[Any]] = {}
+        self._changes: Dict[str, Dict[Any, dict]] = {kind: {} for kind in KINDS}
+        self._deleted: Dict[str, Set[Any]] = {kind: set() for kind in KINDS}  # Of the generated objects
+        self._exports: Dict[str, str] = {}
+        self._export_cache: Tuple[Optional[int], bytes] = (None, b'')
+        self._random = random.Random(seed)
+        self._window: Tuple[float, int] = (0.0, 0)
+        self._lock = threading.RLock()
+        self._routes = self._make_routes()
+
+    # Objects
+
+    def _template(self, kind: str, index: int) -> dict:
+        with self._lock:
+            if kind not in self._templates:
+                factory = FakedSchemaFactory()
+                factory.fake.seed_instance(self.seed)
+                # Round-trip through JSON, as dates and the like are served as strings.
+                self._templates[kind] = [
+                    json.loads(json.dumps(factory.fake_schema(KINDS[kind].schema)[1], default=str))
+                    for _ in range(self.n_templates)
+                ]
+            return self._templates[kind][index % self.n_templates]
+
+    def ids(self, kind: str) -> List[Any]:
+        """ The IDs of the objects of a kind, in listing order. """
+        with self._lock:
+            if kind not in self._ids:
+                self._ids[kind] = [KINDS[kind].id_type(i) for i in range(1, self._totals[kind] + 1)]
+            return self._ids[kind]
+
+    def get(self, kind: str, id: Any) -> Optional[dict]:
+        """ The object of a kind with the given ID, or None if there is none. """
+        spec = KINDS[kind]
+        try:
+            id = spec.id_type(id)
+        except ValueError:
+            return None
+        if id in self._changes[kind]:
+            return self._changes[kind][id]
+        if not isinstance(id, int) and not str(id).isdigit():
+            return None
+
+        index = int(id) - 1
+        # Generated IDs are contiguous, so membership is a range check rather than a scan of `ids`
+        if not 0 <= index < self._totals[kind] or id in self._deleted[kind]:
+            return None
+
+        obj = copy.copy(self._template(kind, index))
+        obj.update(id=id, type=kind, updated_at=BASE_TIMESTAMP - index)
+        if self.payload_size:
+            obj[spec.pad_field or 'padding'] = 'x' * self.payload_size
+        if kind == 'section':
+            obj['collection_id'] = str(index % self._totals['collection'] + 1)
+        return obj
+
+    def create(self, kind: str, data: dict) -> dict:
+        with self._lock:
+            ids = self.ids(kind)
+            id = KINDS[kind].id_type(self._totals[kind] + len(self._changes[kind]) + 1)
+            obj = {**copy.copy(self._template(kind, 0)), **data, 'id': id, 'type': kind,
+                   'updated_at': int(time.time())}
+            self._changes[kind][id] = obj
+            ids.insert(0, id)  # Most recently updated first
+            return obj
+
+    def update(self, kind: str, id: Any, data: dict) -> Optional[dict]:
+        with self._lock:
+            obj = self.get(kind, id)
+            if obj is None:
+                return None
+            obj = {**obj, **data, 'updated_at': int(time.time())}
+            self._changes[kind][obj['id']] = obj
+            ids = self.ids(kind)
+            ids.remove(obj['id'])
+            ids.insert(0, obj['id'])
+            return obj
+
+    def delete(self, kind: str, id: Any) -> Optional[dict]:
+        with self._lock:
+            obj = self.get(kind, id)
+            if obj is not None:
+                self.ids(kind).remove(obj['id'])
+                self._changes[kind].pop(obj['id'], None)
+                if int(obj['id']) <= self._totals[kind]:
+                    self._deleted[kind].add(obj['id'])
+            return obj
+
+    # Lists
+
+    def numbered_page(self, kind: str, query: dict) -> dict:
+        page, per_page = int(query.get('page', 1)), int(query.get('per_page', 50))
+        ids = self.ids(kind)
+        data = [self.get(kind, id) for id in ids[(page - 1) * per_page:page * per_page]]
+        return {
+            'type': 'list',
+            'data': data,
+            'total_count': len(ids),
+            'pages': {'type': 'pages', 'page': page, 'per_page': per_page,
+                      'total_pages': max(1, -(-len(ids) // per_page))},
+        }
+
+    def cursor_page(self, kind: str, per_page: int, starting_after: Optional[str]) -> dict:
+        ids = self.ids(kind)
+        start = int(starting_after.rsplit('-', 1)[-1]) if starting_after else 0
+        end = start + per_page
+        pages = {'type': 'pages', 'page': start // per_page + 1, 'per_page': per_page,
+                 'total_pages': max(1, -(-len(ids) // per_page))}
+        if end < len(ids):
+            pages['next'] = {'page': pages['page'] + 1, 'starting_after': f'cursor-{end}'}
+        return {
+            'type': f'{kind}.list',
+            f'{kind}s': [self.get(kind, id) for id in ids[start:end]],
+            'total_count': len(ids),
+            'pages': pages,
+        }
+
+    def all(self, kind: str) -> List[dict]:
+        return [self.get(kind, id) for id in self.ids(kind)]
+
+    # Routing
+
+    def _make_routes(self) -> List[Tuple[str, 're.Pattern', Callable[..., Reply]]]:
+        routes = [
+            ('GET', '/me', lambda q, b: self._ok(self.get('admin', 1))),
+            ('GET', '/admins', lambda q, b: self._ok({'type': 'admin.list', 'admins': self.all('admin')})),
+            ('GET', '/admins/{id}', self._getter('admin')),
+            ('PUT', '/admins/{id}/away', lambda q, b, id: self._found(self.update('admin', id, {
+                'away_mode_enabled': b.get('away_mode_enabled'),
+                'away_mode_reassign': b.get('away_mode_reassign')}))),
+
+            ('GET', '/articles', lambda q, b: self._ok(self.numbered_page('article', q))),
+            ('POST', '/articles', lambda q, b: self._ok(self.create('article', b))),
+            ('GET', '/articles/{id}', self._getter('article')),
+            ('PUT', '/articles/{id}', lambda q, b, id: self._found(self.update('article', id, b))),
+            ('DELETE', '/articles/{id}', lambda q, b, id: self._found(
+                self.delete('article', id) and {'id': id, 'object': 'article', 'deleted': True})),
+
+            ('GET', '/conversations', lambda q, b: self._ok(self.cursor_page(
+                'conversation', int(q.get('per_page', 20)), q.get('starting_after')))),
+            ('POST', '/conversations/search', lambda q, b: self._ok(self.cursor_page(
+                'conversation', int(b.get('pagination', {}).get('per_page', 20)),
+                b.get('pagination', {}).get('starting_after')))),
+            ('GET', '/conversations/{id}', self._getter('conversation')),
+            ('POST', '/conversations/{id}/reply', self._getter('conversation')),
+
+            ('GET', '/data_attributes', lambda q, b: self._ok({'type': 'list', 'data': self.all('data_attribute')})),
+            ('POST', '/data_attributes', lambda q, b: self._ok(self.create('data_attribute', b))),
+            ('PUT', '/data_attributes/{id}', lambda q, b, id: self._found(self.update('data_attribute', id, b))),
+
+            ('GET', '/events', lambda q, b: self._ok({'type': 'event.list', 'events': self.all('event')})),
+            ('POST', '/events', lambda q, b: (202, {}, b'')),
+
+            ('POST', '/export/content/data', lambda q, b: self._ok(self._export(None, 'pending'))),
+            ('POST', '/export/content/data/{id}', lambda q, b, id: self._ok(self._export(id, 'completed'))),
+            ('POST', '/export/cancel/{id}', lambda q, b, id: self._ok(self._export(id, 'canceled'))),
+            ('GET', '/download/content/data/{id}', lambda q, b, id: (
+                200, {'Content-Type': 'application/octet-stream'}, self._export_content())),
+
+            ('GET', '/help_center/collections', lambda q, b: self._ok(self.numbered_page('collection', q))),
+            ('POST', '/help_center/collections', lambda q, b: self._ok(self.create('collection', b))),
+            ('GET', '/help_center/collections/{id}', self._getter('collection')),
+            ('PUT', '/help_center/collections/{id}', lambda q, b, id: self._found(self.update('collection', id, b))),
+            ('DELETE', '/help_center/collections/{id}', lambda q, b, id: self._found(
+                self.delete('collection', id) and {'id': id, 'object': 'collection', 'deleted': True})),
+            ('GET', '/help_center/sections', lambda q, b: self._ok(self.numbered_page('section', q))),
+            ('GET', '/help_center/sections/{id}', self._getter('section')),
+
+            ('GET', '/teams', lambda q, b: self._ok({'type': 'team.list', 'teams': self.all('team')})),
+            ('GET', '/teams/{id}', self._getter('team')),
+        ]
+        return [
+            (method, path, re.compile('^' + path.replace('{id}', '(?P<id>[^/]+)') + '$'), handler)
+            for method, path, handler in routes
+        ]
+
+    def _getter(self, kind: str) -> Callable[..., Reply]:
+        return lambda query, body, id: self._found(self.get(kind, id))
+
+    def _export(self, job_identifier: Optional[str], status: str) -> dict:
+        with self._lock:
+            if job_identifier is None:
+                job_identifier = f'job-{len(self._exports) + 1}'
+            self._exports[job_identifier] = status
+        return {'job_identifier': job_identifier, 'status': status, 'download_expires_at': '',
+                'download_url': f'/download/content/data/{job_identifier}'}
+
+    def _export_content(self) -> bytes:
+        with self._lock:
+            if self._export_cache[0] != self.export_size:
+                header = b'conversation_id,conversation_created_at,message_id,message_body\n'
+                rows = [header]
+                size, index = len(header), 0
+                while size < self.export_size:
+                    index += 1
+                    row = f'{index},{BASE_TIMESTAMP - index},{index},Message {index} of the export\n'.encode()
+                    rows.append(row)
+                    size += len(row)
+                self._export_cache = (self.export_size, gzip.compress(b''.join(rows), compresslevel=1))
+            return self._export_cache[1]
+
+    @staticmethod
+    def _ok(payload: Any) -> Reply:
+        return 200, {'Content-Type': 'application/json'}, json.dumps(payload, default=str).encode()
+
+    @classmethod
+    def _found(cls, payload: Any) -> Reply:
+        return cls._ok(payload) if payload else cls._error(404, 'not_found', 'Resource Not Found')
+
+    @staticmethod
+    def _error(status: int, code: str, message: str, headers: Optional[Dict[str, str]] = None) -> Reply:
+        body = {'type': 'error.list', 'request_id': f'stand-in-{status}',
+                'errors': [{'code': code, 'message': message}]}
+        return status, {'Content-Type': 'application/json', **(headers or {})}, json.dumps(body).encode()
+
+    def _rate_limit_headers(self) -> Tuple[bool, Dict[str, str]]:
+        """ Count a request against the rate limit. Returns whether it is allowed, and the headers to send. """
+        if self.rate_limit is None:
+            return True, {}
+
+        now = time.time()
+        with self._lock:
+            window_start, count = self._window
+            if now >= window_start + self.rate_limit_window:
+                window_start, count = now, 0
+            count += 1
+            self._window = (window_start, count)
+
+        headers = {
+            'X-RateLimit-Limit': str(self.rate_limit),
+            'X-RateLimit-Remaining': str(max(0, self.rate_limit - count)),
+            'X-RateLimit-Reset': str(int(window_start + self.rate_limit_window + 1)),
+        }
+        return count <= self.rate_limit, headers
+
+    def handle(self, method: str, url: str, body: Optional[bytes] = None,
+               headers: Optional[Dict[str, str]] = None) -> Reply:
+        """ Handle a request, returning its status, headers and body. """
+        parsed = urlparse(url)
+        path = parsed.path.rstrip('/') or '/'
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+
+        if self.latency:
+            low, high = self.latency if isinstance(self.latency, tuple) else (self.latency, self.latency)
+            time.sleep(low if low == high else random.uniform(low, high))
+
+        for route_method, template, pattern, handler in self._routes:
+            match = pattern.match(path) if route_method == method else None
+            if match:
+                break
+        else:
+            return self._count('unknown', *self._error(404, 'not_found', f'No route for {method} {path}'))
+
+        route = f'{method} {template}'
+        allowed, limit_headers = self._rate_limit_headers()
+        if not allowed:
+            return self._count(route, *self._error(429, 'rate_limit_exceeded', 'Rate Limit Exceeded', limit_headers))
+
+        with self._lock:
+            roll = self._random.random()
+        for status, probability in self.errors.items():
+            if roll < probability:
+                if status == 429:
+                    limit_headers['X-RateLimit-Reset'] = str(int(time.time()))
+                    return self._count(route, *self._error(429, 'rate_limit_exceeded', 'Rate Limit Exceeded',
+                                                           limit_headers))
+                return self._count(route, *self._error(status, 'server_error', 'Injected server error',
+                                                       limit_headers))
+            roll -= probability
+
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError:
+            return self._count(route, *self._error(400, 'parameter_invalid', 'Invalid JSON body'))
+
+        status, reply_headers, content = handler(query, data, **match.groupdict())
+        reply_headers = {**reply_headers, **limit_headers}
+        if method == 'GET' and status == 200:
+            etag = f'"{zlib.crc32(content):08x}"'
+            reply_headers['ETag'] = etag
+            if (headers or {}).get('If-None-Match') == etag:
+                return self._count(route, 304, reply_headers, b'')
+        return self._count(route, status, reply_headers, content)
+
+    def _count(self, route: str, status: int, headers: Dict[str, str], content: bytes) -> Reply:
+        with self._lock:
+            self.requests[route] += 1
+            self.statuses[status] += 1
+        return status, headers, content
+
+
+class StandInAdapter(BaseAdapter):
+    """
+    A `requests` transport adapter serving requests from a `StandIn`, in process.
+
+    Args:
+        stand_in (StandIn): The stand-in. Defaults to one with default settings.
+    """
+
+    def __init__(self, stand_in: Optional[StandIn] = None):
+        super().__init__()
+        self.stand_in = stand_in or StandIn()
+
+    def send(self, request, **kwargs):
+        started = time.perf_counter()
+        body = request.body.encode() if isinstance(request.body, str) else request.body
+        status, headers, content = self.stand_in.handle(request.method, request.url, body, dict(request.headers))
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict({**headers, 'Content-Length': str(len(content))})
+        response._content = content
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.reason = 'Stand-in'
+        response.elapsed = timedelta(seconds=time.perf_counter() - started)
+        return response
+
+    def close(self):
+        pass
+
+
+class StandInServer:
+    """
+    Serves a `StandIn` over HTTP on localhost, from a background thread, with keep-alive connections.
+
+    Args:
+        stand_in (StandIn): The stand-in. Defaults to one with default settings.
+        host (str): The host to bind. Defaults to '127.0.0.1'.
+        port (int): The port to bind. Defaults to 0 (any free port).
+    """
+
+    def __init__(self, stand_in: Optional[StandIn] = None, host: str = '127.0.0.1', port: int = 0):
+        self.stand_in = stand_in or StandIn()
+        served = self.stand_in
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else None
+                status, headers, content = served.handle(self.command, self.path, body, dict(self.headers))
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'StandInServer':
+        self._thread = threading.Thread(target=self.server.serve_forever, name='intercom-stand-in', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds to wait before each reply.')
+    parser.add_argument('--payload-size', type=int, default=0, help='Characters added to each object.')
+    parser.add_argument('--total', action='append', default=[], metavar='KIND=N',
+                        help=f'The number of objects of a kind, repeatable. Kinds: {", ".join(KINDS)}.')
+    parser.add_argument('--error', action='append', default=[], metavar='STATUS=P',
+                        help='Reply with an error status with probability P, repeatable. E.g. 429=0.05.')
+    parser.add_argument('--rate-limit', type=int, help='Requests allowed per 10 second window.')
+    args = parser.parse_args()
+
+    stand_in = StandIn(
+        totals={kind: int(n) for kind, n in (spec.split('=') for spec in args.total)},
+        latency=args.latency,
+        payload_size=args.payload_size,
+        errors={int(status): float(p) for status, p in (spec.split('=') for spec in args.error)},
+        rate_limit=args.rate_limit,
+    )
+    server = StandInServer(stand_in, args.host, args.port)
+    print(f'Serving the Intercom stand-in on {server.base_url}')
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -3,12 +3,26 @@ from tests import fake_factory
 from intercom_python_sdk.schemas import (
     ArticleSchema,
     ArticleStatisticsSchema,
-    ArticleListSchema
+    ArticleListSchema,
+    CollectionSchema,
+    DataAttributeSchema
 )
 
 from intercom_python_sdk.models import Article, ArticleList
+from intercom_python_sdk.apis.articles.sync import ArticleSync
+from intercom_python_sdk import Intercom
+from intercom_python_sdk.core.bulk import BulkCheckpoint
+from intercom_python_sdk.core.model_base import IdIndex
 
+from requests.adapters import BaseAdapter
+import requests
+
+import json
+import os
+import tempfile
+import threading
 import unittest
+from unittest import mock
 
 
 class TestArticleSchema(unittest.TestCase):
@@ -86,3 +100,279 @@ class TestArticleListSchema(unittest.TestCase):
         _, data = fake_factory.fake_schema(ArticleListSchema)
         article_list = ArticleListSchema().load(data)
         assert len(article_list) == len(data['data'])
+
+    def test_article_list_get_by_id(self):
+        article_list = ArticleList(data=[Article(id=i) for i in range(5)])
+        assert article_list.get_by_id(3) is article_list[3]
+        assert article_list.get_by_id(99) is None
+
+    def test_article_list_get_by_id_tracks_changes(self):
+        article_list = ArticleList(data=[Article(id=i) for i in range(5)])
+        assert article_list.get_by_id(3) is not None
+
+        article_list[3] = Article(id=30)
+        assert article_list.get_by_id(3) is None and article_list.get_by_id(30) is article_list[3]
+
+        article_list.extend([Article(id=5), Article(id=0)])
+        assert len(article_list) == 6 and article_list.get_by_id(5) is article_list[5]
+
+        article_list.data.append(Article(id=6))
+        assert article_list.get_by_id(6) is article_list[6]
+
+        article_list[0].id = 100
+        assert article_list.get_by_id(0) is None and article_list.get_by_id(100) is article_list[0]
+
+        article_list.data = [Article(id=7)]
+        assert article_list.get_by_id(7) is article_list[0] and article_list.get_by_id(100) is None
+
+    def test_article_list_get_by_id_misses_do_not_rebuild(self):
+        article_list = ArticleList(data=[Article(id=i) for i in range(1000)])
+        with mock.patch.object(IdIndex, '_build', autospec=True, side_effect=IdIndex._build) as build:
+            assert article_list.get_by_id(1) is article_list[1]
+            assert all(article_list.get_by_id(id) is None for id in range(1000, 2000))
+            assert build.call_count == 1
+
+            article_list.extend([Article(id=1000), Article(id=1)])
+            article_list[2] = Article(id=20)  # Invalidates, so the next lookup rebuilds
+            assert build.call_count == 1
+            assert article_list.get_by_id(1000) is article_list[1000] and article_list.get_by_id(20) is article_list[2]
+            assert article_list.get_by_id(2) is None
+            assert build.call_count == 2
+
+
+class FakeArticlesAPI:
+    """ Lists Articles most recently updated first, like the Articles API. """
+
+    def __init__(self, articles):
+        self.articles = articles
+        self.pages_served = 0
+
+    def iter_pages(self, per_page=50):
+        articles = sorted(self.articles, key=lambda article: article.updated_at, reverse=True)
+        for start in range(0, len(articles), per_page):
+            self.pages_served += 1
+            yield ArticleList(data=articles[start:start + per_page], total_count=len(articles))
+
+
+class TestArticleSync(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'sync.json')
+        self.api = FakeArticlesAPI([Article(id=i, updated_at=100 + i) for i in range(20)])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def sync(self, **kwargs):
+        return ArticleSync(self.api, self.path, per_page=5, **kwargs)
+
+    def test_first_run_creates_everything(self):
+        changes = self.sync().run()
+        assert len(changes.created) == 20 and not changes.updated and not changes.deleted
+        assert changes.watermark == 119 and changes.full_scan
+
+    def test_unchanged_run_stops_early(self):
+        self.sync().run()
+        self.api.pages_served = 0
+
+        changes = self.sync().run()
+        assert not changes and not changes.full_scan
+        assert self.api.pages_served == 1
+
+    def test_created_and_updated(self):
+        self.sync().run()
+        self.api.articles[3] = Article(id=3, updated_at=200)
+        self.api.articles.append(Article(id=50, updated_at=201))
+        self.api.pages_served = 0
+
+        sync = self.sync()
+        changes = sync.run()
+        assert [article.id for article in changes.created] == [50]
+        assert [article.id for article in changes.updated] == [3]
+        assert not changes.deleted and not changes.full_scan
+        assert self.api.pages_served == 1
+        assert sync.watermark == 201 and sync.snapshot['3'] == 200 and len(sync.snapshot) == 21
+
+        assert not self.sync().run()
+
+    def test_deleted_needs_full_scan(self):
+        self.sync().run()
+        del self.api.articles[2]
+        self.api.articles.append(Article(id=50, updated_at=201))
+
+        changes = self.sync().run()
+        assert [article.id for article in changes.created] == [50]
+        assert changes.deleted == ['2'] and changes.full_scan
+        assert '2' not in self.sync().snapshot
+
+    def test_run_without_commit(self):
+        self.sync().run()
+        self.api.articles[0] = Article(id=0, updated_at=300)
+
+        assert self.sync().run(commit=False).updated
+        assert self.sync().run().updated
+        assert not self.sync().run()
+
+    def test_stop_early_disabled(self):
+        self.sync().run()
+        self.api.pages_served = 0
+
+        changes = self.sync(stop_early=False).run()
+        assert not changes and changes.full_scan and self.api.pages_served == 4
+
+
+class RecordingAdapter(BaseAdapter):
+    """ Records the JSON body of each request, and echoes it back over `response`. """
+
+    def __init__(self):
+        super().__init__()
+        self.bodies = []
+        self.paths = []
+        self.missing = set()
+        self.lock = threading.Lock()
+        self.response = {'id': 1, 'title': 'Echo'}
+
+    def send(self, request, **kwargs):
+        body = json.loads(request.body)
+        with self.lock:
+            self.bodies.append(body)
+            self.paths.append(request.path_url)
+
+        response = requests.Response()
+        response.status_code = 200
+        response.request = request
+        response.url = request.url
+        response.headers['Content-Type'] = 'application/json'
+        if request.path_url in self.missing:
+            response.status_code = 404
+            body = {'type': 'error.list', 'errors': [{'code': 'not_found', 'message': 'Not found'}]}
+            response._content = json.dumps(body).encode()
+        else:
+            response._content = json.dumps({**self.response, **body}).encode()
+        return response
+
+    def close(self):
+        pass
+
+
+class TestChangedFields(unittest.TestCase):
+
+    def setUp(self):
+        self.intercom = Intercom('TEST')
+        self.transport = RecordingAdapter()
+        self.intercom.articles.api_object.config.session.mount('https://', self.transport)
+
+    def test_tracks_setters_only(self):
+        _, data = fake_factory.fake_schema(ArticleSchema)
+        article = ArticleSchema().load(data)
+        assert not article.changed_fields
+
+        article.api_client = self.intercom.articles.api_object
+        article.title = 'New title'
+        article['state'] = 'draft'
+        assert article.changed_fields == {'title', 'state'}
+
+        article.clear_changes()
+        assert not article.changed_fields
+
+    def test_article_update_sends_changed_fields(self):
+        _, data = fake_factory.fake_schema(ArticleSchema)
+        article = ArticleSchema().load(data)
+        article.api_client = self.intercom.articles.api_object
+
+        article.title = 'New title'
+        article.update()
+        assert self.transport.bodies[-1] == {'title': 'New title'}
+        assert not article.changed_fields
+
+    def test_update_without_changes_sends_nothing(self):
+        article = ArticleSchema().load({'id': 1, 'title': 'Loaded', 'author_id': 2, 'body': '<p>Body</p>'})
+        article.api_client = self.intercom.articles.api_object
+        assert article.dump_changes(ArticleSchema) == {}
+
+        article.update()
+        assert self.transport.bodies == []
+
+        article.title = 'Changed'
+        article.update()
+        assert self.transport.bodies == [{'title': 'Changed'}]
+
+    def test_update_of_a_model_built_in_code_sends_its_fields(self):
+        article = Article(id=1, title='Built by hand', body='<p>Body</p>')
+        article.api_client = self.intercom.articles.api_object
+        assert article.changed_fields == {'id', 'title', 'body'}
+
+        article.update()
+        assert self.transport.bodies[-1] == {'id': 1, 'title': 'Built by hand', 'body': '<p>Body</p>'}
+        assert not article.changed_fields
+
+    def test_collection_update_sends_changed_fields(self):
+        self.intercom.help_center.api_object.config.session.mount('https://', self.transport)
+        self.transport.response = {'id': '1'}
+        collection = CollectionSchema().load({'id': '1', 'name': 'Old', 'description': 'Unchanged'})
+        collection.api_client = self.intercom.help_center.api_object
+
+        collection.name = 'New'
+        collection.update()
+        assert self.transport.bodies[-1] == {'name': 'New'}
+
+    def test_data_attribute_update_sends_changed_fields(self):
+        self.intercom.data_attributes.api_object.config.session.mount('https://', self.transport)
+        self.transport.response = {'id': 1, 'name': 'plan', 'model': 'contact', 'data_type': 'string'}
+        attribute = DataAttributeSchema().load({'id': 1, 'name': 'plan', 'model': 'contact', 'data_type': 'string',
+                                                'api_writable': True, 'description': 'Old'})
+        attribute.api_client = self.intercom.data_attributes.api_object
+
+        attribute.description = 'New'
+        attribute.update()
+        assert self.transport.bodies[-1] == {'type': 'data_attribute', 'description': 'New'}
+
+
+class TestBulkUpdate(unittest.TestCase):
+
+    def setUp(self):
+        self.intercom = Intercom('TEST')
+        self.transport = RecordingAdapter()
+        self.intercom.articles.api_object.config.session.mount('https://', self.transport)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.checkpoint = os.path.join(self.tmp.name, 'checkpoint')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_bulk_translate(self):
+        translations = [(i, 'fr', {'title': f'Article {i}'}) for i in range(10)]
+        results = list(self.intercom.articles.bulk_translate(translations, max_workers=3))
+
+        assert sorted(result.key for result in results) == list(range(10))
+        assert all(result.ok and isinstance(result.result, Article) for result in results)
+        assert results[0].result.api_client is self.intercom.articles.api_object
+        assert {'translated_content': {'fr': {'title': 'Article 4'}}} in self.transport.bodies
+
+    def test_bulk_update_resumes_from_checkpoint(self):
+        self.transport.missing.add('/articles/3')
+        updates = [(str(i), {'title': f'Article {i}'}) for i in range(6)]
+
+        results = list(self.intercom.articles.bulk_update(updates, checkpoint=self.checkpoint))
+        assert [result.key for result in results if not result.ok] == ['3']
+        assert len(self.transport.paths) == 6
+
+        self.transport.missing.clear()
+        self.transport.paths.clear()
+        results = list(self.intercom.articles.bulk_update(updates, checkpoint=self.checkpoint))
+        assert [result.key for result in results] == ['3'] and results[0].ok
+        assert self.transport.paths == ['/articles/3']
+
+        assert not list(self.intercom.articles.bulk_update(updates, checkpoint=self.checkpoint))
+
+    def test_checkpoint_ignores_a_torn_line(self):
+        with open(self.checkpoint, 'w') as f:
+            f.write('"1"\n"2')
+
+        with BulkCheckpoint(self.checkpoint) as checkpoint:
+            assert 1 in checkpoint and '2' not in checkpoint and len(checkpoint) == 1
+            checkpoint.record(3)
+
+        with BulkCheckpoint(self.checkpoint) as checkpoint:
+            assert 3 in checkpoint and len(checkpoint) == 2
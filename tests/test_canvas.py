@@ -0,0 +1,184 @@
+import asyncio
+import json
+from unittest import TestCase
+
+from marshmallow import ValidationError
+
+from intercom_python_sdk.canvas import (
+    CanvasApp,
+    CanvasBuilder,
+    CanvasResponse,
+    CanvasResponseParser,
+    InputParameters,
+    Placeholder,
+    TextParameters,
+    TextStyle
+)
+
+
+class TestCanvasBuilder(TestCase):
+
+    def setUp(self):
+        self.builder = CanvasBuilder()
+        self.builder.add_header("Title")
+        self.builder.add_text_input(InputParameters(id="name"))
+        self.builder.add_submit_button()
+
+    def test_none_values_omitted(self):
+        text_input = self.builder.build()["canvas"]["content"]["components"][1]
+        assert text_input == {"type": "input", "id": "name", "label": "label", "disabled": False}
+
+    def test_add_header_does_not_modify_options(self):
+        options = TextParameters(text="unchanged")
+        self.builder.add_header("Header", options)
+        assert options.text == "unchanged" and options.style == TextStyle.PARAGRAPH
+
+        header = self.builder.build()["canvas"]["content"]["components"][-1]
+        assert header["text"] == "Header" and header["style"] == "header"
+
+    def test_build_is_independent_of_later_changes(self):
+        canvas = self.builder.build()
+        self.builder.add_error_message("Oops")
+        self.builder.set_stored_data("key", "value")
+
+        assert len(canvas["canvas"]["content"]["components"]) == 3
+        assert "stored_data" not in canvas["canvas"]
+        assert self.builder.build()["canvas"]["stored_data"] == {"key": "value"}
+
+    def test_build_json(self):
+        assert json.loads(self.builder.build_json()) == self.builder.build()
+        assert self.builder.build_json() is self.builder.build_json()
+
+        self.builder.set_stored_data("key", "value")
+        assert json.loads(self.builder.build_json())["canvas"]["stored_data"] == {"key": "value"}
+
+    def test_build_json_is_refreshed_by_setting_values_again(self):
+        ids = ["a"]
+        self.builder.set_stored_data("ids", ids)
+        cached = self.builder.build_json()
+
+        ids.append("b")  # In place: not detected, as documented
+        assert self.builder.build_json() is cached
+        self.builder.set_stored_data("ids", ids)
+        assert json.loads(self.builder.build_json())["canvas"]["stored_data"]["ids"] == ["a", "b"]
+
+    def test_reset(self):
+        self.builder.reset()
+        assert self.builder.build() == {"canvas": {"content": {"components": []}}}
+        assert json.loads(self.builder.build_json()) == self.builder.build()
+
+
+class TestCanvasTemplate(TestCase):
+
+    def setUp(self):
+        builder = CanvasBuilder()
+        builder.add_header(Placeholder("title"))
+        builder.add_text_input(InputParameters(id="name", value=Placeholder("name", default="")))
+        builder.add_submit_button()
+        builder.set_stored_data("title", Placeholder("title"))
+        self.template = builder.freeze()
+
+        self.expected = CanvasBuilder()
+        self.expected.add_header('Say "hi"')
+        self.expected.add_text_input(InputParameters(id="name", value="Bob"))
+        self.expected.add_submit_button()
+        self.expected.set_stored_data("title", 'Say "hi"')
+
+    def test_render_matches_builder(self):
+        rendered = self.template.render(title='Say "hi"', name="Bob")
+        assert json.loads(rendered) == self.expected.build()
+        assert self.template.render_dict(title='Say "hi"', name="Bob") == self.expected.build()
+        assert self.template.render_bytes(title='Say "hi"', name="Bob") == rendered.encode()
+
+    def test_placeholders(self):
+        assert self.template.placeholders == {"title", "name"}
+
+    def test_default(self):
+        canvas = self.template.render_dict(title="Title")
+        assert canvas["canvas"]["content"]["components"][1]["value"] == ""
+
+    def test_missing_and_unknown_values(self):
+        with self.assertRaises(KeyError):
+            self.template.render(name="Bob")
+        with self.assertRaises(TypeError):
+            self.template.render(title="Title", other="value")
+
+
+class TestCanvasResponseParser(TestCase):
+    REQUEST = {
+        "component_id": "submit",
+        "context": {"location": "conversation", "note": "a } tricky ] \\\" string"},
+        "current_canvas": {
+            "content": {"components": [{"type": "text", "text": "{[\"]}"}]},
+            "stored_data": {"step": 2},
+        },
+        "input_values": {"name": "Bob"},
+    }
+
+    def test_parse_bytes_matches_parse(self):
+        body = json.dumps(self.REQUEST).encode()
+        expected = CanvasResponseParser(self.REQUEST).parse()
+
+        assert CanvasResponseParser.parse_bytes(body) == expected
+        assert expected == CanvasResponse(stored_data={"step": 2}, component_id="submit", input_values={"name": "Bob"})
+
+    def test_parse_bytes_missing_fields(self):
+        assert CanvasResponseParser.parse_bytes(b'{"context": {}}') == CanvasResponse(stored_data={})
+
+
+class TestCanvasApp(TestCase):
+
+    def setUp(self):
+        self.app = CanvasApp()
+
+        @self.app.handler()
+        def initialize(request):
+            return CanvasBuilder().add_header("Hello").add_submit_button()
+
+        @self.app.handler("submit")
+        async def submit(request):
+            return CanvasBuilder().set_stored_data("name", request.input_values["name"]).add_header("Thanks")
+
+        @self.app.handler("invalid")
+        def invalid(request):
+            return {"canvas": {"content": {"components": [{"type": "unknown"}]}}}
+
+    def _request(self, body: bytes, method: str = "POST"):
+        scope = {"type": "http", "method": method, "path": "/", "headers": []}
+        chunks = [{"type": "http.request", "body": body[:5], "more_body": True},
+                  {"type": "http.request", "body": body[5:], "more_body": False}]
+        sent = []
+
+        async def receive():
+            return chunks.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(self.app(scope, receive, send))
+        return sent[0]["status"], sent[1]["body"]
+
+    def test_default_handler(self):
+        status, body = self._request(b'{"context": {}}')
+        assert status == 200
+        assert json.loads(body) == CanvasBuilder().add_header("Hello").add_submit_button().build()
+
+    def test_async_handler(self):
+        status, body = self._request(json.dumps({"component_id": "submit", "input_values": {"name": "Bob"}}).encode())
+        assert status == 200
+        assert json.loads(body)["canvas"]["stored_data"] == {"name": "Bob"}
+
+    def test_errors(self):
+        assert self._request(b"not json")[0] == 400
+        assert self._request(b"[]")[0] == 400
+        assert self._request(b"{}", method="GET")[0] == 405
+
+        self.app = CanvasApp()
+        assert self._request(b"{}")[0] == 404
+
+    def test_invalid_response(self):
+        assert asyncio.run(self.app.handle(b'{"component_id": "invalid"}'))  # Not validated by default
+
+        self.app.validate = True
+        with self.assertRaises(ValidationError):
+            asyncio.run(self.app.handle(b'{"component_id": "invalid"}'))
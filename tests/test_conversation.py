@@ -0,0 +1,210 @@
+import json
+import time
+from unittest import TestCase
+
+import requests
+
+from tests import fake_factory
+
+from intercom_python_sdk.schemas import ConversationSchema, ConversationListSchema
+from intercom_python_sdk.models import Conversation, ConversationList
+from intercom_python_sdk.core.schema_base import DeferredNested
+from intercom_python_sdk.core.pagination import iter_cursor_pages
+from intercom_python_sdk.core.json_stream import loads_deferring, LazyJSONArray
+from intercom_python_sdk.core.bulk import get_rate_limit_reset, run_bulk
+from intercom_python_sdk.core.errors import IntercomErrorList, IntercomErrorObject
+
+
+class TestConversationSchemaAndModel(TestCase):
+
+    def test_conversation_schema(self):
+        conversation, _ = fake_factory.fake_schema(ConversationSchema)
+        assert isinstance(conversation, ConversationSchema)
+
+    def test_conversation_schema_validation(self):
+        _, data = fake_factory.fake_schema(ConversationSchema)
+        assert not ConversationSchema().validate(data), ConversationSchema().validate(data)
+
+    def test_conversation_schema_load(self):
+        _, data = fake_factory.fake_schema(ConversationSchema)
+        conversation = ConversationSchema().load(data)
+        assert isinstance(conversation, Conversation)
+        assert conversation.id == data['id']
+
+    def test_conversation_schema_dump_and_load(self):
+        _, data = fake_factory.fake_schema(ConversationSchema)
+        conversation = ConversationSchema().load(data)
+        dumped = ConversationSchema().dump(conversation)
+        assert not ConversationSchema().validate(dumped), ConversationSchema().validate(dumped)
+
+
+class TestLazyConversation(TestCase):
+
+    def test_lazy_load_defers_nested_blocks(self):
+        _, data = fake_factory.fake_schema(ConversationSchema)
+        conversation = ConversationSchema(lazy=True).load(data)
+        for name in Conversation.NESTED_FIELDS:
+            assert not conversation.is_loaded(name), name
+
+    def test_lazy_load_materializes_on_access(self):
+        _, data = fake_factory.fake_schema(ConversationSchema)
+        eager = ConversationSchema().load(data)
+        lazy = ConversationSchema(lazy=True).load(data)
+
+        assert lazy.statistics == eager.statistics
+        assert lazy.is_loaded('statistics')
+        assert not lazy.is_loaded('source')
+        assert lazy.statistics is lazy.statistics  # Cached after first access
+
+    def test_lazy_dump_matches_eager_dump(self):
+        _, data = fake_factory.fake_schema(ConversationSchema)
+        eager = ConversationSchema().load(data)
+        lazy = ConversationSchema(lazy=True).load(data)
+        assert ConversationSchema().dump(lazy) == ConversationSchema().dump(eager)
+
+    def test_setting_nested_block_replaces_deferred_value(self):
+        _, data = fake_factory.fake_schema(ConversationSchema)
+        conversation = ConversationSchema(lazy=True).load(data)
+        conversation.tags = {'type': 'tag.list', 'tags': []}
+        assert conversation.is_loaded('tags')
+        assert not isinstance(conversation.tags, DeferredNested)
+        assert conversation.tags == {'type': 'tag.list', 'tags': []}
+
+
+class TestConversationListSchemaAndModel(TestCase):
+
+    def test_conversation_list_schema_load(self):
+        _, data = fake_factory.fake_schema(ConversationListSchema)
+        conversation_list = ConversationListSchema().load(data)
+        assert isinstance(conversation_list, ConversationList)
+        assert len(conversation_list) == len(data['conversations'])
+        for conversation in conversation_list:
+            assert isinstance(conversation, Conversation)
+
+    def test_lazy_list_yields_lazy_conversations(self):
+        _, data = fake_factory.fake_schema(ConversationListSchema)
+        conversation_list = ConversationListSchema(lazy=True).load(data)
+        assert not conversation_list[0].is_loaded('conversation_parts')
+
+    def test_starting_after(self):
+        conversation_list = ConversationList(pages={'next': {'page': 2, 'starting_after': 'abc'}})
+        assert conversation_list.starting_after == 'abc'
+        assert ConversationList(pages={'page': 1}).starting_after is None
+
+
+class TestIterCursorPages(TestCase):
+    PAGES = {None: ('a', '1'), '1': ('b', '2'), '2': ('c', None)}
+
+    def _fetch(self, cursor):
+        self.fetched.append(cursor)
+        return self.PAGES[cursor]
+
+    def setUp(self):
+        self.fetched = []
+
+    def test_iterates_all_pages_in_order(self):
+        pages = iter_cursor_pages(self._fetch, lambda page: page[1])
+        assert [page[0] for page in pages] == ['a', 'b', 'c']
+        assert self.fetched == [None, '1', '2']
+
+    def test_without_prefetch(self):
+        pages = iter_cursor_pages(self._fetch, lambda page: page[1], prefetch=False)
+        assert [page[0] for page in pages] == ['a', 'b', 'c']
+
+    def test_starting_after(self):
+        pages = iter_cursor_pages(self._fetch, lambda page: page[1], starting_after='1')
+        assert [page[0] for page in pages] == ['b', 'c']
+
+
+class TestConversationParts(TestCase):
+    PARTS = [{'id': str(i), 'body': '<p>[{"tricky": "]"}]</p>', 'part_type': 'comment'} for i in range(5)]
+
+    def _payload(self):
+        _, data = fake_factory.fake_schema(ConversationSchema)
+        data['conversation_parts'] = {'type': 'conversation_part.list', 'conversation_parts': self.PARTS,
+                                      'total_count': len(self.PARTS)}
+        return json.dumps(data, default=str)
+
+    def test_loads_deferring_matches_json_loads(self):
+        text = self._payload()
+        data = loads_deferring(text, ('conversation_parts', 'conversation_parts'))
+        parts = data['conversation_parts']['conversation_parts']
+        assert isinstance(parts, LazyJSONArray)
+        assert list(parts) == self.PARTS
+
+        data['conversation_parts']['conversation_parts'] = list(parts)
+        assert data == json.loads(text)
+
+    def test_loads_deferring_skip(self):
+        text = self._payload()
+        data = loads_deferring(text, ('conversation_parts',), skip=True)
+        expected = json.loads(text)
+        del expected['conversation_parts']
+        assert data == expected
+
+    def test_loads_deferring_empty_array(self):
+        data = loads_deferring('{"a": {"b": [ ]}, "c": 1}', ('a', 'b'))
+        assert list(data['a']['b']) == [] and data['c'] == 1
+
+    def test_iter_parts_from_deferred_buffer(self):
+        data = loads_deferring(self._payload(), ('conversation_parts', 'conversation_parts'))
+        conversation = ConversationSchema(lazy=True).load(data)
+
+        ids = [part['id'] for part in conversation.iter_parts()]
+        assert ids == [part['id'] for part in self.PARTS]
+        assert not conversation.is_loaded('conversation_parts')
+
+        assert len(conversation.conversation_parts['conversation_parts']) == len(self.PARTS)
+        assert [part['id'] for part in conversation.iter_parts()] == ids
+
+    def test_iter_parts_without_parts(self):
+        assert list(Conversation().iter_parts()) == []
+
+
+class TestBulk(TestCase):
+
+    @staticmethod
+    def _error(code, status_code, headers=None):
+        error = IntercomErrorList(type='error.list', errors=[IntercomErrorObject(code=code, message=code)])
+        error.response = requests.Response()
+        error.response.status_code = status_code
+        error.response.headers.update(headers or {})
+        return error
+
+    def test_rate_limit_reset(self):
+        reset = int(time.time()) + 10
+        assert get_rate_limit_reset(self._error('rate_limit_exceeded', 429, {'X-RateLimit-Reset': str(reset)})) == reset
+        retry_after = self._error('rate_limit_exceeded', 429, {'Retry-After': '5'})
+        assert get_rate_limit_reset(retry_after, clock=lambda: 100) == 105
+        assert get_rate_limit_reset(self._error('not_found', 404)) is None
+        assert get_rate_limit_reset(ValueError()) is None
+
+    def test_failures_do_not_abort_the_batch(self):
+        def func(value):
+            if value == 3:
+                raise ValueError(value)
+            return value * 2
+
+        results = sorted(run_bulk(func, ((i, (i,)) for i in range(10)), max_workers=3), key=lambda r: r.index)
+        assert [r.result for r in results if r.ok] == [i * 2 for i in range(10) if i != 3]
+        assert isinstance(results[3].error, ValueError) and results[3].key == 3
+
+    def test_rate_limited_calls_are_retried(self):
+        attempts = []
+
+        def func(value):
+            attempts.append(value)
+            if attempts.count(value) == 1 and value == 0:
+                raise self._error('rate_limit_exceeded', 429)
+            return value
+
+        results = list(run_bulk(func, [(i, (i,)) for i in range(4)], max_workers=2, backoff=0.01))
+        assert all(r.ok for r in results)
+        assert {r.key: r.attempts for r in results}[0] == 2
+
+    def test_rate_limited_calls_give_up_after_max_retries(self):
+        def func():
+            raise self._error('rate_limit_exceeded', 429)
+
+        result, = run_bulk(func, [('a', ())], max_retries=2, backoff=0.01)
+        assert not result.ok and result.attempts == 3
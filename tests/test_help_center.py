@@ -0,0 +1,183 @@
+import json
+import threading
+from types import SimpleNamespace
+from unittest import TestCase
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import BaseAdapter
+
+from intercom_python_sdk import Intercom
+from intercom_python_sdk.models import Article
+from intercom_python_sdk.apis.help_center.models import Collection, CollectionList, Section, SectionList
+from intercom_python_sdk.apis.help_center.tree import HelpCenterTree
+from intercom_python_sdk.core.pagination import iter_numbered_pages
+
+
+class FakeHelpCenter:
+    def __init__(self, collections, sections, articles):
+        self.collections, self.sections, self.articles = collections, sections, articles
+
+    def list_all_collections(self):
+        return SimpleNamespace(data=list(self.collections))
+
+    def list_all_sections(self):
+        return SimpleNamespace(data=list(self.sections))
+
+    def list_all(self):
+        return SimpleNamespace(data=list(self.articles))
+
+
+class TestHelpCenterTree(TestCase):
+
+    def setUp(self):
+        self.collections = [
+            Collection(id='1', name='Root', updated_at=1),
+            Collection(id='2', name='Child', parent_id=1, updated_at=1),
+        ]
+        self.sections = [Section(id='10', name='Section', collection_id='2', updated_at=1)]
+        self.articles = [
+            Article(id=100, title='In section', parent_id=10, parent_type='section', updated_at=1),
+            Article(id=101, title='In collection', parent_id=1, parent_type='collection', updated_at=1),
+            Article(id=102, title='Unparented', parent_id=None, updated_at=1),
+        ]
+        self.api = FakeHelpCenter(self.collections, self.sections, self.articles)
+        self.tree = HelpCenterTree.fetch(self.api, self.api)
+
+    def test_lookups(self):
+        assert len(self.tree) == 6
+        assert self.tree.collection(1) is self.collections[0]
+        assert self.tree.section('10') is self.sections[0]
+        assert self.tree.article('100') is self.articles[0]
+        assert self.tree.article(999) is None
+
+    def test_navigation(self):
+        assert self.tree.roots() == [self.collections[0], self.articles[2]]
+        assert self.tree.children(self.collections[0]) == [self.collections[1], self.articles[1]]
+        assert self.tree.children(self.collections[1]) == [self.sections[0]]
+        assert self.tree.parent(self.articles[0]) is self.sections[0]
+        assert self.tree.parent(self.collections[0]) is None
+
+    def test_breadcrumb(self):
+        assert self.tree.breadcrumb(self.articles[0]) == [
+            self.collections[0], self.collections[1], self.sections[0], self.articles[0]
+        ]
+        assert self.tree.breadcrumb(self.articles[2]) == [self.articles[2]]
+
+    def test_refresh(self):
+        moved = Article(id=100, title='Moved', parent_id=1, parent_type='collection', updated_at=2)
+        added = Collection(id='3', name='New', updated_at=1)
+        self.api.articles = [moved] + self.articles[1:]
+        self.api.collections = self.collections + [added]
+        self.api.sections = []
+
+        changes = self.tree.refresh(self.api, self.api)
+
+        assert changes.added == [('collection', '3')]
+        assert changes.updated == [('article', '100')]
+        assert changes.removed == [('section', '10')]
+        assert self.tree.article(100) is moved
+        assert self.tree.children(self.collections[0]) == [self.collections[1], self.articles[1], moved]
+        assert self.tree.children(self.collections[1]) == []
+        assert self.tree.collection(1) is self.collections[0]
+
+        assert not self.tree.refresh(self.api, self.api)
+
+
+class PagedAdapter(BaseAdapter):
+    """ Serves `total` Sections or Collections, `per_page` at a time. """
+
+    def __init__(self, total):
+        super().__init__()
+        self.total = total
+        self.pages_served = []
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        url = urlparse(request.url)
+        query = parse_qs(url.query)
+        page, per_page = int(query['page'][0]), int(query['per_page'][0])
+        with self.lock:
+            self.pages_served.append(page)
+
+        kind = url.path.rsplit('/', 1)[-1][:-1]
+        ids = range((page - 1) * per_page, min(page * per_page, self.total))
+        payload = {
+            'type': 'list',
+            'data': [{'type': kind, 'id': str(i), 'name': f'{kind} {i}', 'collection_id': '1'} for i in ids],
+            'total_count': self.total,
+            'pages': {'type': 'pages', 'page': page, 'per_page': per_page,
+                      'total_pages': max(1, -(-self.total // per_page))},
+        }
+
+        response = requests.Response()
+        response.status_code = 200
+        response.request = request
+        response.url = request.url
+        response.headers['Content-Type'] = 'application/json'
+        response._content = json.dumps(payload).encode()
+        return response
+
+    def close(self):
+        pass
+
+
+class TestHelpCenterPagination(TestCase):
+
+    def setUp(self):
+        self.intercom = Intercom('TEST')
+        self.transport = PagedAdapter(total=95)
+        self.intercom.help_center.api_object.config.session.mount('https://', self.transport)
+
+    def test_iter_numbered_pages_in_order(self):
+        pages = list(iter_numbered_pages(lambda page: page, lambda page: 7, max_workers=3))
+        assert pages == list(range(1, 8))
+
+    def test_iter_numbered_pages_single_page(self):
+        assert list(iter_numbered_pages(lambda page: page, lambda page: 1)) == [1]
+
+    def test_list_all_sections(self):
+        sections = self.intercom.help_center.list_all_sections(per_page=10)
+        assert [section.id for section in sections] == [str(i) for i in range(95)]
+        assert sorted(self.transport.pages_served) == list(range(1, 11))
+        assert sections.pages['page'] == 10
+        assert sections[0].api_client is self.intercom.help_center.api_object
+
+    def test_list_all_collections(self):
+        collections = self.intercom.help_center.list_all_collections(per_page=10)
+        assert len(collections) == 95
+        assert collections.get_by_id('94').name == 'collection 94'
+
+    def test_iter_sections_is_lazy(self):
+        sections = self.intercom.help_center.iter_sections(per_page=10, max_workers=2)
+        first = [next(sections) for _ in range(5)]
+        sections.close()
+
+        assert [section.id for section in first] == ['0', '1', '2', '3', '4']
+        assert len(self.transport.pages_served) <= 3
+
+    def test_extend_skips_duplicates(self):
+        sections = self.intercom.help_center.list_all_sections(per_page=50)
+        sections.extend(self.intercom.help_center.list_all_sections(per_page=10))
+        assert len(sections) == 95
+
+
+class TestListIndexes(TestCase):
+
+    def test_collection_list_get_by_id(self):
+        collections = CollectionList(data=[Collection(id=str(i)) for i in range(5)])
+        assert collections.get_by_id('2') is collections[2]
+
+        collections.collections = [Collection(id='9')]
+        assert collections.get_by_id('2') is None and collections.get_by_id('9') is collections[0]
+
+        collections[0] = Collection(id='8')
+        assert collections.get_by_id('9') is None and collections.get_by_id('8') is collections[0]
+
+    def test_section_list_get_by_id(self):
+        sections = SectionList(data=[Section(id=str(i)) for i in range(5)])
+        sections.extend(SectionList(data=[Section(id='4'), Section(id='5')]))
+        assert len(sections) == 6 and sections.get_by_id('5') is sections[5]
+
+        sections.sections = []
+        assert sections.get_by_id('5') is None
@@ -0,0 +1,108 @@
+import io
+import json
+from unittest import TestCase
+
+import requests
+from requests.adapters import BaseAdapter
+from uplink.auth import BearerToken
+
+from tests import fake_factory
+
+from intercom_python_sdk import Intercom, Configuration
+from intercom_python_sdk.schemas import AdminListSchema
+from intercom_python_sdk.models import AdminList
+from intercom_python_sdk.core.http_cache import HTTPCache
+
+
+class Connection(io.BytesIO):
+    """ The raw body of a response, recording whether its connection was released. """
+
+    released = False
+
+    def release_conn(self):
+        self.released = True
+
+
+class ETagAdapter(BaseAdapter):
+    """ Serves a fixed payload with an ETag, answering 304 to matching conditional requests. """
+
+    def __init__(self, payload, etag='"v1"'):
+        super().__init__()
+        self.payload = payload
+        self.etag = etag
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.headers['Content-Type'] = 'application/json'
+        if request.headers.get('If-None-Match') == self.etag:
+            response.status_code = 304
+            response.raw = Connection(b'')
+            self.not_modified = response
+        else:
+            response.status_code = 200
+            response.headers['ETag'] = self.etag
+            response._content = json.dumps(self.payload, default=str).encode()
+        return response
+
+    def close(self):
+        pass
+
+
+class TestHTTPCache(TestCase):
+
+    def setUp(self):
+        _, payload = fake_factory.fake_schema(AdminListSchema)
+        self.config = Configuration(auth=BearerToken('TEST'), http_cache=True)
+        self.transport = ETagAdapter(payload)
+        self.config.session.get_adapter('https://api.intercom.io').adapter = self.transport
+        self.intercom = Intercom(config=self.config)
+
+    def test_disabled_by_default(self):
+        assert Configuration(auth=BearerToken('TEST')).http_cache is None
+
+    def test_conditional_request_reuses_model(self):
+        first = self.intercom.admins.list_admins()
+        second = self.intercom.admins.list_admins()
+
+        assert isinstance(first, AdminList)
+        assert second is not first and AdminListSchema().dump(second) == AdminListSchema().dump(first)
+        assert second[0].api_client is self.intercom.admins.api_object
+        assert self.transport.not_modified.raw.released  # The connection of the 304 went back to the pool
+        assert 'If-None-Match' not in self.transport.sent[0].headers
+        assert self.transport.sent[1].headers['If-None-Match'] == '"v1"'
+
+    def test_replayed_models_are_not_shared(self):
+        first = self.intercom.admins.list_admins()
+        first[0].away_mode_enabled = not first[0].away_mode_enabled
+        second = self.intercom.admins.list_admins()  # Replayed from the 304
+
+        assert second[0].away_mode_enabled != first[0].away_mode_enabled
+        assert first[0].changed_fields == {'away_mode_enabled'} and not second[0].changed_fields
+
+    def test_changed_resource_is_reloaded(self):
+        first = self.intercom.admins.list_admins()
+        self.transport.etag = '"v2"'
+        second = self.intercom.admins.list_admins()
+        third = self.intercom.admins.list_admins()
+
+        assert second is not first
+        assert third is not second and AdminListSchema().dump(third) == AdminListSchema().dump(second)
+
+    def test_cache_is_keyed_by_authorization(self):
+        self.intercom.admins.list_admins()
+        other = Configuration(auth=BearerToken('OTHER'), http_cache=self.config.http_cache)
+        other.session.get_adapter('https://api.intercom.io').adapter = self.transport
+        Intercom(config=other).admins.list_admins()
+
+        assert 'If-None-Match' not in self.transport.sent[1].headers
+        assert len(self.config.http_cache) == 2
+
+    def test_lru_eviction(self):
+        cache = HTTPCache(max_entries=2)
+        for key in 'abc':
+            cache.set(key, object())
+        assert len(cache) == 2 and cache.get('a') is None
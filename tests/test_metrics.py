@@ -0,0 +1,124 @@
+import json
+from unittest import TestCase
+
+import requests
+from requests.adapters import BaseAdapter
+from uplink.auth import BearerToken
+
+from intercom_python_sdk import Intercom
+from intercom_python_sdk.core.bulk import run_bulk
+from intercom_python_sdk.core.configuration import Configuration
+from intercom_python_sdk.core.errors import IntercomErrorList, IntercomErrorObject
+from intercom_python_sdk.core.metrics import Metrics, MetricsAggregator, endpoint_of
+from intercom_python_sdk.models import Article
+
+
+class ArticleAdapter(BaseAdapter):
+    """ Serves Articles, a 404 for article 404, and a connection error for article 500. """
+
+    def send(self, request, **kwargs):
+        article_id = request.path_url.rsplit('/', 1)[-1]
+        if article_id == '500':
+            raise requests.ConnectionError('Connection refused', request=request)
+
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.headers['Content-Type'] = 'application/json'
+        if article_id == '404':
+            response.status_code = 404
+            body = {'type': 'error.list', 'errors': [{'code': 'not_found', 'message': 'Not found'}]}
+        else:
+            response.status_code = 200
+            body = {'type': 'article', 'id': article_id, 'title': 'Article', 'author_id': 1}
+        response._content = json.dumps(body).encode()
+        return response
+
+    def close(self):
+        pass
+
+
+class TestMetrics(TestCase):
+
+    def setUp(self):
+        self.records = []
+        self.aggregator = MetricsAggregator()
+        config = Configuration(auth=BearerToken('TEST'), metrics=Metrics(self.records.append, self.aggregator))
+        config.session.mount('https://', ArticleAdapter())
+        self.intercom = Intercom(config=config)
+
+    def test_endpoint_of(self):
+        assert endpoint_of('GET', 'https://api.intercom.io/articles/123?page=2') == 'GET /articles/{id}'
+        assert endpoint_of('POST', 'https://api.intercom.io/conversations/search') == 'POST /conversations/search'
+
+    def test_loaded_response(self):
+        article = self.intercom.articles.get_by_id(1)
+        assert isinstance(article, Article)
+
+        record, = self.records
+        assert record.endpoint == 'GET /articles/{id}' and record.status_code == 200
+        assert record.response_size > 0 and record.request_time >= record.time_to_headers
+        assert record.deserialize_time is not None and record.inject_time is not None
+        assert record.attempt == 1 and record.error is None
+
+    def test_response_without_schema(self):
+        self.intercom.help_center.delete_collection_by_id(1)
+
+        record, = self.records
+        assert record.endpoint == 'DELETE /help_center/collections/{id}' and record.deserialize_time is None
+
+    def test_error_response(self):
+        with self.assertRaises(IntercomErrorList):
+            self.intercom.articles.get_by_id(404)
+
+        record, = self.records
+        assert record.status_code == 404 and record.deserialize_time is None
+
+    def test_connection_error(self):
+        with self.assertRaises(requests.ConnectionError):
+            self.intercom.articles.get_by_id(500)
+
+        record, = self.records
+        assert record.status_code is None and record.error == 'ConnectionError'
+        assert record.endpoint == 'GET /articles/{id}'
+
+    def test_attempts_from_run_bulk(self):
+        api = self.intercom.articles.api_object
+        calls = []
+
+        def get(article_id):
+            calls.append(article_id)
+            if len(calls) == 1:
+                error = IntercomErrorList(type='error.list', errors=[
+                    IntercomErrorObject(code='rate_limit_exceeded', message='Rate limited')])
+                error.response = requests.Response()
+                error.response.status_code = 429
+                raise error
+            return api.get_by_id(article_id)
+
+        result, = run_bulk(get, [(1, (1,))], backoff=0.01)
+        assert result.ok and result.attempts == 2
+        record, = self.records
+        assert record.attempt == 2 and record.inject_time is None
+        assert self.aggregator.retries['GET /articles/{id}'] == 1
+
+    def test_aggregator(self):
+        self.intercom.articles.get_by_id(1)
+        self.intercom.articles.get_by_id(2)
+        with self.assertRaises(IntercomErrorList):
+            self.intercom.articles.get_by_id(404)
+
+        assert self.aggregator.requests[('GET /articles/{id}', '200')] == 2
+        assert self.aggregator.requests[('GET /articles/{id}', '404')] == 1
+
+        text = self.aggregator.render()
+        assert 'intercom_sdk_requests_total{endpoint="GET /articles/{id}",status="200"} 2' in text
+        assert 'intercom_sdk_request_time_seconds_count{endpoint="GET /articles/{id}"} 3' in text
+        assert 'intercom_sdk_deserialize_time_seconds_count{endpoint="GET /articles/{id}"} 2' in text
+
+    def test_failing_sink_does_not_fail_the_request(self):
+        def sink(record):
+            raise RuntimeError('Sink failure')
+
+        self.intercom.articles.api_object.config.metrics.add_sink(sink)
+        assert self.intercom.articles.get_by_id(1).id == 1
@@ -0,0 +1,92 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from intercom_python_sdk import IntercomPool
+from intercom_python_sdk.models import Article
+
+from tests.stand_in import StandIn, StandInAdapter
+
+
+class AuthRecordingAdapter(StandInAdapter):
+    """ Serves requests from a stand-in, recording the Authorization header of each. """
+
+    def __init__(self, stand_in=None):
+        super().__init__(stand_in)
+        self.authorizations = []
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.authorizations.append((request.path_url.split('?')[0], request.headers.get('Authorization')))
+        return super().send(request, **kwargs)
+
+
+class TestIntercomPool(TestCase):
+
+    def setUp(self):
+        self.pool = IntercomPool(max_workspaces=3)
+        self.adapter = AuthRecordingAdapter(StandIn(totals={'article': 25}))
+        self.pool.config.session.mount('https://', self.adapter)
+
+    def test_calls_use_the_workspace_token(self):
+        article = self.pool.client('token_a').articles.get_by_id(1)
+        self.pool.client('token_b').admins.me()
+        assert isinstance(article, Article)
+
+        article.title = 'Updated'
+        article.update()  # With the token of the workspace it was loaded from
+        assert self.adapter.authorizations == [
+            ('/articles/1', 'Bearer token_a'),
+            ('/me', 'Bearer token_b'),
+            ('/articles/1', 'Bearer token_a'),
+        ]
+
+    def test_generators_use_the_workspace_token(self):
+        articles = self.pool.client('token_a').articles.iter_all(per_page=10, max_workers=2)
+        self.pool.client('token_b').teams.get_all_teams()
+        assert len(list(articles)) == 25
+
+        assert set(self.adapter.authorizations) == {('/articles/', 'Bearer token_a'), ('/teams/', 'Bearer token_b')}
+
+    def test_concurrent_workspaces(self):
+        def get(index):
+            token = f'token_{index % 3}'
+            self.pool.client(token).articles.get_by_id(index + 1)
+            return token
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            tokens = list(executor.map(get, range(24)))
+
+        recorded = {path: token for path, token in self.adapter.authorizations}
+        assert all(recorded[f'/articles/{index + 1}'] == f'Bearer {token}' for index, token in enumerate(tokens))
+
+    def test_workspaces_share_the_api_clients(self):
+        client_a, client_b = self.pool.client('token_a'), self.pool.client('token_b')
+        assert client_a.articles.api_object.api_class is type(client_b.articles.api_object._api)
+        assert client_a.articles.config is client_b.articles.config is self.pool.config
+
+    def test_least_recently_used_workspaces_are_evicted(self):
+        client_a = self.pool.client('token_a')
+        for token in ('token_b', 'token_c'):
+            self.pool.client(token)
+        assert self.pool.client('token_a') is client_a  # Now the most recently used
+
+        self.pool.client('token_d')
+        assert len(self.pool) == 3 and 'token_b' not in self.pool and 'token_a' in self.pool
+
+        self.pool.evict('token_a')
+        assert 'token_a' not in self.pool
+
+    def test_calls_require_a_workspace(self):
+        with self.assertRaises(RuntimeError):
+            self.pool.apis['articles'].get_by_id(1)
+        with self.assertRaises(ValueError):
+            self.pool.client('')
+        with self.assertRaises(ValueError):
+            IntercomPool(auth=None)
+
+    def test_connection_pool_is_sized_behind_wrapping_adapters(self):
+        pool = IntercomPool(pool_maxsize=7, http_cache=True, single_flight=True)
+        adapter = pool.config.session.get_adapter('https://api.intercom.io')
+        assert adapter.adapter.adapter._pool_maxsize == 7  # Single-flight, then HTTP cache, then HTTP
@@ -0,0 +1,104 @@
+import json
+import tracemalloc
+from unittest import TestCase
+
+from uplink.auth import BearerToken
+
+from intercom_python_sdk import Intercom
+from intercom_python_sdk.core.configuration import Configuration
+from intercom_python_sdk.core.errors import IntercomErrorList
+from intercom_python_sdk.core.profiling import LAYERS, Profiling
+from intercom_python_sdk.core.schema_base import SchemaBase
+from intercom_python_sdk.models import Article, Section
+
+from tests.stand_in import StandIn, StandInAdapter
+
+
+class TestProfiling(TestCase):
+
+    def setUp(self):
+        self.profiling = Profiling()
+        config = Configuration(auth=BearerToken('TEST'), profiling=self.profiling)
+        config.session.mount('https://', StandInAdapter(StandIn(totals={'article': 30})))
+        self.intercom = Intercom(config=config)
+
+    def tearDown(self):
+        self.profiling.stop()
+
+    def test_layers(self):
+        self.intercom.articles.get_by_id(1)
+        self.intercom.articles.get_by_id(2)
+
+        stats = self.profiling.stats()['ArticlesAPI.get_by_id']
+        assert stats.calls == 2
+        assert set(stats.layers) == set(LAYERS)
+        assert stats.layers['http'].calls == 2 and stats.layers['model_init'].calls == 2
+
+        # Layer times are exclusive, so they add up to the time of the calls.
+        total = sum(layer.wall_time for layer in stats.layers.values())
+        assert abs(total - stats.wall_time) < 1e-3
+        assert all(layer.cpu_time >= 0 for layer in stats.layers.values())
+
+    def test_paginated_method(self):
+        self.intercom.articles.list_all(per_page=10)
+
+        stats = self.profiling.stats()['ArticlesAPI.list_all']
+        assert stats.calls == 1
+        assert stats.layers['http'].calls == 3 and stats.layers['schema_load'].calls == 3
+        assert stats.layers['model_init'].calls == 33  # 30 Articles and 3 ArticleLists
+
+    def test_generator_is_profiled_while_consumed(self):
+        articles = list(self.intercom.articles.iter_all(per_page=10, max_workers=1))
+        assert len(articles) == 30
+
+        stats = self.profiling.stats()['ArticlesAPI.iter_all']
+        assert stats.calls == 1
+        assert stats.layers['http'].calls == 3 and stats.layers['inject'].calls == 30
+
+    def test_error_ends_request_layer(self):
+        with self.assertRaises(IntercomErrorList):
+            self.intercom.articles.get_by_id(1000)
+        self.intercom.articles.get_by_id(1)
+
+        stats = self.profiling.stats()['ArticlesAPI.get_by_id']
+        assert stats.calls == 2 and stats.layers['request_build'].calls == 2
+
+    def test_allocation_sampling(self):
+        self.profiling.sample_allocations = 1.0
+        self.intercom.articles.get_by_id(1)
+
+        layers = self.profiling.stats()['ArticlesAPI.get_by_id'].layers
+        assert all(layer.sampled_calls == layer.calls for layer in layers.values())
+        assert sum(layer.alloc_bytes for layer in layers.values()) > 0  # The returned Article, at least
+        assert not tracemalloc.is_tracing()
+
+    def test_reports(self):
+        self.intercom.articles.get_by_id(1)
+
+        report = json.loads(self.profiling.to_json())
+        assert report['ArticlesAPI.get_by_id']['layers']['http']['calls'] == 1
+        assert 'ArticlesAPI.get_by_id: 1 calls' in self.profiling.table()
+
+        self.profiling.reset()
+        assert self.profiling.stats() == {}
+
+    def test_not_profiled_outside_of_calls(self):
+        self.intercom.articles.api_object.get_by_id(1)
+        Article(title='Not profiled')
+        assert self.profiling.stats() == {}
+
+    def test_classes_are_wrapped_while_profiling(self):
+        assert hasattr(Article.__init__, '__wrapped__') and hasattr(SchemaBase.load, '__wrapped__')
+
+        other = Profiling()
+        Configuration(auth=BearerToken('TEST'), profiling=other)
+        self.profiling.stop()
+        assert hasattr(Section.__init__, '__wrapped__')  # Still in use by the other one
+
+        other.stop()
+        assert not hasattr(Article.__init__, '__wrapped__') and not hasattr(SchemaBase.load, '__wrapped__')
+        assert not hasattr(Section.__init__, '__wrapped__')
+        assert not hasattr(self.intercom.articles.api_object.config.session.send, '__wrapped__')
+
+        self.intercom.articles.get_by_id(1)
+        assert self.profiling.stats() == {}  # Stopped
@@ -0,0 +1,211 @@
+import fnmatch
+import tempfile
+import time
+from unittest import TestCase
+from urllib.parse import urlsplit, urlunsplit
+
+from requests.adapters import BaseAdapter
+from uplink.auth import BearerToken
+
+from intercom_python_sdk import Intercom, Configuration, IntercomPool
+from intercom_python_sdk.core.read_cache import DiskBackend, MemoryBackend, ReadCache, RedisBackend
+from intercom_python_sdk.models import Article
+
+from tests.stand_in import StandIn, StandInAdapter
+
+
+class FakeRedis:
+    """ The subset of the `redis.Redis` interface used by `RedisBackend`, in memory. """
+
+    def __init__(self):
+        self.values, self.expires = {}, {}
+
+    def _alive(self, name):
+        if name in self.expires and self.expires[name] <= time.time():
+            self.values.pop(name, None)
+            self.expires.pop(name)
+        return name in self.values
+
+    def get(self, name):
+        return self.values[name] if self._alive(name) else None
+
+    def set(self, name, value, px=None):
+        self.values[name] = value
+        self.expires[name] = time.time() + px / 1000
+
+    def sadd(self, name, member):
+        self.values.setdefault(name, set()).add(member.encode())
+
+    def pexpire(self, name, milliseconds):
+        self.expires[name] = time.time() + milliseconds / 1000
+
+    def smembers(self, name):
+        return set(self.values[name]) if self._alive(name) else set()
+
+    def delete(self, *names):
+        for name in names:
+            self.values.pop(name, None)
+
+    def scan_iter(self, match):
+        return [name for name in list(self.values) if fnmatch.fnmatch(name, match)]
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        pass
+
+
+class PathPrefixAdapter(BaseAdapter):
+    """ A reverse proxy serving the API under a path prefix. """
+
+    def __init__(self, prefix, adapter):
+        super().__init__()
+        self.prefix, self.adapter = prefix, adapter
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        assert parts.path.startswith(self.prefix + '/')
+        request = request.copy()
+        request.url = urlunsplit(('https', 'api.intercom.io', parts.path[len(self.prefix):], parts.query, ''))
+        return self.adapter.send(request, **kwargs)
+
+
+class TestReadCache(TestCase):
+
+    def setUp(self):
+        self.cache = ReadCache(ttls={'Team': 0})
+        self.stand_in = StandIn(totals={'article': 5, 'collection': 2})
+        config = Configuration(auth=BearerToken('TEST'), read_cache=self.cache)
+        config.session.get_adapter('https://api.intercom.io').adapter = StandInAdapter(self.stand_in)
+        self.intercom = Intercom(config=config)
+
+    def test_reads_are_cached(self):
+        first = self.intercom.articles.get_by_id(1)
+        second = self.intercom.articles.get_by_id(1)
+
+        assert self.stand_in.requests['GET /articles/{id}'] == 1
+        assert isinstance(second, Article) and second.id == 1
+        assert second is not first  # Each call gets its own model
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+
+    def test_per_type_ttls(self):
+        self.intercom.teams.get_team_by_id(1)
+        self.intercom.teams.get_team_by_id(1)
+        assert self.stand_in.requests['GET /teams/{id}'] == 2  # Not cached, with a TTL of 0
+
+        self.cache.ttls['Article'] = 0.05
+        self.intercom.articles.get_by_id(1)
+        time.sleep(0.06)
+        self.intercom.articles.get_by_id(1)
+        assert self.stand_in.requests['GET /articles/{id}'] == 2
+
+    def test_listings_are_not_cached(self):
+        self.intercom.articles.list_all()
+        self.intercom.articles.list_all()
+        assert self.stand_in.requests['GET /articles'] == 2
+
+    def test_updates_invalidate(self):
+        article = self.intercom.articles.get_by_id(1)
+        self.intercom.articles.get_by_id(2)
+        article.title = 'Updated'
+        article.update()
+
+        assert self.intercom.articles.get_by_id(1).title == 'Updated'
+        self.intercom.articles.get_by_id(2)
+        assert self.stand_in.requests['GET /articles/{id}'] == 3  # Article 2 is still cached
+
+    def test_deletes_invalidate(self):
+        self.intercom.help_center.get_collection_by_id(1)
+        self.intercom.help_center.delete_collection_by_id(1)
+        self.intercom.help_center.get_collection_by_id(2)
+        assert self.cache.invalidations == 1
+        assert self.stand_in.requests['GET /help_center/collections/{id}'] == 2
+
+    def test_data_attributes_are_cached_as_a_listing(self):
+        attribute = self.intercom.data_attributes.get_by_id(1)
+        self.intercom.data_attributes.get_by_id(2)
+        assert self.stand_in.requests['GET /data_attributes'] == 1
+
+        self.intercom.data_attributes.update_by_id(1, attribute)
+        self.intercom.data_attributes.get_by_id(1)
+        assert self.stand_in.requests['GET /data_attributes'] == 2
+
+    def test_base_url_with_a_path(self):
+        config = Configuration(auth=BearerToken('TEST'), base_url='https://proxy.example.com/intercom',
+                               read_cache=self.cache)
+        config.session.get_adapter('https://').adapter = PathPrefixAdapter('/intercom', StandInAdapter(self.stand_in))
+        intercom = Intercom(config=config)
+
+        article = intercom.articles.get_by_id(1)
+        intercom.articles.get_by_id(1)
+        assert self.stand_in.requests['GET /articles/{id}'] == 1
+
+        article.title = 'Updated'
+        article.update()
+        assert intercom.articles.get_by_id(1).title == 'Updated'
+        assert self.stand_in.requests['GET /articles/{id}'] == 2
+
+    def test_workspaces_do_not_share_reads(self):
+        with IntercomPool(read_cache=self.cache) as pool:
+            pool.config.session.get_adapter('https://api.intercom.io').adapter = StandInAdapter(self.stand_in)
+            pool.client('token_a').articles.get_by_id(1)
+            pool.client('token_b').articles.get_by_id(1)
+            pool.client('token_a').articles.get_by_id(1)
+        assert self.stand_in.requests['GET /articles/{id}'] == 2
+
+
+class TestCacheBackends(TestCase):
+
+    def check_backend(self, backend):
+        backend.set('Article:1', 'a', b'first', ttl=60)
+        backend.set('Article:1', 'b', b'second', ttl=60)
+        backend.set('Article:2', 'a', b'other', ttl=60)
+        backend.set('Team:1', 'a', b'expired', ttl=0.01)
+        time.sleep(0.02)
+
+        assert backend.get('Article:1', 'a') == b'first'
+        assert backend.get('Team:1', 'a') is None
+        assert backend.get('Article:3', 'a') is None
+
+        backend.invalidate('Article:1')
+        assert backend.get('Article:1', 'a') is None and backend.get('Article:1', 'b') is None
+        assert backend.get('Article:2', 'a') == b'other'
+
+        backend.clear()
+        assert backend.get('Article:2', 'a') is None
+
+    def test_memory_backend(self):
+        self.check_backend(MemoryBackend())
+
+        backend = MemoryBackend(max_entries=2)
+        backend.set('Article:1', 'a', b'1', ttl=60)
+        backend.set('Article:2', 'a', b'2', ttl=60)
+        backend.get('Article:1', 'a')
+        backend.set('Article:3', 'a', b'3', ttl=60)
+        assert len(backend) == 2 and backend.get('Article:2', 'a') is None  # Least recently used
+
+    def test_disk_backend(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.check_backend(DiskBackend(directory))
+
+            backend = DiskBackend(directory, max_entries=10)
+            for index in range(11):
+                backend.set(f'Article:{index}', 'a', b'value', ttl=60)
+            assert backend._count == 9
+            assert DiskBackend(directory).get('Article:10', 'a') == b'value'  # Shared through the directory
+
+    def test_disk_backend_counts_entries_not_writes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            backend = DiskBackend(directory, max_entries=10)
+            for index in range(10):
+                backend.set(f'Article:{index}', 'a', b'value', ttl=60)
+            for _ in range(20):
+                backend.set('Article:0', 'a', b'updated', ttl=60)
+            assert backend._count == 10 and backend.get('Article:9', 'a') == b'value'  # Nothing evicted
+
+            backend.invalidate('Article:1')
+            assert backend._count == 9
+
+    def test_redis_backend(self):
+        self.check_backend(RedisBackend(FakeRedis()))
@@ -0,0 +1,216 @@
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from unittest import TestCase
+
+import requests
+
+from intercom_python_sdk import IntercomPool
+from intercom_python_sdk.core.errors import IntercomErrorList, IntercomErrorObject
+from intercom_python_sdk.core.metrics import current_attempt
+from intercom_python_sdk.core.scheduler import FairScheduler, SchedulingAdapter
+
+from tests.stand_in import StandIn, StandInAdapter
+from tests.test_pool import AuthRecordingAdapter
+
+
+def rate_limit_error(reset: float) -> IntercomErrorList:
+    error = IntercomErrorList(type='error.list', errors=[
+        IntercomErrorObject(code='rate_limit_exceeded', message='Rate limited')])
+    error.response = requests.Response()
+    error.response.status_code = 429
+    error.response.headers['X-RateLimit-Reset'] = str(int(reset))
+    return error
+
+
+class ConcurrencyRecordingAdapter(StandInAdapter):
+    """ Serves requests from a stand-in, slowly, recording the peak number of concurrent requests per token. """
+
+    def __init__(self, stand_in=None):
+        super().__init__(stand_in)
+        self.sending = {}
+        self.peaks = {}
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        token = request.headers.get('Authorization')
+        with self.lock:
+            self.sending[token] = self.sending.get(token, 0) + 1
+            self.peaks[token] = max(self.peaks.get(token, 0), self.sending[token])
+        try:
+            time.sleep(0.005)
+            return super().send(request, **kwargs)
+        finally:
+            with self.lock:
+                self.sending[token] -= 1
+
+
+class TestFairScheduler(TestCase):
+
+    def setUp(self):
+        self.order = []
+        self.lock = threading.Lock()
+
+    def record(self, tenant, delay=0.0):
+        time.sleep(delay)
+        with self.lock:
+            self.order.append(tenant)
+        return tenant
+
+    def test_quiet_tenant_is_not_starved(self):
+        gate = threading.Event()
+        with FairScheduler(max_workers=1) as scheduler:
+            scheduler.submit('noisy', gate.wait)
+            noisy = [scheduler.submit('noisy', self.record, 'noisy') for _ in range(50)]
+            quiet = [scheduler.submit('quiet', self.record, 'quiet') for _ in range(3)]
+            gate.set()
+            assert [future.result(timeout=5) for future in quiet] == ['quiet'] * 3
+            assert all(future.result(timeout=5) == 'noisy' for future in noisy)
+
+        # Served alternately while both have queued calls
+        assert self.order[:6].count('quiet') == 3
+
+    def test_weights(self):
+        gate = threading.Event()
+        with FairScheduler(max_workers=1) as scheduler:
+            scheduler.configure('heavy', weight=3)
+            scheduler.submit('light', gate.wait)
+            for _ in range(6):
+                scheduler.submit('heavy', self.record, 'heavy')
+                scheduler.submit('light', self.record, 'light')
+            gate.set()
+
+        assert self.order[:8] == ['heavy'] * 3 + ['light'] + ['heavy'] * 3 + ['light']
+
+    def test_concurrency_cap(self):
+        running, peak = [0], [0]
+
+        def call():
+            with self.lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with self.lock:
+                running[0] -= 1
+
+        with FairScheduler(max_workers=4, max_concurrency=2) as scheduler:
+            futures = [scheduler.submit('tenant', call) for _ in range(10)]
+            other = scheduler.submit('other', self.record, 'other')
+            assert other.result(timeout=5) == 'other'
+            [future.result(timeout=5) for future in futures]
+
+        assert peak[0] == 2
+        assert scheduler.stats()['tenant'].completed == 10
+
+    def test_rate_budget(self):
+        def call():
+            with scheduler.request('tenant'):
+                return self.record('tenant')
+
+        started = time.perf_counter()
+        with FairScheduler(max_workers=2, rate=50, burst=1) as scheduler:
+            futures = [scheduler.submit('tenant', call) for _ in range(6)]
+            [future.result(timeout=5) for future in futures]
+        assert time.perf_counter() - started >= 0.09  # 5 requests after the first, at 50 per second
+        assert scheduler.stats()['tenant'].sent == 6
+
+    def test_rate_limited_calls_pause_their_tenant(self):
+        attempts = []
+
+        def limited():
+            attempts.append(current_attempt.get())
+            if len(attempts) == 1:
+                raise rate_limit_error(time.time() + 1)
+            return 'done'
+
+        with FairScheduler(max_workers=1) as scheduler:
+            future = scheduler.submit('limited', limited)
+            others = [scheduler.submit('other', self.record, 'other') for _ in range(3)]
+            assert [other.result(timeout=5) for other in others] == ['other'] * 3
+            assert not future.done()  # Paused until the rate limit resets
+            assert future.result(timeout=5) == 'done'
+
+        assert attempts == [1, 2]
+        assert scheduler.stats()['limited'].rate_limited == 1
+
+    def test_errors_are_reported_on_the_future(self):
+        with FairScheduler(max_workers=1) as scheduler:
+            future = scheduler.submit('tenant', int, 'not a number')
+            with self.assertRaises(ValueError):
+                future.result(timeout=5)
+        with self.assertRaises(RuntimeError):
+            scheduler.submit('tenant', int, '1')
+
+    def test_pool_integration(self):
+        with IntercomPool(scheduler=FairScheduler(max_workers=2)) as pool:
+            adapter = AuthRecordingAdapter()
+            pool.config.session.mount('https://', adapter)
+
+            futures = [pool.client(token).submit(pool.client(token).articles.get_by_id, 1)
+                       for token in ('token_a', 'token_b')]
+            assert [future.result(timeout=5).id for future in futures] == [1, 1]
+            assert sorted(token for _, token in adapter.authorizations) == ['Bearer token_a', 'Bearer token_b']
+
+            pool.evict('token_a')
+            assert 'token_a' not in pool.scheduler.stats()
+
+    def test_pool_limits_hold_for_each_request(self):
+        scheduler = FairScheduler(max_workers=4, max_concurrency=2, rate=1000, burst=100)
+        with IntercomPool(scheduler=scheduler) as pool:
+            adapter = ConcurrencyRecordingAdapter(StandIn(totals={'article': 120}))
+            scheduling = pool.config.session.get_adapter('https://')
+            assert isinstance(scheduling, SchedulingAdapter)
+            scheduling.adapter = adapter
+
+            noisy = pool.client('token_noisy')
+            pages = noisy.submit(lambda: list(noisy.articles.iter_all(per_page=5, max_workers=8)))
+            direct = ThreadPoolExecutor(max_workers=4)
+            listed = [direct.submit(noisy.articles.list_all, per_page=10) for _ in range(2)]
+            others = [pool.client(token).submit(pool.client(token).articles.get_by_id, index + 1)
+                      for index, token in enumerate(('token_a', 'token_b', 'token_c') * 3)]
+
+            assert [other.result(timeout=10).id for other in others] == [index + 1 for index in range(9)]
+            assert len(pages.result(timeout=10)) == 120
+            assert all(len(future.result(timeout=10).data) == 120 for future in listed)
+            direct.shutdown()
+
+        # Up to 8 pages of iter_all and 2 list_all calls at once, but 2 requests of the workspace at a time
+        assert adapter.peaks['Bearer token_noisy'] == 2
+        assert scheduler.stats()['token_noisy'].sent == adapter.stand_in.requests['GET /articles']
+
+    def test_rate_limited_requests_pause_their_tenant(self):
+        stand_in = StandIn(totals={'article': 5}, rate_limit=1)
+        with IntercomPool(scheduler=FairScheduler()) as pool:
+            pool.config.session.get_adapter('https://').adapter = StandInAdapter(stand_in)
+            client = pool.client('token')
+            client.articles.get_by_id(1)
+            with self.assertRaises(IntercomErrorList):
+                client.articles.get_by_id(2)  # Made directly, so not retried
+            assert pool.scheduler._tenants['token'].paused_until > time.time()
+
+    def test_shutdown_cancels_rate_limited_calls(self):
+        def limited():
+            raise rate_limit_error(time.time() + 5)
+
+        scheduler = FairScheduler(max_workers=1)
+        future = scheduler.submit('limited', limited)
+        deadline = time.time() + 5
+        while not scheduler.stats()['limited'].rate_limited and time.time() < deadline:
+            time.sleep(0.001)
+
+        scheduler.shutdown(wait=False, cancel_futures=True)
+        with self.assertRaises(CancelledError):
+            future.result(timeout=1)
+
+    def test_busy_tenants_are_forgotten_once_idle(self):
+        gate = threading.Event()
+        with FairScheduler(max_workers=1) as scheduler:
+            future = scheduler.submit('evicted', gate.wait)
+            scheduler.submit('evicted', self.record, 'evicted')
+            scheduler.forget('evicted')
+            assert 'evicted' in scheduler.stats()  # Still busy
+
+            gate.set()
+            future.result(timeout=5)
+            scheduler.submit('other', self.record, 'other').result(timeout=5)
+        assert 'evicted' not in scheduler.stats()
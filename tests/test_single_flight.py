@@ -0,0 +1,104 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+import requests
+from uplink.auth import BearerToken
+
+from intercom_python_sdk import Intercom, Configuration
+from intercom_python_sdk.core.single_flight import SingleFlightAdapter
+from intercom_python_sdk.models import Article
+
+from tests.stand_in import StandIn, StandInAdapter
+
+
+class GatedAdapter(StandInAdapter):
+    """ Serves requests from a stand-in once the gate is open, counting the requests sent. """
+
+    def __init__(self, stand_in=None):
+        super().__init__(stand_in)
+        self.gate = threading.Event()
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        self.gate.wait(timeout=5)
+        return super().send(request, **kwargs)
+
+
+class TestSingleFlight(TestCase):
+
+    def setUp(self):
+        config = Configuration(auth=BearerToken('TEST'), single_flight=True)
+        self.single_flight = config.session.get_adapter('https://api.intercom.io')
+        self.transport = self.single_flight.adapter = GatedAdapter(StandIn(totals={'article': 5}))
+        self.intercom = Intercom(config=config)
+
+    def concurrently(self, *calls):
+        """ Start the calls, wait for all but the first to be waiting on it, then let the first through. """
+        with ThreadPoolExecutor(len(calls)) as executor:
+            futures = [executor.submit(call) for call in calls]
+            deadline = time.time() + 5
+            while sum(flight.waiters for flight in list(self.single_flight._flights.values())) \
+                    < len(calls) - len(self.single_flight._flights) and time.time() < deadline:
+                time.sleep(0.001)
+            self.transport.gate.set()
+            return [future.result(timeout=5) for future in futures]
+
+    def test_disabled_by_default(self):
+        config = Configuration(auth=BearerToken('TEST'))
+        assert not config.single_flight
+        assert not isinstance(config.session.get_adapter('https://api.intercom.io'), SingleFlightAdapter)
+
+    def test_identical_reads_are_sent_once(self):
+        articles = self.concurrently(*[lambda: self.intercom.articles.get_by_id(1)] * 4)
+
+        assert len(self.transport.sent) == 1
+        assert self.single_flight.coalesced == 3
+        assert all(isinstance(article, Article) and article.id == 1 for article in articles)
+        assert len({id(article) for article in articles}) == 4  # Each caller gets its own model
+
+    def test_different_reads_are_not_coalesced(self):
+        session = self.intercom.articles.api_object.config.session
+        self.concurrently(lambda: self.intercom.articles.get_by_id(1),
+                          lambda: self.intercom.articles.get_by_id(2),
+                          lambda: session.get('https://api.intercom.io/articles', params={'page': 1}),
+                          lambda: session.get('https://api.intercom.io/articles', params={'page': 2}))
+
+        assert len(self.transport.sent) == 4
+        assert self.single_flight.coalesced == 0
+
+    def test_sequential_reads_are_sent_again(self):
+        self.transport.gate.set()
+        self.intercom.articles.get_by_id(1)
+        self.intercom.articles.get_by_id(1)
+        assert len(self.transport.sent) == 2
+
+    def test_writes_are_not_coalesced(self):
+        self.transport.gate.set()
+        session = self.intercom.articles.api_object.config.session
+        for _ in range(2):
+            session.post('https://api.intercom.io/articles', json={'title': 'New', 'author_id': 1})
+        assert len(self.transport.sent) == 2
+
+    def test_errors_are_shared(self):
+        class FailingAdapter(GatedAdapter):
+            def send(self, request, **kwargs):
+                self.sent.append(request)
+                self.gate.wait(timeout=5)
+                raise requests.ConnectionError('Connection refused')
+
+        self.transport = self.single_flight.adapter = FailingAdapter()
+        results = self.concurrently(*[lambda: self.capture(self.intercom.admins.me)] * 3)
+
+        assert len(self.transport.sent) == 1
+        assert all(isinstance(result, requests.ConnectionError) for result in results)
+        assert not self.single_flight._flights
+
+    @staticmethod
+    def capture(call):
+        try:
+            return call()
+        except Exception as error:
+            return error
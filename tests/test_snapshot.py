@@ -0,0 +1,93 @@
+import os
+import tempfile
+import time
+from unittest import TestCase, skipIf
+
+from intercom_python_sdk import Snapshot
+from intercom_python_sdk.models import AdminList, CollectionList, DataAttributeList, SectionList
+from intercom_python_sdk.schemas import CollectionListSchema
+from intercom_python_sdk.snapshot import REFERENCE_LISTS, decode, encode, msgpack
+
+from tests.stand_in import StandIn
+from tests.test_stand_in import stand_in_client
+
+
+class TestSnapshot(TestCase):
+
+    def setUp(self):
+        self.stand_in = StandIn(totals={'collection': 60, 'section': 10})
+        self.intercom = stand_in_client(self.stand_in)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'reference.snapshot')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def downloads(self) -> int:
+        return sum(count for route, count in self.stand_in.requests.items() if route.startswith('GET'))
+
+    def test_round_trip(self):
+        captured = Snapshot.capture(self.intercom)
+        assert self.stand_in.requests['GET /help_center/collections'] == 2  # Every page
+        captured.save(self.path)
+
+        loaded = Snapshot.load(self.path, self.intercom)
+        assert isinstance(loaded.admins, AdminList) and isinstance(loaded.data_attributes, DataAttributeList)
+        assert isinstance(loaded.collections, CollectionList) and isinstance(loaded.sections, SectionList)
+        assert len(loaded.collections) == 60 and len(loaded.teams['teams']) == 4
+        assert CollectionListSchema().dump(loaded.collections) == CollectionListSchema().dump(captured.collections)
+        assert loaded.created_at == captured.created_at
+
+        # Models use the API clients of the client the snapshot was loaded with
+        assert loaded.admins[0].api_client is self.intercom.admins.api_object
+
+    def test_lists_are_loaded_on_first_access(self):
+        Snapshot.capture(self.intercom).save(self.path)
+        loaded = Snapshot.load(self.path)
+        assert loaded._models == {}
+        assert loaded.sections is loaded.sections
+        assert set(loaded._models) == {'sections'}
+
+    def test_warm_start_without_a_file_downloads(self):
+        snapshot = Snapshot.warm_start(self.intercom, self.path)
+        assert self.downloads() > 0 and os.path.exists(self.path)
+        assert snapshot.refreshing is None
+
+    def test_warm_start_loads_then_refreshes_in_the_background(self):
+        Snapshot.capture(self.intercom).save(self.path)
+        downloads = self.downloads()
+
+        snapshot = Snapshot.warm_start(self.intercom, self.path, max_age=3600)
+        assert snapshot.refreshing is None and self.downloads() == downloads  # Fresh enough
+
+        time.sleep(0.01)
+        snapshot = Snapshot.warm_start(self.intercom, self.path, max_age=0)
+        admins = snapshot.admins  # Served while refreshing
+        assert snapshot.refreshing.result(timeout=5) is snapshot
+        assert self.downloads() == 2 * downloads
+        assert snapshot.admins is not admins and snapshot.age < 1
+        assert Snapshot.load(self.path).created_at == snapshot.created_at
+
+    def test_invalid_files(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a snapshot')
+        with self.assertRaises(ValueError):
+            Snapshot.load(self.path)
+
+        snapshot = Snapshot.warm_start(self.intercom, self.path)  # Replaced
+        assert Snapshot.load(self.path).created_at == snapshot.created_at
+
+        content = encode({'created_at': 0, 'lists': {}}, 'json')
+        with self.assertRaises(ValueError):
+            decode(content[:-4])
+
+    def test_encodings(self):
+        document = {'created_at': 1.5, 'lists': {name: {'data': [1, 'a', None]} for name in REFERENCE_LISTS}}
+        assert decode(encode(document, 'json')) == document
+        with self.assertRaises(ValueError):
+            encode(document, 'pickle')
+
+    @skipIf(msgpack is None, "msgpack is not installed")
+    def test_msgpack_encoding(self):
+        document = {'created_at': 1.5, 'lists': {'admins': {'admins': [{'id': '1'}]}}}
+        assert decode(encode(document, 'msgpack')) == document
@@ -0,0 +1,134 @@
+from unittest import TestCase
+
+import requests
+from uplink.auth import BearerToken
+
+from intercom_python_sdk import Intercom
+from intercom_python_sdk.core.bulk import run_bulk
+from intercom_python_sdk.core.configuration import Configuration
+from intercom_python_sdk.core.errors import IntercomErrorList
+from intercom_python_sdk.models import Article
+
+from tests.stand_in import StandIn, StandInAdapter, StandInServer
+
+
+def stand_in_client(stand_in, **kwargs):
+    config = Configuration(auth=BearerToken('TEST'), **kwargs)
+    config.session.mount('https://', StandInAdapter(stand_in))
+    return Intercom(config=config)
+
+
+class TestStandIn(TestCase):
+
+    def setUp(self):
+        self.stand_in = StandIn(totals={'article': 45, 'conversation': 25})
+        self.intercom = stand_in_client(self.stand_in)
+
+    def test_admins_and_teams(self):
+        assert self.intercom.admins.me().id == '1'
+        assert len(self.intercom.admins.list_admins().admins) == 5
+        assert self.intercom.admins.set_away_by_id(2, away=True).away_mode_enabled is True
+        assert len(self.intercom.teams.get_all_teams()['teams']) == 4
+        assert self.intercom.teams.get_team_by_id(2)['id'] == 2
+
+    def test_articles(self):
+        articles = list(self.intercom.articles.iter_all(per_page=10, max_workers=3))
+        assert [article.id for article in articles] == list(range(1, 46))
+        assert articles[0].updated_at > articles[-1].updated_at
+
+        article = self.intercom.articles.get_by_id(7)
+        article.title = 'Updated'
+        article.update()
+        first = self.intercom.articles.list_all(page=1, per_page=5).data[0]
+        assert first.id == 7 and first.title == 'Updated'
+
+        session = self.intercom.articles.api_object.config.session
+        assert session.delete('https://api.intercom.io/articles/7').json()['deleted'] is True
+        with self.assertRaises(IntercomErrorList):
+            self.intercom.articles.get_by_id(7)
+
+    def test_objects_are_looked_up_without_scanning(self):
+        stand_in = StandIn(totals={'article': 10_000})
+        assert stand_in.get('article', 9_999)['id'] == 9_999 and stand_in.get('article', 10_001) is None
+        assert 'article' not in stand_in._ids  # Never listed
+
+        created = stand_in.create('article', {'title': 'New'})
+        stand_in.delete('article', 500)
+        stand_in.delete('article', created['id'])
+        assert stand_in.get('article', 500) is None and stand_in.get('article', created['id']) is None
+        assert len(stand_in.ids('article')) == 9_999
+
+    def test_conversations(self):
+        conversations = list(self.intercom.conversation.iter_all(per_page=10))
+        assert len(conversations) == 25 and len({c.id for c in conversations}) == 25
+
+        query = {'field': 'open', 'operator': '=', 'value': True}
+        assert len(list(self.intercom.conversation.search(query, per_page=20))) == 25
+        assert self.intercom.conversation.get_by_id('3').id == '3'
+
+    def test_data_apis(self):
+        assert len(self.intercom.data_attributes.list_all().data) == 20
+        assert len(self.intercom.data_events.list_all(user_id='user').events) == 30
+
+        job = self.intercom.data_export.export(created_before=2, created_after=1)
+        assert self.intercom.data_export.get(job.job_identifier).status == 'completed'
+        assert self.intercom.data_export.download(job.job_identifier).content
+
+    def test_help_center(self):
+        assert len(self.intercom.help_center.list_all_collections(per_page=4).data) == 15
+        assert len(self.intercom.help_center.list_all_sections(per_page=7).data) == 40
+
+    def test_payload_size(self):
+        intercom = stand_in_client(StandIn(payload_size=5000))
+        assert len(intercom.articles.get_by_id(1).body) == 5000
+        assert len(intercom.help_center.get_collection_by_id(1).description) == 5000
+
+    def test_rate_limit(self):
+        intercom = stand_in_client(StandIn(rate_limit=2))
+        session = intercom.articles.api_object.config.session
+
+        response = session.get('https://api.intercom.io/articles/1')
+        assert response.headers['X-RateLimit-Limit'] == '2'
+        assert response.headers['X-RateLimit-Remaining'] == '1'
+
+        intercom.articles.get_by_id(1)
+        with self.assertRaises(IntercomErrorList) as context:
+            intercom.articles.get_by_id(1)
+        assert context.exception.errors[0].code == 'rate_limit_exceeded'
+        assert context.exception.response.headers['X-RateLimit-Remaining'] == '0'
+
+    def test_injected_errors_are_retried_by_run_bulk(self):
+        stand_in = StandIn(errors={429: 0.3}, seed=1)
+        intercom = stand_in_client(stand_in)
+        # One worker, so that the seeded errors fall on the same calls in every run
+        results = list(run_bulk(intercom.articles.get_by_id, [(i, (i,)) for i in range(1, 21)],
+                                max_workers=1, backoff=0.001))
+
+        assert all(result.ok for result in results)
+        assert stand_in.statuses[429] > 0
+        assert stand_in.statuses[200] == 20
+
+        stand_in.errors = {503: 1.0}
+        with self.assertRaises(IntercomErrorList) as context:
+            intercom.articles.get_by_id(1)
+        assert context.exception.response.status_code == 503
+
+    def test_etag(self):
+        session = self.intercom.articles.api_object.config.session
+        response = session.get('https://api.intercom.io/articles/1')
+        revalidated = session.get('https://api.intercom.io/articles/1',
+                                  headers={'If-None-Match': response.headers['ETag']})
+        assert revalidated.status_code == 304
+
+    def test_server(self):
+        with StandInServer(self.stand_in) as server:
+            config = Configuration(auth=BearerToken('TEST'), base_url=server.base_url)
+            intercom = Intercom(config=config)
+            assert isinstance(intercom.articles.get_by_id(1), Article)
+            assert len(list(intercom.articles.iter_all(per_page=20))) == 45
+            with self.assertRaises(IntercomErrorList):
+                intercom.articles.get_by_id(1000)
+
+        assert self.stand_in.requests['GET /articles/{id}'] == 2
+        with self.assertRaises(requests.ConnectionError):
+            requests.get(server.base_url + '/articles/1', timeout=1)
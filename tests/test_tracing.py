@@ -0,0 +1,158 @@
+import threading
+import unittest
+from contextlib import contextmanager
+from contextvars import ContextVar
+from unittest import TestCase
+
+from uplink.auth import BearerToken
+
+from intercom_python_sdk import Intercom
+from intercom_python_sdk.core import tracing
+from intercom_python_sdk.core.configuration import Configuration
+from intercom_python_sdk.core.errors import IntercomErrorList
+from intercom_python_sdk.core.metrics import Metrics
+from intercom_python_sdk.core.tracing import Tracing
+
+from tests.test_help_center import PagedAdapter
+from tests.test_metrics import ArticleAdapter
+
+_current_span = ContextVar('current_span', default=None)
+
+
+class RecordedSpan:
+    def __init__(self, name, parent, attributes):
+        self.name = name
+        self.parent = parent
+        self.attributes = dict(attributes or {})
+        self.exceptions = []
+        self.ended = False
+
+    def set_attribute(self, name, value):
+        self.attributes[name] = value
+
+    def update_name(self, name):
+        self.name = name
+
+    def record_exception(self, exception):
+        self.exceptions.append(exception)
+
+    def set_status(self, status):
+        pass
+
+    def end(self):
+        self.ended = True
+
+
+class RecordingTracer:
+    """ Implements the parts of the OpenTelemetry `Tracer` interface used by `Tracing`. """
+
+    def __init__(self):
+        self.spans = []
+        self.lock = threading.Lock()
+
+    def start_span(self, name, attributes=None):
+        span = RecordedSpan(name, _current_span.get(), attributes)
+        with self.lock:
+            self.spans.append(span)
+        return span
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        span = self.start_span(name, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.record_exception(error)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    @contextmanager
+    def use_span(self, span):
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            _current_span.reset(token)
+
+    def named(self, name):
+        return [span for span in self.spans if span.name == name]
+
+
+class TestTracing(TestCase):
+
+    def setUp(self):
+        self.tracer = RecordingTracer()
+        config = Configuration(auth=BearerToken('TEST'), tracing=Tracing(tracer=self.tracer), metrics=Metrics())
+        config.session.mount('https://', ArticleAdapter())
+        self.intercom = Intercom(config=config)
+
+    def test_call_spans(self):
+        self.intercom.articles.get_by_id(1)
+
+        call, = self.tracer.named('ArticlesAPI.get_by_id')
+        http, = self.tracer.named('GET /articles/{id}')
+        deserialize, = self.tracer.named('intercom.deserialize')
+        inject, = self.tracer.named('intercom.inject')
+
+        assert call.parent is None and call.attributes['intercom.method'] == 'get_by_id'
+        assert http.parent is call and deserialize.parent is call and inject.parent is call
+        assert http.attributes['http.response.status_code'] == 200
+        assert http.attributes['url.template'] == '/articles/{id}'
+        assert http.attributes['http.response.body.size'] > 0
+        assert deserialize.attributes['intercom.schema'] == 'ArticleSchema'
+        assert all(span.ended for span in self.tracer.spans)
+
+    def test_error_spans(self):
+        with self.assertRaises(IntercomErrorList):
+            self.intercom.articles.get_by_id(404)
+
+        call, = self.tracer.named('ArticlesAPI.get_by_id')
+        http, = self.tracer.named('GET /articles/{id}')
+        assert call.attributes['intercom.error_codes'] == ['not_found']
+        assert isinstance(call.exceptions[0], IntercomErrorList)
+        assert http.attributes['http.response.status_code'] == 404 and http.ended
+        assert not self.tracer.named('intercom.deserialize')
+
+    def test_connection_error_span(self):
+        with self.assertRaises(Exception):
+            self.intercom.articles.get_by_id(500)
+
+        http, = self.tracer.named('GET /articles/{id}')
+        assert http.exceptions and http.ended
+
+    def test_context_propagates_to_page_workers(self):
+        self.intercom.help_center.api_object.config.session.mount('https://', PagedAdapter(total=45))
+        self.intercom.help_center.list_all_sections(per_page=10, max_workers=3)
+
+        call, = self.tracer.named('HelpCenterAPI.list_all_sections')
+        pages = self.tracer.named('GET /help_center/sections')
+        assert len(pages) == 5 and all(span.parent is call for span in pages)
+
+    def test_generator_requests_are_traced_under_the_call(self):
+        self.intercom.help_center.api_object.config.session.mount('https://', PagedAdapter(total=45))
+        sections = self.intercom.help_center.iter_sections(per_page=10, max_workers=1)
+
+        call, = self.tracer.named('HelpCenterAPI.iter_sections')
+        assert not call.ended and not self.tracer.named('GET /help_center/sections')  # Nothing sent yet
+
+        assert len(list(sections)) == 45
+        pages = self.tracer.named('GET /help_center/sections')
+        assert len(pages) == 5 and all(span.parent is call for span in pages)
+        assert call.ended
+
+    def test_closed_generator_ends_the_call_span(self):
+        self.intercom.help_center.api_object.config.session.mount('https://', PagedAdapter(total=45))
+        sections = self.intercom.help_center.iter_sections(per_page=10, max_workers=1)
+        next(sections)
+        sections.close()
+
+        call, = self.tracer.named('HelpCenterAPI.iter_sections')
+        assert call.ended and all(span.parent is call for span in self.tracer.named('GET /help_center/sections'))
+
+    @unittest.skipIf(tracing.trace is not None, 'opentelemetry is installed')
+    def test_requires_opentelemetry(self):
+        with self.assertRaises(ImportError):
+            Tracing()